@@ -0,0 +1,60 @@
+""" Measure response validation and conversion throughput without network I/O.
+
+Usage:
+    PYTHONPATH=. python benchmarks/conversion_throughput.py [iterations]
+"""
+import sys
+import time
+
+from circleci_api_python.client import CircleCI
+from circleci_api_python.codec import CODECS, get_codec
+from circleci_api_python.transport import InMemoryTransport
+
+PIPELINE = {
+    "id": "5034460f-c7c4-4c43-9457-de07e2029e7b",
+    "number": 25,
+    "state": "created",
+    "created_at": "2019-08-24T14:15:22Z",
+    "trigger": {"type": "webhook", "actor": {"login": "user", "avatar_url": None}},
+    "vcs": {"branch": "main", "revision": "f454a02", "provider_name": "GitHub"},
+}
+
+
+def main(iterations: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        iterations (int): number of calls per endpoint
+    """
+    transport = InMemoryTransport()
+    transport.add_response("GET", "/api/v2/pipeline/abc", PIPELINE)
+    transport.add_response("GET", "/api/v2/project/gh/org/repo/pipeline",
+                           {"items": [PIPELINE] * 20, "next_page_token": None})
+    for codec in (name for name, (_, module) in CODECS.items() if module is not None):
+        client = CircleCI(token="dummy_token", logging=False, transport=transport,
+                          json_codec=get_codec(codec))
+        measure(client, codec, iterations)
+
+
+def measure(client: CircleCI, codec: str, iterations: int) -> None:
+    """
+    Measure the endpoints with one client.
+
+    Args:
+        client (CircleCI): the client
+        codec (str): name of the JSON codec of the client
+        iterations (int): number of calls per endpoint
+    """
+    for name, call in (("single pipeline", lambda: client.get_pipeline_by_id("abc")),
+                       ("pipeline page", lambda: client.get_all_pipelines_for_project(
+                           "gh/org/repo"))):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        elapsed = time.perf_counter() - started
+        print(f"{codec:>8} {name:>16}: {iterations / elapsed:10.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,144 @@
+""" Compare HTTP/1.1 and HTTP/2 fan-out against a local test server.
+
+A local server speaking both HTTP/1.1 and cleartext HTTP/2 (h2c) answers every request after a
+fixed delay. The same `get_workflow_jobs` fan-out is run over the default pooled HTTP/1.1
+transport and over `HttpxTransport` with HTTP/2, reporting throughput and the number of TCP
+connections the server accepted.
+
+Usage:
+    PYTHONPATH=. python benchmarks/http2_fanout.py [requests] [threads]
+
+Requires `pip install circleci-api-python[http2]`.
+"""
+import asyncio
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h2.config
+import h2.connection
+import h2.events
+
+from circleci_api_python.client import CircleCI
+from circleci_api_python.transport import HttpxTransport, RequestsTransport
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+LATENCY = 0.05
+BODY = json.dumps({"items": [{"id": "job", "job_number": 1}], "next_page_token": None}).encode()
+
+
+class ServerProtocol(asyncio.Protocol):
+    """ Serves HTTP/1.1 or h2c depending on the connection preface. """
+
+    connections = 0
+
+    def __init__(self):
+        self.transport = None
+        self.buffer = b""
+        self.h2 = None
+        self.http1 = False
+
+    def connection_made(self, transport):
+        ServerProtocol.connections += 1
+        self.transport = transport
+
+    def data_received(self, data):
+        if self.h2 is not None:
+            self._h2_received(data)
+            return
+        self.buffer += data
+        if not self.http1:
+            if len(self.buffer) < len(H2_PREFACE) and H2_PREFACE.startswith(self.buffer):
+                return
+            if self.buffer.startswith(H2_PREFACE):
+                self.h2 = h2.connection.H2Connection(
+                    h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+                self.h2.initiate_connection()
+                data, self.buffer = self.buffer, b""
+                self._h2_received(data)
+                return
+            self.http1 = True
+        while b"\r\n\r\n" in self.buffer:
+            _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+            asyncio.get_running_loop().call_later(LATENCY, self._http1_respond)
+
+    def _http1_respond(self):
+        if not self.transport.is_closing():
+            self.transport.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                                 b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n"
+                                 + BODY)
+
+    def _h2_received(self, data):
+        for event in self.h2.receive_data(data):
+            if isinstance(event, h2.events.StreamEnded):
+                asyncio.get_running_loop().call_later(LATENCY, self._h2_respond,
+                                                      event.stream_id)
+        self.transport.write(self.h2.data_to_send())
+
+    def _h2_respond(self, stream_id):
+        if self.transport.is_closing():
+            return
+        self.h2.send_headers(stream_id, [(":status", "200"),
+                                         ("content-type", "application/json"),
+                                         ("content-length", str(len(BODY)))])
+        self.h2.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+
+def start_server() -> int:
+    """
+    Start the test server in a background thread.
+
+    Returns:
+        int: the port the server listens on
+    """
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(ServerProtocol, "127.0.0.1", 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def run(name: str, client: CircleCI, requests: int, threads: int) -> None:
+    """
+    Fan out `get_workflow_jobs` and report throughput and connection count.
+
+    Args:
+        name (str): label of the run
+        client (CircleCI): client to use
+        requests (int): number of requests
+        threads (int): number of concurrent threads
+    """
+    before = ServerProtocol.connections
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(client.get_workflow_jobs, (f"workflow-{i}" for i in range(requests))))
+    elapsed = time.perf_counter() - started
+    client.close()
+    print(f"{name:>8}: {requests / elapsed:8.0f} req/s, "
+          f"{ServerProtocol.connections - before:4d} connections")
+
+
+def main(requests: int, threads: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        requests (int): number of requests per run
+        threads (int): number of concurrent threads
+    """
+    class LocalCircleCI(CircleCI):
+        """ Client of the local server. """
+        BASE_URL = f"http://127.0.0.1:{start_server()}"
+
+    for name, transport in (("HTTP/1.1", RequestsTransport(pool_maxsize=threads)),
+                            ("HTTP/2", HttpxTransport(pool_maxsize=threads,
+                                                      prior_knowledge=True))):
+        client = LocalCircleCI(token="dummy_token", logging=False, transport=transport)
+        run(name, client, requests, threads)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 64)
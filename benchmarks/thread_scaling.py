@@ -0,0 +1,126 @@
+""" Measure how throughput of one shared client scales with the number of threads.
+
+A local keep-alive HTTP/1.1 server answers every request after a fixed delay. For 1 to 64
+threads, each thread issues the same number of `get_pipeline_by_id` calls through a single
+shared `CircleCI` client, once with the default shared session and once with per-thread
+sessions, reporting throughput and the number of TCP connections the server accepted.
+
+Usage:
+    PYTHONPATH=. python benchmarks/thread_scaling.py [requests-per-thread] [latency-ms]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from circleci_api_python.client import CircleCI
+from circleci_api_python.transport import RequestsTransport
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+BODY = json.dumps({"id": "pipeline", "state": "created", "number": 1}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    """ Answers every GET with a fixed body after the configured latency. """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid the Nagle / delayed ACK stall.
+    disable_nagle_algorithm = True
+    latency = 0.01
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with Handler.lock:
+            Handler.connections += 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """ Serve a pipeline. """
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def start_server() -> str:
+    """
+    Start the test server in a background thread.
+
+    Returns:
+        str: the base URL of the server
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def run(client: CircleCI, threads: int, requests: int) -> tuple:
+    """
+    Issue requests from several threads through one client.
+
+    Args:
+        client (CircleCI): the shared client
+        threads (int): number of threads
+        requests (int): number of requests per thread
+
+    Returns:
+        tuple: requests per second and connections opened
+    """
+    before = Handler.connections
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        barrier.wait()
+        for number in range(requests):
+            client.get_pipeline_by_id(f"{index}-{number}")
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return threads * requests / elapsed, Handler.connections - before
+
+
+def main(requests: int, latency: float) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        requests (int): number of requests per thread
+        latency (float): server latency in seconds
+    """
+    Handler.latency = latency
+    class LocalCircleCI(CircleCI):
+        """ Client of the local server. """
+        BASE_URL = start_server()
+
+    print(f"{'threads':>7} {'shared req/s':>13} {'conns':>6} "
+          f"{'per-thread req/s':>17} {'conns':>6}")
+    for threads in THREAD_COUNTS:
+        row = [f"{threads:>7}"]
+        for per_thread_sessions in (False, True):
+            transport = RequestsTransport(pool_maxsize=max(THREAD_COUNTS),
+                                          per_thread_sessions=per_thread_sessions)
+            client = LocalCircleCI(token="dummy_token", logging=False, transport=transport)
+            throughput, connections = run(client, threads, requests)
+            client.close()
+            width = 17 if per_thread_sessions else 13
+            row.append(f"{throughput:>{width}.0f} {connections:>6}")
+        print(" ".join(row))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+         float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.01)
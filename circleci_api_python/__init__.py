@@ -9,11 +9,35 @@ try:
 except (ImportError, Exception):
     __version__ = "unknown"
 
+from circleci_api_python.async_client import AsyncCircleCI
+from circleci_api_python.breaker import CircuitBreakers
+from circleci_api_python.concurrency import AdaptiveConcurrencyLimiter
 from circleci_api_python.client import CircleCI
-from circleci_api_python.exceptions import CircleCIError
+from circleci_api_python.codec import JSONCodec
+from circleci_api_python.deadline import time_budget
+from circleci_api_python.exceptions import (CircleCIError, CircuitOpenError,
+                                            DeadlineExceededError)
+from circleci_api_python.hedging import HedgePolicy
+from circleci_api_python.latency import AdaptiveTimeouts
+from circleci_api_python.ratelimit import RateLimiter, SharedRateLimiter
+from circleci_api_python.retry import RetryPolicy
+from circleci_api_python.scheduler import PriorityScheduler
 
 __all__ = (
     "__version__",
+    "AdaptiveConcurrencyLimiter",
+    "AdaptiveTimeouts",
+    "AsyncCircleCI",
     "CircleCI",
     "CircleCIError",
+    "CircuitBreakers",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "HedgePolicy",
+    "JSONCodec",
+    "PriorityScheduler",
+    "RateLimiter",
+    "RetryPolicy",
+    "SharedRateLimiter",
+    "time_budget",
 )
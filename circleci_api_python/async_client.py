@@ -0,0 +1,607 @@
+""" Asynchronous CircleCI API client
+
+This module implements an asyncio-native variant of the CircleCI API client. Every endpoint
+method of `CircleCI` is available on `AsyncCircleCI` as a coroutine returning the same
+`CircleCIPropertyHolder` results, with all requests sharing one async connection pool.
+"""
+# pylint: disable=invalid-overridden-method
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+
+from circleci_api_python.batch import AsyncBatch, map_calls_async
+from circleci_api_python.client import CircleCI
+from circleci_api_python.concurrency import congestion_signal
+from circleci_api_python.deadline import remaining_budget, time_budget
+from circleci_api_python.endpoints import ENDPOINTS, Endpoint
+from circleci_api_python.exceptions import DeadlineExceededError
+from circleci_api_python.latency import measured_endpoint
+from circleci_api_python.reconcile import CLOCK_SKEW, is_ambiguous
+from circleci_api_python.resources import CircleCIPropertyHolder
+from circleci_api_python.scheduler import current_priority
+from circleci_api_python.singleflight import AsyncSingleFlight
+from circleci_api_python.streaming import ItemParser
+from circleci_api_python.transport import HttpxAsyncTransport
+
+
+class AsyncCircleCI(CircleCI):
+    """ Asynchronous CircleCI API client. """
+
+    def __init__(self, token: str, **kwargs):
+        """
+        Creates an AsyncCircleCI client. Accepts the same arguments as `CircleCI`.
+
+        Args:
+            token (str): CircleCI API token
+        """
+        self._warmup_connections = 0
+        self._warmup_task = None
+        super().__init__(token, **kwargs)
+
+    def _create_transport(self, pool_connections: int,
+                          pool_maxsize: int,
+                          keep_alive: bool,
+                          http2: bool) -> HttpxAsyncTransport:
+        """
+        Create the async connection pool shared by all requests of the client.
+
+        Args:
+            pool_connections (int): unused, kept for signature compatibility
+            pool_maxsize (int): maximum number of open connections
+            keep_alive (bool): keep connections open between requests
+            http2 (bool): multiplex requests over HTTP/2 connections
+
+        Returns:
+            transport: HttpxAsyncTransport
+        """
+        return HttpxAsyncTransport(pool_maxsize=pool_maxsize, keep_alive=keep_alive,
+                                   http2=http2)
+
+    def _create_single_flight(self) -> AsyncSingleFlight:
+        """
+        Create the registry coalescing identical in-flight GET requests.
+
+        Returns:
+            single_flight: AsyncSingleFlight
+        """
+        return AsyncSingleFlight()
+
+    def _start_warmup(self, connections: int) -> None:
+        """
+        Open pooled connections to the API in a background task. Outside of a running event
+        loop the task is started by `async with`.
+
+        Args:
+            connections (int): number of connections to open
+        """
+        self._warmup_connections = connections
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._ensure_warmup_started()
+
+    def _ensure_warmup_started(self) -> None:
+        """ Start the requested warm-up task unless it is already running. """
+        if self._warmup_connections and self._warmup_task is None:
+            self._warmup_task = asyncio.ensure_future(self._warmup(self._warmup_connections))
+
+    async def _warmup(self, connections: int) -> None:
+        """
+        Open pooled connections to the API, logging rather than raising failures.
+
+        Args:
+            connections (int): number of connections to open
+        """
+        try:
+            opened = await self.transport.warmup(self.BASE_URL, connections)
+        except Exception as error:
+            self.log.warning('Warming up connections to %s failed: %s', self.BASE_URL, error)
+            return
+        self.log.info('Warmed up %d of %d connections to %s.',
+                      opened, connections, self.BASE_URL)
+
+    async def wait_for_warmup(self, timeout: float or None = None) -> bool:
+        """
+        Wait until the connections requested with `warmup` are open.
+
+        Args:
+            timeout (float): maximum number of seconds to wait, None to wait until done
+
+        Returns:
+            bool: True once the warm-up finished or if none was requested
+        """
+        self._ensure_warmup_started()
+        if self._warmup_task is None:
+            return True
+        done, _ = await asyncio.wait({self._warmup_task}, timeout=timeout)
+        return bool(done)
+
+    def __enter__(self):
+        raise TypeError("AsyncCircleCI is an asynchronous context manager: use `async with`.")
+
+    async def __aenter__(self) -> AsyncCircleCI:
+        self._ensure_warmup_started()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the pooled connections held by the client.
+        """
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+        await self.transport.close()
+
+    def batch(self, concurrency: int or None = None) -> AsyncBatch:
+        """
+        Start a batch of client calls running concurrently.
+
+        Use it as an async context manager: `submit` returns a task per call, and leaving the
+        block waits for them. A failing call sets the exception of its task only.
+
+        Args:
+            concurrency (int): maximum number of calls running at once
+
+        Returns:
+            AsyncBatch: the batch
+        """
+        return AsyncBatch(self._batch_concurrency(concurrency))
+
+    def map(self, method, args_iterable, concurrency: int or None = None):
+        """
+        Await a client method once per item, yielding the outcomes as they complete.
+
+        Accepts the same arguments as `CircleCI.map`. Closing the async generator cancels the
+        calls still pending.
+
+        Args:
+            method (str or Callable): name of a client method, or a client method
+            args_iterable (Iterable): arguments of each call
+            concurrency (int): maximum number of calls running at once
+
+        Returns:
+            AsyncIterator[BatchResult]: the outcome of each call, in completion order
+        """
+        return map_calls_async(self._resolve_method(method), args_iterable,
+                               self._batch_concurrency(concurrency))
+
+    async def _request(self, method: str,  # pylint: disable=too-many-arguments
+                       endpoint: str,
+                       payload: dict or None = None,
+                       spec: Endpoint or None = None,
+                       stack: AsyncExitStack or None = None):
+        """
+        Perform a request. Concurrent requests of the same cacheable endpoint and priority made
+        without a time budget are coalesced into one, every caller receiving its response or
+        error.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            spec (Endpoint): the registered endpoint, None to apply the defaults of the method
+            stack (AsyncExitStack): the stack holding a streamed response open until it is
+                consumed, None to read the whole response
+
+        Returns:
+            response: httpx.Response, or a StreamedResponse when `stack` is given
+        """
+        with measured_endpoint(spec.key if spec is not None else None):
+            # A call under a time budget is not coalesced: its budget would bound the calls
+            # joining it, and a joined call would ignore it.
+            if stack is not None or not self._cacheable(method, spec) \
+                    or self._single_flight is None or remaining_budget() is not None:
+                return await self._request_with_retries(method, endpoint, payload, spec, stack)
+            return await self._single_flight.do(
+                (current_priority(), endpoint),
+                lambda: self._request_with_retries(method, endpoint, payload, spec))
+
+    async def _request_with_retries(self, method: str,  # pylint: disable=too-many-arguments
+                                    endpoint: str,
+                                    payload: dict or None = None,
+                                    spec: Endpoint or None = None,
+                                    stack: AsyncExitStack or None = None):
+        """
+        Perform a request, retrying it according to the retry policy and within the time
+        budget of the call. Streamed responses are never revalidated.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            spec (Endpoint): the registered endpoint, None to apply the defaults of the method
+            stack (AsyncExitStack): the stack holding a streamed response open until it is
+                consumed, None to read the whole response
+
+        Returns:
+            response: httpx.Response, or a StreamedResponse when `stack` is given
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent before a response arrived
+        """
+        retries = self._start_retries(method, endpoint, spec, stack is not None)
+        while True:
+            self._check_budget(endpoint)
+            # A streamed response that is retried is closed with the stack of its attempt.
+            async with AsyncExitStack() as opened:
+                try:
+                    response = await self._send_scheduled(method, endpoint, payload,
+                                                          retries.headers,
+                                                          opened if stack is not None else None)
+                except self.transport.errors as error:
+                    delay = self._retry_delay_after_error(retries, error)
+                else:
+                    delay = self._retry_delay_after_response(retries, response)
+                    if delay is None:
+                        if stack is not None:
+                            await stack.enter_async_context(opened.pop_all())
+                        processed = self._final_response(retries, response)
+                        if processed is not None:
+                            return processed
+                        continue
+            await asyncio.sleep(delay)
+            retries.attempt += 1
+
+    @asynccontextmanager
+    async def _priority_slot(self, endpoint: str):
+        """
+        Hold a slot of the scheduler for the priority of the current task.
+
+        Args:
+            endpoint (str): API endpoint
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent waiting for a slot
+        """
+        scheduler = self.scheduler
+        if scheduler is None:
+            yield
+            return
+        priority = current_priority()
+        if not await scheduler.acquire_async(priority, timeout=remaining_budget()):
+            raise DeadlineExceededError(url=self.BASE_URL + endpoint)
+        try:
+            yield
+        finally:
+            scheduler.release(priority)
+
+    async def _send_scheduled(self, method: str,  # pylint: disable=too-many-arguments
+                              endpoint: str,
+                              payload: dict or None = None,
+                              headers: dict or None = None,
+                              stack: AsyncExitStack or None = None):
+        """
+        Send one attempt of a request once the scheduler grants a slot to its priority and the
+        circuit breaker and rate limiter admit it. The slot is taken first, so that the
+        requests of higher priorities also reserve the tokens of the rate limiter first.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers
+            stack (AsyncExitStack): the stack holding a streamed response open, None to read
+                the whole response
+
+        Returns:
+            response: httpx.Response
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent waiting for a slot or a token
+            CircuitOpenError: if the breaker of the endpoint family is open
+        """
+        async with self._priority_slot(endpoint):
+            wait = self._before_attempt(endpoint)
+            try:
+                if wait > 0:
+                    self._check_budget(endpoint, wait)
+                    await asyncio.sleep(wait)
+                return await self._send_limited(method, endpoint, payload, headers, stack)
+            except self.transport.errors:
+                raise
+            except BaseException:
+                # No outcome to record: the attempt timed out waiting for a token or a
+                # concurrency slot, or failed with an error that is not retried.
+                self._abandon_attempt(endpoint)
+                raise
+
+    async def _send_limited(self, method: str,  # pylint: disable=too-many-arguments
+                            endpoint: str,
+                            payload: dict or None = None,
+                            headers: dict or None = None,
+                            stack: AsyncExitStack or None = None):
+        """
+        Send one attempt of a request once the concurrency limiter grants it a slot.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers
+            stack (AsyncExitStack): the stack holding a streamed response open, None to read
+                the whole response
+
+        Returns:
+            response: httpx.Response
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent waiting for a slot
+        """
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return await self._send_attempt(method, endpoint, payload, headers, stack)
+        if not await limiter.acquire_async(timeout=remaining_budget()):
+            raise DeadlineExceededError(url=self.BASE_URL + endpoint)
+        started = time.monotonic()
+        response = None
+        try:
+            response = await self._send_attempt(method, endpoint, payload, headers, stack)
+            return response
+        finally:
+            limiter.release(time.monotonic() - started, failed=congestion_signal(response))
+
+    async def _send_attempt(self, method: str,  # pylint: disable=too-many-arguments
+                            endpoint: str,
+                            payload: dict or None = None,
+                            headers: dict or None = None,
+                            stack: AsyncExitStack or None = None):
+        """
+        Send one attempt of a request, hedging GET requests when a hedge policy is set.
+        Streamed requests are not hedged.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers
+            stack (AsyncExitStack): the stack holding a streamed response open, None to read
+                the whole response
+
+        Returns:
+            response: httpx.Response
+        """
+        if self.hedge_policy is None or method != "GET" or stack is not None:
+            return await self._send(method, endpoint, payload, headers, stack)
+        return await self._send_hedged(endpoint, headers)
+
+    async def _send_hedged(self, endpoint: str, headers: dict or None = None):
+        """
+        Send a GET request, duplicating it if it is not answered within the hedge delay.
+        The hedge is admitted by the circuit breaker and the rate limiter like any attempt,
+        and the slower copy is cancelled once a response arrives.
+
+        Args:
+            endpoint (str): API endpoint
+            headers (dict): request headers
+
+        Returns:
+            response: the first successful response of the request copies
+        """
+        policy = self.hedge_policy
+        policy.start()
+
+        async def timed_send(wait: float = 0.0):
+            await asyncio.sleep(wait)
+            started = time.monotonic()
+            response = await self._send("GET", endpoint, headers=headers)
+            policy.observe(time.monotonic() - started)
+            return response
+
+        primary = asyncio.ensure_future(timed_send())
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=policy.delay())
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        wait = None if done else self._admit_hedge(endpoint, policy)
+        if wait is None:
+            return await primary
+        self.log.info('Hedging GET %s.', endpoint)
+        hedge = asyncio.ensure_future(timed_send(wait))
+        try:
+            done, _ = await asyncio.wait({primary, hedge}, return_when=asyncio.FIRST_COMPLETED)
+            succeeded = [copy for copy in (primary, hedge)
+                         if copy in done and copy.exception() is None]
+            if not succeeded:
+                await asyncio.wait({primary, hedge})
+                succeeded = [copy for copy in (primary, hedge) if copy.exception() is None]
+        except asyncio.CancelledError:
+            hedge.add_done_callback(lambda copy: self._record_lost_copy(endpoint, copy))
+            primary.cancel()
+            hedge.cancel()
+            raise
+        # The error of the primary request is raised when both copies fail.
+        winner = succeeded[0] if succeeded else primary
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(lambda copy: self._record_lost_copy(endpoint, copy))
+        loser.cancel()
+        return winner.result()
+
+    async def _send(self, method: str,  # pylint: disable=too-many-arguments
+                    endpoint: str,
+                    payload: dict or None = None,
+                    headers: dict or None = None,
+                    stack: AsyncExitStack or None = None):
+        """
+        Send a single request through the async transport.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers, defaults to the client headers
+            stack (AsyncExitStack): the stack holding a streamed response open, None to read
+                the whole response
+
+        Returns:
+            response: httpx.Response, or a StreamedResponse when `stack` is given
+        """
+        timeout = self._request_timeout()
+        started = time.monotonic()
+        try:
+            if stack is None:
+                response = await self.transport.request(method, self.BASE_URL + endpoint,
+                                                        headers=headers or self._headers,
+                                                        payload=payload,
+                                                        timeout=timeout)
+            else:
+                response = await stack.enter_async_context(self.transport.stream_async(
+                    method, self.BASE_URL + endpoint, headers=headers or self._headers,
+                    timeout=timeout))
+        except self.transport.timeout_errors:
+            self._observe_timeout(timeout)
+            raise
+        self._observe_latency(time.monotonic() - started)
+        return response
+
+    async def _handle_response(self, response) -> CircleCIPropertyHolder:
+        """
+        Await the pending request of an endpoint method and convert its response.
+
+        Args:
+            response (Awaitable[httpx.Response]): the pending request
+
+        Returns:
+            CircleCIPropertyHolder: the converted response
+        """
+        return self._build_resource(await response)
+
+    async def _stream(self, spec: Endpoint, arguments: dict):
+        """
+        Perform the request of a streamable endpoint, yielding its items one at a time as they
+        are parsed from the response body.
+
+        Args:
+            spec (Endpoint): the endpoint
+            arguments (dict): the arguments of the endpoint method
+
+        Returns:
+            AsyncIterator[CircleCIPropertyHolder]: the items of the response
+
+        Raises:
+            CircleCIError: if the response status is not successful
+        """
+        async with AsyncExitStack() as stack:
+            response = await self._request(spec.method, spec.path(arguments),
+                                           spec.body(arguments), spec, stack)
+            if response.status_code not in range(200, 299):
+                self._build_resource(await response.aread())
+            metadata = {'status_code': response.status_code, 'url': str(response.url)}
+            parser = ItemParser()
+            async for chunk in response.chunks:
+                for item in parser.feed(chunk):
+                    yield self._build_item(item, metadata)
+            for item in parser.close():
+                yield self._build_item(item, metadata)
+
+    async def _post_reconciled(self, project_slug: str,
+                               endpoint: str,
+                               payload: dict):
+        """
+        Trigger a pipeline, resending the trigger after a timeout or server error only if the
+        pipelines of the current user show that it was not created.
+
+        Only the pipelines created since the first trigger, less `CLOCK_SKEW`, are searched,
+        and the pipeline must be on the branch or tag of the trigger, the default branch of the
+        project when it names neither. Nothing is read before an outcome is ambiguous.
+
+        Args:
+            project_slug (str): project slug
+            endpoint (str): API endpoint of the trigger
+            payload (dict): request payload
+
+        Returns:
+            response: the response of the trigger, or a response holding the pipeline found
+
+        Raises:
+            Exception: the transport error of the last trigger once the retries are exhausted
+        """
+        policy = self.retry_policy.for_endpoint(endpoint, ENDPOINTS["trigger_pipeline"].retry)
+        arguments = {"project_slug": project_slug}
+        expected = None
+        since = time.time() - CLOCK_SKEW
+        attempt = 0
+        while True:
+            response = error = None
+            try:
+                response = await self._post(endpoint, payload)
+            except self.transport.errors as transport_error:
+                error = transport_error
+            delay = self._trigger_retry_delay(project_slug, policy, attempt, response, error)
+            if delay is None:
+                return self._trigger_result(response, error)
+            await asyncio.sleep(delay)
+            if is_ambiguous(response):
+                if expected is None:
+                    expected = await self._expected_trigger(arguments, payload)
+                found = self._triggered_pipeline(
+                    await self._call(ENDPOINTS["get_pipeline_triggered_by_current_user"],
+                                     arguments), expected, since)
+                if found is not None:
+                    return found
+            attempt += 1
+
+    async def _expected_trigger(self, arguments: dict, payload: dict) -> dict:
+        """
+        The payload of a trigger with the branch or tag of the pipeline it creates.
+
+        Args:
+            arguments (dict): the path arguments of the project
+            payload (dict): the payload of the trigger
+
+        Returns:
+            dict: the payload, completed with the default branch if it names no branch or tag
+
+        Raises:
+            CircleCIError: if the project could not be read
+        """
+        if "branch" in payload or "tag" in payload:
+            return payload
+        return self._on_default_branch(payload,
+                                       await self._call(ENDPOINTS["get_project"], arguments))
+
+    async def get_current_user_information(self,
+                                           refresh: bool = False) -> CircleCIPropertyHolder:
+        """
+        Get information about the user. The result is cached by the client.
+
+        Args:
+            refresh (bool): fetch the information again instead of using the cache
+
+        Returns:
+            CircleCIPropertyHolder: user information
+        """
+        if refresh or self._current_user is None:
+            self._current_user = await self._get_current_user_information()
+        return self._current_user
+
+    # -------------------------------- Custom Methods -------------------------------- #
+
+    async def get_last_build_artifacts_by_project_name(
+            self, project_slug: str,
+            branch: str,
+            deadline: float or None = None) -> CircleCIPropertyHolder:
+        """
+        Get build artifacts by project name.
+
+        Args:
+            project_slug (str): project slug
+            branch (str): branch name
+            deadline (float): seconds all the underlying requests may take together
+
+        Returns:
+            CircleCIPropertyHolder: build artifacts urls
+
+        Raises:
+            DeadlineExceededError: if the deadline passes before the artifacts are fetched
+        """
+        with time_budget(deadline):
+            pipelines = await self.get_all_pipelines_for_project(project_slug, branch=branch)
+            workflows = await self.get_pipeline_workflow_by_id(pipelines.items[0].id)
+            jobs = await self.get_workflow_jobs(workflows.items[0].id)
+            return await self.get_job_artifacts(project_slug, jobs.items[0].job_number)
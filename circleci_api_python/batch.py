@@ -0,0 +1,324 @@
+""" Concurrent execution of many CircleCI API calls. """
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import threading
+from concurrent import futures
+
+DEFAULT_CONCURRENCY = 8
+
+
+def call_item(method, item):
+    """
+    Call a client method with the arguments of one batch item.
+
+    Args:
+        method (Callable): the client method
+        item: a tuple of positional arguments, a dict of keyword arguments or a single argument
+
+    Returns:
+        the value returned by the method
+    """
+    if isinstance(item, dict):
+        return method(**item)
+    if isinstance(item, tuple):
+        return method(*item)
+    return method(item)
+
+
+class BatchResult:
+    """
+    The outcome of one item of a mapped call.
+    """
+
+    __slots__ = ('index', 'item', 'value', 'error')
+
+    def __init__(self, index: int, item, value=None, error: Exception or None = None):
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """ Whether the call succeeded. """
+        return self.error is None
+
+    def result(self):
+        """
+        The value of the call.
+
+        Returns:
+            the value returned by the client method
+
+        Raises:
+            Exception: the error raised by the call
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"value={self.value!r}"
+        return f"BatchResult(index={self.index}, item={self.item!r}, {outcome})"
+
+
+class Batch:
+    """
+    Runs client calls on a bounded pool of threads and hands out their futures.
+
+    Leaving the `with` block waits for the submitted calls; leaving it with an exception, or
+    calling `cancel`, drops the calls that have not started yet.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Creates a Batch.
+
+        Args:
+            concurrency (int): maximum number of calls running at once
+        """
+        self.concurrency = concurrency
+        self._executor = futures.ThreadPoolExecutor(max_workers=concurrency,
+                                                    thread_name_prefix="circleci-batch")
+        self._futures = []
+        self._lock = threading.Lock()
+        self.cancelled = False
+
+    def __enter__(self) -> Batch:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.cancel()
+        self.close()
+
+    def submit(self, method, *args, **kwargs) -> futures.Future:
+        """
+        Schedule a client call.
+
+        Args:
+            method (Callable): the client method
+            *args: positional arguments of the call
+            **kwargs: keyword arguments of the call
+
+        Returns:
+            concurrent.futures.Future: the future of the call
+
+        Raises:
+            RuntimeError: if the batch was cancelled or closed
+        """
+        with self._lock:
+            if self.cancelled:
+                raise RuntimeError("Cannot submit to a cancelled batch.")
+            # Calls keep the time budget active where they were submitted.
+            future = self._executor.submit(contextvars.copy_context().run,
+                                           method, *args, **kwargs)
+            self._futures.append(future)
+        return future
+
+    @property
+    def futures(self) -> list:
+        """ The futures of all the calls submitted so far. """
+        with self._lock:
+            return list(self._futures)
+
+    def as_completed(self, timeout: float or None = None):
+        """
+        Iterate over the futures submitted so far as they complete.
+
+        Args:
+            timeout (float): maximum number of seconds to wait for all of them
+
+        Returns:
+            Iterator[concurrent.futures.Future]: the completed futures
+        """
+        return futures.as_completed(self.futures, timeout)
+
+    def cancel(self) -> int:
+        """
+        Stop scheduling calls and drop the ones that have not started. Running calls complete.
+
+        Returns:
+            int: the number of calls dropped
+        """
+        with self._lock:
+            self.cancelled = True
+            pending = list(self._futures)
+        return sum(future.cancel() for future in pending)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Release the threads of the batch once the submitted calls completed.
+
+        Args:
+            wait (bool): wait for the running calls to complete
+        """
+        with self._lock:
+            self.cancelled = True
+        self._executor.shutdown(wait=wait)
+
+
+def map_calls(method, items, concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    Call a client method for every item, yielding the outcomes as they complete.
+
+    Items are taken from the iterable only as running calls complete, so at most
+    `concurrency` calls are scheduled at once. Closing the generator stops scheduling.
+
+    Args:
+        method (Callable): the client method
+        items (Iterable): arguments of each call, see `call_item`
+        concurrency (int): maximum number of calls running at once
+
+    Yields:
+        BatchResult: the outcome of each item, in completion order
+    """
+    items = enumerate(items)
+    with Batch(concurrency) as batch:
+        pending = {}
+
+        def schedule(count):
+            for index, item in itertools.islice(items, count):
+                pending[batch.submit(call_item, method, item)] = (index, item)
+
+        try:
+            schedule(concurrency)
+            while pending:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                schedule(len(done))
+                for future in done:
+                    index, item = pending.pop(future)
+                    error = future.exception()
+                    yield BatchResult(index, item, None if error else future.result(), error)
+        finally:
+            batch.cancel()
+
+
+class AsyncBatch:
+    """
+    Runs coroutine client calls as tasks, at most `concurrency` of them at once.
+
+    Leaving the `async with` block waits for the submitted calls; leaving it with an
+    exception, or calling `cancel`, cancels the calls that are still pending.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Creates an AsyncBatch.
+
+        Args:
+            concurrency (int): maximum number of calls running at once
+        """
+        self.concurrency = concurrency
+        self._semaphore = None
+        self._tasks = []
+        self.cancelled = False
+
+    async def __aenter__(self) -> AsyncBatch:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.cancel()
+        await self.close()
+
+    async def _run(self, method, args, kwargs):
+        async with self._semaphore:
+            return await method(*args, **kwargs)
+
+    def submit(self, method, *args, **kwargs) -> asyncio.Task:
+        """
+        Schedule a client call.
+
+        Args:
+            method (Callable): the coroutine client method
+            *args: positional arguments of the call
+            **kwargs: keyword arguments of the call
+
+        Returns:
+            asyncio.Task: the task of the call
+
+        Raises:
+            RuntimeError: if the batch was cancelled or closed
+        """
+        if self.cancelled:
+            raise RuntimeError("Cannot submit to a cancelled batch.")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        task = asyncio.ensure_future(self._run(method, args, kwargs))
+        self._tasks.append(task)
+        return task
+
+    @property
+    def tasks(self) -> list:
+        """ The tasks of all the calls submitted so far. """
+        return list(self._tasks)
+
+    def as_completed(self, timeout: float or None = None):
+        """
+        Iterate over the calls submitted so far as they complete.
+
+        Args:
+            timeout (float): maximum number of seconds to wait for all of them
+
+        Returns:
+            Iterator[Awaitable]: awaitables of the results in completion order
+        """
+        return asyncio.as_completed(self.tasks, timeout=timeout)
+
+    def cancel(self) -> int:
+        """
+        Stop scheduling calls and cancel the ones still pending.
+
+        Returns:
+            int: the number of calls cancelled
+        """
+        self.cancelled = True
+        return sum(task.cancel() for task in self._tasks)
+
+    async def close(self) -> None:
+        """
+        Wait for the submitted calls to complete.
+        """
+        self.cancelled = True
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+
+async def map_calls_async(method, items, concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    Await a coroutine client method for every item, yielding the outcomes as they complete.
+
+    Items are taken from the iterable only as running calls complete, so at most
+    `concurrency` calls are scheduled at once. Closing the generator cancels the pending calls.
+
+    Args:
+        method (Callable): the coroutine client method
+        items (Iterable): arguments of each call, see `call_item`
+        concurrency (int): maximum number of calls running at once
+
+    Yields:
+        BatchResult: the outcome of each item, in completion order
+    """
+    items = enumerate(items)
+    pending = {}
+
+    def schedule(count):
+        for index, item in itertools.islice(items, count):
+            pending[asyncio.ensure_future(call_item(method, item))] = (index, item)
+
+    try:
+        schedule(concurrency)
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            schedule(len(done))
+            for task in done:
+                index, item = pending.pop(task)
+                error = task.exception()
+                yield BatchResult(index, item, None if error else task.result(), error)
+    finally:
+        for task in pending:
+            task.cancel()
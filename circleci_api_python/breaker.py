@@ -0,0 +1,214 @@
+""" Circuit breakers for the CircleCI API client. """
+from __future__ import annotations
+
+import threading
+import time
+
+PROJECT_JOB_RESOURCES = frozenset({"job", "artifacts", "tests"})
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Classify an API endpoint into its endpoint family.
+
+    Args:
+        endpoint (str): API endpoint, e.g. "/api/v2/project/gh/org/repo/pipeline"
+
+    Returns:
+        str: one of "pipeline", "workflow", "job", "context", "webhook", "project", "oidc",
+             "user" or the first path segment after the API version for anything else
+    """
+    path = endpoint.split('?', 1)[0]
+    if path.endswith("/oidc-custom-claims"):
+        return "oidc"
+    parts = path.strip('/').split('/')
+    resource = parts[2] if len(parts) > 2 else ""
+    if resource in ("project", "projects"):
+        # Project endpoints start with the three segment slug vcs/org/repo.
+        sub_resources = parts[6:8]
+        if sub_resources[:1] == ["pipeline"]:
+            return "pipeline"
+        if PROJECT_JOB_RESOURCES.intersection(sub_resources):
+            return "job"
+        return "project"
+    if resource in ("me", "user"):
+        return "user"
+    return resource
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker of a single endpoint family.
+
+    After `failure_threshold` consecutive failures the breaker opens and requests fail fast.
+    Once `recovery_timeout` seconds have passed it turns half-open and lets probe requests
+    through: a successful probe closes it again, a failed one reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5,
+                 recovery_timeout: float = 30,
+                 half_open_max_calls: int = 1):
+        """
+        Creates a CircuitBreaker.
+
+        Args:
+            failure_threshold (int): consecutive failures that open the breaker
+            recovery_timeout (float): seconds the breaker stays open before probing
+            half_open_max_calls (int): concurrent probe requests allowed while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        """ The current state: "closed", "open" or "half_open". """
+        with self._lock:
+            if self._state == self.OPEN and self._recovered():
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """ Seconds until an open breaker lets a probe through. """
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def after_fork(self) -> None:
+        """ Reset the lock in a forked child. """
+        self._lock = threading.Lock()
+
+    def _recovered(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.recovery_timeout
+
+    def allow(self) -> bool:
+        """
+        Decide whether a request may be sent.
+
+        Returns:
+            bool: False while the breaker is open or the half-open probes are in flight
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if not self._recovered():
+                    return False
+                self._state = self.HALF_OPEN
+                self._probes = 0
+            if self._probes >= self.half_open_max_calls:
+                return False
+            self._probes += 1
+            return True
+
+    def release_probe(self) -> None:
+        """
+        Give back the probe slot of an attempt abandoned before its outcome was known, e.g.
+        because its wait for the rate limiter outlasted the time budget.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        """ Record a healthy response, closing a half-open breaker. """
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """ Record a failed request, opening the breaker past the threshold. """
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+
+class CircuitBreakers:
+    """
+    Circuit breakers keyed by endpoint family, created on first use.
+
+    Transport errors and 5xx responses count as failures; any other response, including
+    client errors, shows the family is healthy.
+    """
+
+    def __init__(self, failure_threshold: int = 5,
+                 recovery_timeout: float = 30,
+                 half_open_max_calls: int = 1):
+        """
+        Creates a CircuitBreakers registry.
+
+        Args:
+            failure_threshold (int): consecutive failures that open a breaker
+            recovery_timeout (float): seconds a breaker stays open before probing
+            half_open_max_calls (int): concurrent probe requests allowed while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def after_fork(self) -> None:
+        """ Reset the locks of the registry and of its breakers in a forked child. """
+        self._lock = threading.Lock()
+        for breaker in self._breakers.values():
+            breaker.after_fork()
+
+    def get(self, family: str) -> CircuitBreaker:
+        """
+        Return the breaker of an endpoint family.
+
+        Args:
+            family (str): endpoint family
+
+        Returns:
+            CircuitBreaker: the breaker
+        """
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = self._breakers[family] = CircuitBreaker(self.failure_threshold,
+                                                                  self.recovery_timeout,
+                                                                  self.half_open_max_calls)
+            return breaker
+
+    def states(self) -> dict:
+        """
+        Return the state of every breaker created so far.
+
+        Returns:
+            dict: breaker state keyed by endpoint family
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {family: breaker.state for family, breaker in breakers.items()}
+
+    def record(self, family: str, response=None, error: Exception or None = None) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            family (str): endpoint family
+            response: the response received
+            error (Exception): the transport error raised
+        """
+        breaker = self.get(family)
+        if error is not None or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
@@ -0,0 +1,214 @@
+""" Conditional GET cache for the CircleCI API client. """
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+from circleci_api_python.codec import JSONCodec, decode_response
+
+# Request headers carrying the credentials a response was served for.
+AUTH_HEADERS = ('Circle-Token', 'Authorization')
+
+
+def _cache_key(url: str, headers: dict or None) -> tuple:
+    """
+    Key the entry of a URL by the credentials of the request, so that clients with different
+    tokens sharing a cache never see each other's responses.
+
+    Args:
+        url (str): request URL
+        headers (dict): request headers
+
+    Returns:
+        tuple: a fingerprint of the credentials, None without any, and the URL
+    """
+    credentials = [str(headers[name]) for name in AUTH_HEADERS if name in headers] \
+        if headers else []
+    if not credentials:
+        return None, url
+    return hashlib.sha256("\n".join(credentials).encode()).hexdigest(), url
+
+
+def _copy_body(data):
+    """
+    Deep-copy a decoded JSON body, so that a caller changing its result, down to the nested
+    objects, never changes the body kept in the cache.
+
+    Args:
+        data (dict or list): decoded JSON body
+
+    Returns:
+        dict or list: the copy
+    """
+    return copy.deepcopy(data)
+
+
+class CacheEntry:
+    """
+    The validators and decoded body of a cached response.
+    """
+
+    __slots__ = ('etag', 'last_modified', 'status_code', 'headers', 'url', 'data')
+
+    def __init__(self, etag: str or None,
+                 last_modified: str or None,
+                 status_code: int,
+                 headers: dict,
+                 url: str):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self.data = None
+
+
+class CachedResponse:
+    """
+    A response rebuilt from a cache entry after the server answered 304 Not Modified.
+    """
+
+    not_modified = True
+
+    def __init__(self, entry: CacheEntry, response=None):
+        self.status_code = entry.status_code
+        self.headers = entry.headers
+        self.url = entry.url
+        self.response = response
+        self._data = entry.data
+
+    def json(self) -> dict or list:
+        """ The cached body, without decoding it again. """
+        return _copy_body(self._data)
+
+
+class _CachingResponse:
+    """
+    Wraps a fresh response and stores its body in the cache entry once it is decoded.
+    """
+
+    # Hides the raw body so that it is decoded through json(), which fills the cache entry.
+    content = None
+
+    def __init__(self, response, entry: CacheEntry, codec: JSONCodec or None = None):
+        self._response = response
+        self._entry = entry
+        self._codec = codec
+
+    def __getattr__(self, name: str):
+        return getattr(self._response, name)
+
+    def json(self) -> dict or list:
+        """ The decoded body, also kept in the cache. """
+        if self._codec is None:
+            data = self._response.json()
+        else:
+            data = decode_response(self._response, self._codec)
+        self._entry.data = _copy_body(data)
+        return data
+
+
+class ConditionalCache:
+    """
+    Thread-safe LRU cache of ETag / Last-Modified validators and decoded bodies keyed by URL
+    and by a fingerprint of the credentials of the request.
+
+    Requests for cached URLs are sent with If-None-Match / If-Modified-Since, and a 304 answer
+    is replaced by the previously decoded body.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Creates a ConditionalCache.
+
+        Args:
+            max_entries (int): maximum number of responses kept in the cache
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def after_fork(self) -> None:
+        """ Reset the lock in a forked child; the cached bodies stay valid. """
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """ Drop all cached entries. """
+        with self._lock:
+            self._entries.clear()
+
+    def conditional_headers(self, url: str, headers: dict or None = None) -> dict:
+        """
+        Build the conditional request headers for a URL.
+
+        Args:
+            url (str): request URL
+            headers (dict): request headers, whose credentials select the entry
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, empty if the URL is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(_cache_key(url, headers))
+        if entry is None or entry.data is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def process(self, url: str, response,
+                codec: JSONCodec or None = None,
+                headers: dict or None = None):
+        """
+        Store the validators of a fresh response, or replay the cached body on a 304.
+
+        Args:
+            url (str): request URL
+            response: the response received
+            codec (JSONCodec): the codec decoding the body, None to use `response.json()`
+            headers (dict): request headers, whose credentials select the entry
+
+        Returns:
+            response: the response to hand to the client; a 304 is returned as is if the entry
+                      was evicted since its validators were sent
+        """
+        key = _cache_key(url, headers)
+        status_code = response.status_code
+        if status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+            if entry is None or entry.data is None:
+                return response
+            return CachedResponse(entry, response)
+
+        if not isinstance(status_code, int) or not 200 <= status_code < 300:
+            return response
+        headers = getattr(response, 'headers', None)
+        etag = headers.get('ETag') if headers is not None else None
+        last_modified = headers.get('Last-Modified') if headers is not None else None
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        if not etag and not last_modified:
+            with self._lock:
+                self._entries.pop(key, None)
+            return response
+
+        entry = CacheEntry(etag, last_modified, status_code, dict(headers), str(response.url))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return _CachingResponse(response, entry, codec)
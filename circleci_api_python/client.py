@@ -3,50 +3,993 @@
 This module implements the CircleCI API client, which acts as an interface between the raw
 JSON responses from the CircleCI API and the dictionary abstraction provided by this library.
 """
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
+import contextvars
+import inspect
 import logging as _log
+import os
+import threading
+import time
+import weakref
+from concurrent import futures
+from contextlib import ExitStack, contextmanager
 from functools import wraps
 
 import requests
 from requests import Response
 
-from circleci_api_python.exceptions import CircleCIError
+from circleci_api_python.batch import DEFAULT_CONCURRENCY, Batch, map_calls
+from circleci_api_python.breaker import CircuitBreakers, endpoint_family
+from circleci_api_python.cache import ConditionalCache
+from circleci_api_python.codec import JSONCodec, decode_response, default_codec
+from circleci_api_python.concurrency import AdaptiveConcurrencyLimiter, congestion_signal
+from circleci_api_python.deadline import budget_timeout, remaining_budget, time_budget
+from circleci_api_python.endpoints import ENDPOINTS, Endpoint
+from circleci_api_python.exceptions import (CircleCIError, CircuitOpenError,
+                                            DeadlineExceededError)
+from circleci_api_python.hedging import HedgePolicy
+from circleci_api_python.latency import AdaptiveTimeouts, current_endpoint, measured_endpoint
+from circleci_api_python.ratelimit import RateLimiter
 from circleci_api_python.resources import dict_to_circleci_resource, CircleCIPropertyHolder
-from circleci_api_python.utils import validate_login
+from circleci_api_python.reconcile import CLOCK_SKEW, find_triggered_pipeline, is_ambiguous
+from circleci_api_python.retry import RetryPolicy
+from circleci_api_python.scheduler import PriorityScheduler, current_priority, request_priority
+from circleci_api_python.singleflight import SingleFlight
+from circleci_api_python.streaming import ItemParser
+from circleci_api_python.transport import (HttpxTransport, InMemoryResponse, RequestsTransport,
+                                           Transfer, Transport)
 
 LOG = _log.getLogger("circleci_api_python")
 LOG.addHandler(_log.NullHandler())
+# Clients created with logging=False log here, leaving the package logger untouched.
+QUIET_LOG = LOG.getChild("quiet")
+QUIET_LOG.setLevel(_log.CRITICAL)
 
+# Every live client, reset in the child after a fork.
+_CLIENTS = weakref.WeakSet()
 
-class CircleCI:
-    """ CircleCI API client. """
+
+def _after_fork_in_child() -> None:
+    """ Reset the clients inherited by a forked child process. """
+    for client in list(_CLIENTS):
+        client._after_fork()  # pylint: disable=protected-access
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _in_thread(function) -> futures.Future:
+    """
+    Run a function in a thread of its own, keeping the context of the calling thread.
+
+    Args:
+        function: the function to run
+
+    Returns:
+        futures.Future: the outcome of the function
+    """
+    future = futures.Future()
+    context = contextvars.copy_context()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            result = context.run(function)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name="circleci-hedge", daemon=True).start()
+    return future
+
+
+class _Retries:  # pylint: disable=too-many-instance-attributes
+    """
+    The state of a request across its attempts, shared by the retry loops of the sync and
+    async clients.
+    """
+
+    __slots__ = ('method', 'endpoint', 'policy', 'idempotent', 'cacheable', 'headers',
+                 'started', 'attempt')
+
+    def __init__(self, method: str,  # pylint: disable=too-many-arguments
+                 endpoint: str,
+                 policy: RetryPolicy,
+                 idempotent: bool or None,
+                 cacheable: bool,
+                 headers: dict):
+        self.method = method
+        self.endpoint = endpoint
+        self.policy = policy
+        self.idempotent = idempotent
+        self.cacheable = cacheable
+        self.headers = headers
+        self.started = time.monotonic()
+        self.attempt = 0
+
+    @property
+    def elapsed(self) -> float:
+        """ Seconds spent on the request so far. """
+        return time.monotonic() - self.started
+
+
+class CircleCI:  # pylint: disable=too-many-instance-attributes
+    """
+    CircleCI API client.
+
+    A client is thread-safe: share one instance between threads to reuse its pooled
+    connections. The cache, rate limiter, circuit breakers and hedge policy it holds guard
+    their state with locks.
+
+    A client is also fork-safe: it can be created before a prefork server or a
+    multiprocessing pool forks, as each child rebuilds its connection pools and locks.
+    """
 
     BASE_URL = "https://circleci.com"
 
-    def __init__(self, token: str,
+    def __init__(self, token: str,  # pylint: disable=too-many-arguments,too-many-locals
                  logging: bool = True,
                  max_retries: int = 3,
                  retry_delay: int = 1,
                  timeout: tuple = (5, 15),
-                 login_validation: bool = False):
+                 login_validation: bool = False,
+                 *,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 http2: bool = False,
+                 retry_policy: RetryPolicy or None = None,
+                 transport: Transport or None = None,
+                 conditional_cache: ConditionalCache or None = None,
+                 rate_limiter: RateLimiter or None = None,
+                 circuit_breakers: CircuitBreakers or None = None,
+                 hedge_policy: HedgePolicy or None = None,
+                 concurrency_limiter: AdaptiveConcurrencyLimiter or None = None,
+                 scheduler: PriorityScheduler or None = None,
+                 adaptive_timeouts: AdaptiveTimeouts or None = None,
+                 json_codec: JSONCodec or None = None,
+                 coalesce_gets: bool = True,
+                 warmup: int = 0):
         self.__token = token
-        self.__headers = {'Circle-Token': self.__token}
+        self._headers = {'Circle-Token': self.__token}
 
-        LOG.setLevel(_log.INFO if logging else _log.CRITICAL)
-        self.log = LOG
-
-        if login_validation:
-            valid, response = validate_login(self.BASE_URL, self.__headers)
-            if not valid:
-                raise CircleCIError("Cannot login with the provided token. "
-                                    "Please check the token.",
-                                    response.status_code,
-                                    response=response)
+        self.log = LOG if logging else QUIET_LOG
 
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries,
+                                                        retry_delay=retry_delay)
+        self.conditional_cache = conditional_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.hedge_policy = hedge_policy
+        self.concurrency_limiter = concurrency_limiter
+        self.scheduler = scheduler
+        self.adaptive_timeouts = adaptive_timeouts
+        self.json_codec = json_codec or default_codec()
+        self._lock = threading.Lock()
+        self._single_flight = self._create_single_flight() if coalesce_gets else None
+        self._login_pending = False
+        self._current_user = None
+        self._warmup_thread = None
+
+        self.transport = transport or self._create_transport(pool_connections,
+                                                             pool_maxsize,
+                                                             keep_alive,
+                                                             http2)
+        self.transport.codec = self.json_codec
+
+        _CLIENTS.add(self)
+        if login_validation:
+            self._validate_login()
+        if warmup > 0:
+            self._start_warmup(warmup)
+
+    def _create_transport(self, pool_connections: int,
+                          pool_maxsize: int,
+                          keep_alive: bool,
+                          http2: bool) -> Transport:
+        """
+        Create the default transport shared by all requests of the client.
+
+        Args:
+            pool_connections (int): number of host pools to cache
+            pool_maxsize (int): maximum number of connections kept per host
+            keep_alive (bool): keep connections open between requests
+            http2 (bool): multiplex requests over HTTP/2 connections
+
+        Returns:
+            transport: Transport
+        """
+        if http2:
+            return HttpxTransport(pool_maxsize=pool_maxsize, keep_alive=keep_alive)
+        return RequestsTransport(pool_connections=pool_connections,
+                                 pool_maxsize=pool_maxsize,
+                                 keep_alive=keep_alive)
+
+    def _create_single_flight(self) -> SingleFlight:
+        """
+        Create the registry coalescing identical in-flight GET requests.
+
+        Returns:
+            single_flight: SingleFlight
+        """
+        return SingleFlight()
+
+    def _start_warmup(self, connections: int) -> None:
+        """
+        Open pooled connections to the API in a background thread.
+
+        Args:
+            connections (int): number of connections to open
+        """
+        self._warmup_thread = threading.Thread(target=self._warmup, args=(connections,),
+                                               name="circleci-warmup", daemon=True)
+        self._warmup_thread.start()
+
+    def _warmup(self, connections: int) -> None:
+        """
+        Open pooled connections to the API, logging rather than raising failures.
+
+        Args:
+            connections (int): number of connections to open
+        """
+        try:
+            opened = self.transport.warmup(self.BASE_URL, connections)
+        except Exception as error:
+            self.log.warning('Warming up connections to %s failed: %s', self.BASE_URL, error)
+            return
+        self.log.info('Warmed up %d of %d connections to %s.',
+                      opened, connections, self.BASE_URL)
+
+    def wait_for_warmup(self, timeout: float or None = None) -> bool:
+        """
+        Wait until the connections requested with `warmup` are open.
+
+        Args:
+            timeout (float): maximum number of seconds to wait, None to wait until done
+
+        Returns:
+            bool: True once the warm-up finished or if none was requested
+        """
+        if self._warmup_thread is None:
+            return True
+        self._warmup_thread.join(timeout)
+        return not self._warmup_thread.is_alive()
+
+    def _validate_login(self) -> None:
+        """
+        Defer the login check to the first request instead of spending a round trip on it.
+        """
+        self._login_pending = True
+
+    def _check_login(self, response) -> None:
+        """
+        Check the response of the first request for a rejected token.
+
+        Args:
+            response: the final response of the request
+
+        Raises:
+            CircleCIError: if the token is rejected
+        """
+        if response.status_code == 401:
+            raise CircleCIError("Cannot login with the provided token. "
+                                "Please check the token.",
+                                response.status_code,
+                                response=response)
+        self._login_pending = False
+
+    def _after_fork(self) -> None:
+        """
+        Rebuild the connection pools and locks inherited from the parent process.
+
+        Threads do not survive a fork, so requests that were in flight in the parent and the
+        hedging threads are forgotten rather than waited for.
+        """
+        self._lock = threading.Lock()
+        if self._single_flight is not None:
+            self._single_flight = self._create_single_flight()
+        self.transport.after_fork()
+        for component in (self.conditional_cache, self.rate_limiter, self.circuit_breakers,
+                          self.hedge_policy, self.concurrency_limiter, self.scheduler,
+                          self.adaptive_timeouts):
+            if component is not None:
+                component.after_fork()
+
+    def __enter__(self) -> CircleCI:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the pooled connections held by the client.
+        """
+        self.transport.close()
+
+    def _batch_concurrency(self, concurrency: int or None) -> int:
+        """
+        Resolve the number of calls a batch runs at once.
+
+        Args:
+            concurrency (int): requested concurrency, None for the default
+
+        Returns:
+            int: the concurrency; the upper bound of the concurrency limiter if one is set
+        """
+        if concurrency is not None:
+            return concurrency
+        if self.concurrency_limiter is not None:
+            return max(1, int(self.concurrency_limiter.max_limit))
+        return DEFAULT_CONCURRENCY
+
+    def _resolve_method(self, method):
+        """
+        Resolve the client method a batch calls.
+
+        Args:
+            method (str or Callable): name of a client method, or a callable
+
+        Returns:
+            Callable: the method
+        """
+        return getattr(self, method) if isinstance(method, str) else method
+
+    def batch(self, concurrency: int or None = None) -> Batch:
+        """
+        Start a batch of client calls running concurrently.
+
+        Use it as a context manager: `submit` returns a future per call, and leaving the
+        block waits for them. A failing call sets the exception of its future only.
+
+        Args:
+            concurrency (int): maximum number of calls running at once
+
+        Returns:
+            Batch: the batch
+        """
+        return Batch(self._batch_concurrency(concurrency))
+
+    def map(self, method, args_iterable, concurrency: int or None = None):
+        """
+        Call a client method once per item, yielding the outcomes as they complete.
+
+        An item is a tuple of positional arguments, a dict of keyword arguments or a single
+        argument. Errors are reported per item in `BatchResult.error` without stopping the
+        others. Items are consumed lazily; closing the generator, for instance by breaking out
+        of the loop, stops scheduling calls.
+
+        Args:
+            method (str or Callable): name of a client method, or a client method
+            args_iterable (Iterable): arguments of each call
+            concurrency (int): maximum number of calls running at once
+
+        Returns:
+            Iterator[BatchResult]: the outcome of each call, in completion order
+        """
+        return map_calls(self._resolve_method(method), args_iterable,
+                         self._batch_concurrency(concurrency))
+
+    @staticmethod
+    def priority(priority: str):
+        """
+        Send the requests made within a `with` block with a priority. The priority only
+        matters when the client has a `scheduler`.
+
+        Example:
+            with client.priority("high"):
+                client.approve_workflow_job(workflow_id, approval_request_id)
+
+        Args:
+            priority (str): "high", "normal" or "low"
+
+        Returns:
+            ContextManager: the block setting the priority
+        """
+        return request_priority(priority)
+
+    def _call(self, spec: Endpoint, arguments: dict) -> requests.Response:
+        """
+        Perform the request of a registered endpoint.
+
+        Args:
+            spec (Endpoint): the endpoint
+            arguments (dict): the arguments of the endpoint method
+
+        Returns:
+            response: requests.Response
+        """
+        return self._request(spec.method, spec.path(arguments), spec.body(arguments), spec)
+
+    def _request(self, method: str,  # pylint: disable=too-many-arguments
+                 endpoint: str,
+                 payload: dict or None = None,
+                 spec: Endpoint or None = None,
+                 stack: ExitStack or None = None) -> requests.Response:
+        """
+        Perform a request. Concurrent requests of the same cacheable endpoint and priority made
+        without a time budget are coalesced into one, every caller receiving its response or
+        error.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            spec (Endpoint): the registered endpoint, None to apply the defaults of the method
+            stack (ExitStack): the stack holding a streamed response open until it is consumed,
+                None to read the whole response
+
+        Returns:
+            response: requests.Response, or a StreamedResponse when `stack` is given
+        """
+        with measured_endpoint(spec.key if spec is not None else None):
+            # A call under a time budget is not coalesced: its budget would bound the calls
+            # joining it, and a joined call would ignore it.
+            if stack is not None or not self._cacheable(method, spec) \
+                    or self._single_flight is None or remaining_budget() is not None:
+                return self._request_with_retries(method, endpoint, payload, spec, stack)
+            return self._single_flight.do(
+                (current_priority(), endpoint),
+                lambda: self._request_with_retries(method, endpoint, payload, spec))
+
+    def _request_with_retries(self, method: str,  # pylint: disable=too-many-arguments
+                              endpoint: str,
+                              payload: dict or None = None,
+                              spec: Endpoint or None = None,
+                              stack: ExitStack or None = None) -> requests.Response:
+        """
+        Perform a request, retrying it according to the retry policy and within the time
+        budget of the call. Streamed responses are never revalidated.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            spec (Endpoint): the registered endpoint, None to apply the defaults of the method
+            stack (ExitStack): the stack holding a streamed response open until it is consumed,
+                None to read the whole response
+
+        Returns:
+            response: requests.Response, or a StreamedResponse when `stack` is given
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent before a response arrived
+        """
+        retries = self._start_retries(method, endpoint, spec, stack is not None)
+        while True:
+            self._check_budget(endpoint)
+            # A streamed response that is retried is closed with the stack of its attempt.
+            with ExitStack() as opened:
+                try:
+                    response = self._send_scheduled(method, endpoint, payload, retries.headers,
+                                                    opened if stack is not None else None)
+                except self.transport.errors as error:
+                    delay = self._retry_delay_after_error(retries, error)
+                else:
+                    delay = self._retry_delay_after_response(retries, response)
+                    if delay is None:
+                        if stack is not None:
+                            stack.enter_context(opened.pop_all())
+                        processed = self._final_response(retries, response)
+                        if processed is not None:
+                            return processed
+                        continue
+            time.sleep(delay)
+            retries.attempt += 1
+
+    def _start_retries(self, method: str,
+                       endpoint: str,
+                       spec: Endpoint or None,
+                       streamed: bool) -> _Retries:
+        """
+        Set up the state of a request about to be attempted.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            spec (Endpoint): the registered endpoint, None to apply the defaults of the method
+            streamed (bool): whether the response is streamed
+
+        Returns:
+            _Retries: the state of the request
+        """
+        cacheable = not streamed and self._cacheable(method, spec)
+        if spec is None:
+            return _Retries(method, endpoint, self.retry_policy.for_endpoint(endpoint), None,
+                            cacheable, self._request_headers(endpoint, cacheable))
+        return _Retries(method, endpoint, self.retry_policy.for_endpoint(endpoint, spec.retry),
+                        spec.idempotent, cacheable, self._request_headers(endpoint, cacheable))
+
+    def _check_budget(self, endpoint: str, wait: float = 0.0) -> None:
+        """
+        Check that the time budget of the call outlasts a wait.
+
+        Args:
+            endpoint (str): API endpoint
+            wait (float): the wait
+
+        Raises:
+            DeadlineExceededError: if the budget does not outlast the wait
+        """
+        if not self._budget_allows(wait):
+            raise DeadlineExceededError(url=self.BASE_URL + endpoint)
+
+    def _retry_delay_after_error(self, retries: _Retries, error: Exception) -> float:
+        """
+        Record an attempt that failed with a transport error and decide on its retry.
+
+        Args:
+            retries (_Retries): the state of the request
+            error (Exception): the transport error
+
+        Returns:
+            float: the delay before the next attempt
+
+        Raises:
+            Exception: the transport error if the request is not retried
+            DeadlineExceededError: if the time budget is spent
+        """
+        self._after_attempt(retries.endpoint, error=error)
+        delay = retries.policy.next_delay(retries.method, retries.attempt, retries.elapsed,
+                                          error=error, idempotent=retries.idempotent)
+        if delay is None or not self._budget_allows(delay):
+            if not self._budget_allows():
+                raise DeadlineExceededError(url=self.BASE_URL + retries.endpoint) from error
+            raise error
+        self.log.warning('%s %s failed (%s), retrying in %.2fs.',
+                         retries.method, retries.endpoint, error, delay)
+        return delay
+
+    def _retry_delay_after_response(self, retries: _Retries, response) -> float or None:
+        """
+        Record an attempt that received a response and decide on its retry.
+
+        Args:
+            retries (_Retries): the state of the request
+            response: the response
+
+        Returns:
+            float or None: the delay before the next attempt, None if the response is final
+        """
+        self._after_attempt(retries.endpoint, response=response)
+        delay = retries.policy.next_delay(retries.method, retries.attempt, retries.elapsed,
+                                          response=response, idempotent=retries.idempotent)
+        if delay is None or not self._budget_allows(delay):
+            return None
+        self.log.warning('%s %s returned %s, retrying in %.2fs.',
+                         retries.method, retries.endpoint, response.status_code, delay)
+        return delay
+
+    def _final_response(self, retries: _Retries, response) -> requests.Response or None:
+        """
+        Post-process the final response of a request.
+
+        Args:
+            retries (_Retries): the state of the request
+            response: the final response
+
+        Returns:
+            response: requests.Response, or None if the request must be sent again without
+                cache validators
+        """
+        processed = self._process_response(retries.endpoint, response, retries.cacheable)
+        if processed.status_code != 304 or retries.headers is self._headers:
+            return processed
+        # The cached body was evicted after its validators were sent: ask for the whole body
+        # instead.
+        retries.headers = self._headers
+        return None
+
+    @staticmethod
+    def _cacheable(method: str, spec: Endpoint or None) -> bool:
+        """
+        Tell whether the responses of a request may be coalesced and revalidated.
+
+        Args:
+            method (str): HTTP method
+            spec (Endpoint): the registered endpoint, None to decide from the method
+
+        Returns:
+            bool: True for cacheable endpoints, and GET requests outside of the registry
+        """
+        return spec.cacheable if spec is not None else method == "GET"
+
+    @staticmethod
+    def _budget_allows(seconds: float = 0.0) -> bool:
+        """
+        Check whether the time budget of the call outlasts a wait.
+
+        Args:
+            seconds (float): the wait
+
+        Returns:
+            bool: True outside of any budget or if more than `seconds` are left
+        """
+        budget = remaining_budget()
+        return budget is None or budget > seconds
+
+    def _request_timeout(self):
+        """
+        The timeout of the next request, capped to the time left of the call budget. With
+        adaptive timeouts, the read timeout is the one derived for the endpoint being called.
+
+        Returns:
+            tuple or float: (connect, read) timeout in seconds
+        """
+        timeout = self.timeout
+        if self.adaptive_timeouts is not None:
+            timeout = self.adaptive_timeouts.timeout(current_endpoint(), timeout)
+        return budget_timeout(timeout, remaining_budget())
+
+    def _observe_latency(self, latency: float) -> None:
+        """
+        Record the response time of a request to the endpoint being called.
+
+        Args:
+            latency (float): response time in seconds
+        """
+        key = current_endpoint()
+        if self.adaptive_timeouts is not None and key is not None:
+            self.adaptive_timeouts.observe(key, latency)
+
+    def _observe_timeout(self, timeout) -> None:
+        """
+        Record a request that timed out waiting for its response as one answered at its read
+        timeout. The response time is at least that long, so counting it lets the timeout of
+        an endpoint that slowed down rise again instead of timing every request out.
+
+        Args:
+            timeout (tuple or float): the (connect, read) or single timeout of the request
+        """
+        read = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read is not None:
+            self._observe_latency(read)
+
+    def _request_headers(self, endpoint: str, cacheable: bool) -> dict:
+        """
+        Build the headers of a request, adding cache validators to cacheable requests.
+
+        Args:
+            endpoint (str): API endpoint
+            cacheable (bool): whether the response may be revalidated
+
+        Returns:
+            dict: request headers
+        """
+        if self.conditional_cache is None or not cacheable:
+            return self._headers
+        validators = self.conditional_cache.conditional_headers(self.BASE_URL + endpoint,
+                                                                self._headers)
+        return {**self._headers, **validators} if validators else self._headers
+
+    def _before_attempt(self, endpoint: str) -> float:
+        """
+        Admit a request attempt through the circuit breaker and the rate limiter.
+
+        Args:
+            endpoint (str): API endpoint
+
+        Returns:
+            float: seconds to wait before sending the attempt
+
+        Raises:
+            CircuitOpenError: if the breaker of the endpoint family is open
+        """
+        if self.circuit_breakers is not None:
+            family = endpoint_family(endpoint)
+            breaker = self.circuit_breakers.get(family)
+            if not breaker.allow():
+                raise CircuitOpenError(family, breaker.retry_in, url=self.BASE_URL + endpoint)
+        if self.rate_limiter is not None:
+            return self.rate_limiter.reserve()
+        return 0.0
+
+    def _after_attempt(self, endpoint: str,
+                       response=None,
+                       error: Exception or None = None) -> None:
+        """
+        Feed the outcome of a request attempt to the circuit breaker and the rate limiter.
+
+        Args:
+            endpoint (str): API endpoint
+            response: the response received
+            error (Exception): the transport error raised
+        """
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.record(endpoint_family(endpoint), response, error)
+        if self.rate_limiter is not None and response is not None:
+            self.rate_limiter.update(response)
+
+    def _abandon_attempt(self, endpoint: str) -> None:
+        """
+        Release what `_before_attempt` took for an attempt whose outcome is unknown.
+
+        Args:
+            endpoint (str): API endpoint
+        """
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.get(endpoint_family(endpoint)).release_probe()
+
+    def _process_response(self, endpoint: str,
+                          response: requests.Response,
+                          cacheable: bool) -> requests.Response:
+        """
+        Post-process the final response of a request, checking the login on the first one and
+        replaying cached bodies on 304.
+
+        Args:
+            endpoint (str): API endpoint
+            response (requests.Response): the final response
+            cacheable (bool): whether the response may be revalidated
+
+        Returns:
+            response: requests.Response
+
+        Raises:
+            CircleCIError: if login validation is pending and the token is rejected
+        """
+        if self._login_pending:
+            self._check_login(response)
+        if self.conditional_cache is None or not cacheable:
+            return response
+        return self.conditional_cache.process(self.BASE_URL + endpoint, response,
+                                              self.json_codec, self._headers)
+
+    @contextmanager
+    def _priority_slot(self, endpoint: str):
+        """
+        Hold a slot of the scheduler for the priority of the current context.
+
+        Args:
+            endpoint (str): API endpoint
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent waiting for a slot
+        """
+        scheduler = self.scheduler
+        if scheduler is None:
+            yield
+            return
+        priority = current_priority()
+        if not scheduler.acquire(priority, timeout=remaining_budget()):
+            raise DeadlineExceededError(url=self.BASE_URL + endpoint)
+        try:
+            yield
+        finally:
+            scheduler.release(priority)
+
+    def _send_scheduled(self, method: str,  # pylint: disable=too-many-arguments
+                        endpoint: str,
+                        payload: dict or None = None,
+                        headers: dict or None = None,
+                        stack: ExitStack or None = None) -> requests.Response:
+        """
+        Send one attempt of a request once the scheduler grants a slot to its priority and the
+        circuit breaker and rate limiter admit it. The slot is taken first, so that the
+        requests of higher priorities also reserve the tokens of the rate limiter first.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers
+            stack (ExitStack): the stack holding a streamed response open, None to read the
+                whole response
+
+        Returns:
+            response: requests.Response
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent waiting for a slot or a token
+            CircuitOpenError: if the breaker of the endpoint family is open
+        """
+        with self._priority_slot(endpoint):
+            wait = self._before_attempt(endpoint)
+            try:
+                if wait > 0:
+                    self._check_budget(endpoint, wait)
+                    time.sleep(wait)
+                return self._send_limited(method, endpoint, payload, headers, stack)
+            except self.transport.errors:
+                raise
+            except BaseException:
+                # No outcome to record: the attempt timed out waiting for a token or a
+                # concurrency slot, or failed with an error that is not retried.
+                self._abandon_attempt(endpoint)
+                raise
+
+    def _send_limited(self, method: str,  # pylint: disable=too-many-arguments
+                      endpoint: str,
+                      payload: dict or None = None,
+                      headers: dict or None = None,
+                      stack: ExitStack or None = None) -> requests.Response:
+        """
+        Send one attempt of a request once the concurrency limiter grants it a slot.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers
+            stack (ExitStack): the stack holding a streamed response open, None to read the
+                whole response
+
+        Returns:
+            response: requests.Response
+
+        Raises:
+            DeadlineExceededError: if the time budget is spent waiting for a slot
+        """
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return self._send_attempt(method, endpoint, payload, headers, stack)
+        if not limiter.acquire(timeout=remaining_budget()):
+            raise DeadlineExceededError(url=self.BASE_URL + endpoint)
+        started = time.monotonic()
+        response = None
+        try:
+            response = self._send_attempt(method, endpoint, payload, headers, stack)
+            return response
+        finally:
+            limiter.release(time.monotonic() - started, failed=congestion_signal(response))
+
+    def _send_attempt(self, method: str,  # pylint: disable=too-many-arguments
+                      endpoint: str,
+                      payload: dict or None = None,
+                      headers: dict or None = None,
+                      stack: ExitStack or None = None) -> requests.Response:
+        """
+        Send one attempt of a request, hedging GET requests when a hedge policy is set.
+        Streamed requests are not hedged.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers
+            stack (ExitStack): the stack holding a streamed response open, None to read the
+                whole response
+
+        Returns:
+            response: requests.Response
+        """
+        if self.hedge_policy is None or method != "GET" or stack is not None:
+            return self._send(method, endpoint, payload, headers, stack)
+        return self._send_hedged(endpoint, headers)
+
+    def _send_hedged(self, endpoint: str, headers: dict or None = None) -> requests.Response:
+        """
+        Send a GET request, duplicating it if it is not answered within the hedge delay.
+
+        Each copy is sent from a thread of its own so that the calling thread can return the
+        first response, and the hedge is admitted by the circuit breaker and the rate limiter
+        like any attempt.
+
+        Args:
+            endpoint (str): API endpoint
+            headers (dict): request headers
+
+        Returns:
+            response: the first successful response of the request copies
+        """
+        policy = self.hedge_policy
+        policy.start()
+
+        def timed_send():
+            started = time.monotonic()
+            response = self._send("GET", endpoint, headers=headers)
+            policy.observe(time.monotonic() - started)
+            return response
+
+        primary = _in_thread(timed_send)
+        try:
+            return primary.result(timeout=policy.delay())
+        except futures.TimeoutError:
+            wait = self._admit_hedge(endpoint, policy)
+            if wait is None:
+                return primary.result()
+
+        def hedged_send():
+            time.sleep(wait)
+            return timed_send()
+
+        self.log.info('Hedging GET %s.', endpoint)
+        hedge = _in_thread(hedged_send)
+        done, _ = futures.wait({primary, hedge}, return_when=futures.FIRST_COMPLETED)
+        succeeded = [copy for copy in (primary, hedge) if copy in done and copy.exception() is None]
+        if not succeeded:
+            futures.wait({primary, hedge})
+            succeeded = [copy for copy in (primary, hedge) if copy.exception() is None]
+        # The error of the primary request is raised when both copies fail.
+        winner = succeeded[0] if succeeded else primary
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(lambda copy: self._record_lost_copy(endpoint, copy))
+        return winner.result()
+
+    def _admit_hedge(self, endpoint: str, policy: HedgePolicy) -> float or None:
+        """
+        Admit a hedge through the hedge budget, the circuit breaker and the rate limiter.
+
+        Args:
+            endpoint (str): API endpoint
+            policy (HedgePolicy): the hedge policy
+
+        Returns:
+            float or None: seconds to wait before sending the hedge, None if it is not sent
+        """
+        if not policy.try_hedge():
+            return None
+        try:
+            wait = self._before_attempt(endpoint)
+        except CircuitOpenError:
+            return None
+        if not self._budget_allows(wait):
+            self._abandon_attempt(endpoint)
+            return None
+        return wait
+
+    def _record_lost_copy(self, endpoint: str, copy) -> None:
+        """
+        Record the outcome of the copy of a hedged request whose response was not used.
+
+        Args:
+            endpoint (str): API endpoint
+            copy: the future of the copy
+        """
+        error = None if copy.cancelled() else copy.exception()
+        if copy.cancelled() or (error is not None and not isinstance(error,
+                                                                     self.transport.errors)):
+            self._abandon_attempt(endpoint)
+        elif error is not None:
+            self._after_attempt(endpoint, error=error)
+        else:
+            self._after_attempt(endpoint, response=copy.result())
+
+    def _send(self, method: str,  # pylint: disable=too-many-arguments
+              endpoint: str,
+              payload: dict or None = None,
+              headers: dict or None = None,
+              stack: ExitStack or None = None) -> requests.Response:
+        """
+        Send a single request through the transport.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            payload (dict): request payload
+            headers (dict): request headers, defaults to the client headers
+            stack (ExitStack): the stack holding a streamed response open, None to read the
+                whole response
+
+        Returns:
+            response: requests.Response, or a StreamedResponse when `stack` is given
+        """
+        timeout = self._request_timeout()
+        started = time.monotonic()
+        try:
+            if stack is None:
+                response = self.transport.request(method, self.BASE_URL + endpoint,
+                                                  headers=headers or self._headers,
+                                                  payload=payload,
+                                                  timeout=timeout)
+            else:
+                response = stack.enter_context(self.transport.stream(
+                    method, self.BASE_URL + endpoint, headers=headers or self._headers,
+                    timeout=timeout))
+        except self.transport.timeout_errors:
+            self._observe_timeout(timeout)
+            raise
+        # Other failed attempts are left out: how long a request took to fail says little
+        # about how long the endpoint takes to answer.
+        self._observe_latency(time.monotonic() - started)
+        return response
 
     def _get(self, endpoint: str) -> requests.Response:
         """
@@ -58,9 +1001,7 @@ class CircleCI:
         Returns:
             response: requests.Response
         """
-        return requests.get(self.BASE_URL + endpoint,
-                            headers=self.__headers,
-                            timeout=self.timeout)
+        return self._request("GET", endpoint)
 
     def _post(self, endpoint: str,
               payload: dict or None = None) -> requests.Response:
@@ -74,10 +1015,7 @@ class CircleCI:
         Returns:
             response: requests.Response
         """
-        return requests.post(self.BASE_URL + endpoint,
-                             headers=self.__headers,
-                             json=payload,
-                             timeout=self.timeout)
+        return self._request("POST", endpoint, payload)
 
     def _delete(self, endpoint: str) -> requests.Response:
         """
@@ -89,9 +1027,7 @@ class CircleCI:
         Returns:
             response: requests.Response
         """
-        return requests.delete(self.BASE_URL + endpoint,
-                               headers=self.__headers,
-                               timeout=self.timeout)
+        return self._request("DELETE", endpoint)
 
     def _patch(self, endpoint: str,
                payload: dict) -> requests.Response:
@@ -105,10 +1041,7 @@ class CircleCI:
         Returns:
             response: requests.Response
         """
-        return requests.patch(self.BASE_URL + endpoint,
-                              headers=self.__headers,
-                              json=payload,
-                              timeout=self.timeout)
+        return self._request("PATCH", endpoint, payload)
 
     def _put(self, endpoint: str,
              payload: dict) -> requests.Response:
@@ -122,10 +1055,7 @@ class CircleCI:
         Returns:
             response: requests.Response
         """
-        return requests.put(self.BASE_URL + endpoint,
-                            headers=self.__headers,
-                            json=payload,
-                            timeout=self.timeout)
+        return self._request("PUT", endpoint, payload)
 
     @staticmethod
     def response_validation(func):
@@ -142,27 +1072,140 @@ class CircleCI:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             self.log.info('Validating response...')
-            response = func(self, *args, **kwargs)
-            response_data = response.json()
-            if isinstance(response_data, dict):
-                response_data.update(
-                    {'metadata': {'status_code': response.status_code, 'url': response.url}})
-            elif isinstance(response_data, list):
-                response_data = {'response': response_data,
-                                 'metadata': {'status_code': response.status_code,
-                                              'url': response.url}}
-            if response.status_code in range(200, 299):
-                self.log.info('Response validated successfully.')
-                return dict_to_circleci_resource(response_data)
-            self.log.error('Failed to validate response.')
-            raise CircleCIError('Failed to validate response.', response.status_code,
-                                response=response)
+            return self._handle_response(  # pylint: disable=protected-access
+                func(self, *args, **kwargs))
 
         return wrapper
 
+    def api_endpoint(func):  # pylint: disable=no-self-argument
+        """
+        Decorator generating an endpoint method from its entry in `ENDPOINTS`. The decorated
+        function only declares the signature and the documentation of the method.
+
+        Args:
+            func (function): function to decorate
+
+        Returns:
+            function: the endpoint method
+
+        Raises:
+            TypeError: if the endpoint uses arguments the function does not declare, or if
+                       the function declares `stream` for an endpoint that is not streamable
+        """
+        name = func.__name__  # pylint: disable=no-member
+        spec = ENDPOINTS[name]
+        signature = inspect.signature(func)
+        missing = spec.arguments - set(signature.parameters)
+        if missing:
+            raise TypeError(f"{name}() does not declare {sorted(missing)}.")
+        if "stream" in signature.parameters and not spec.streamable:
+            raise TypeError(f"{name}() cannot stream its response.")
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            if bound.arguments.get("stream"):
+                return self._stream(spec, bound.arguments)  # pylint: disable=protected-access
+            self.log.info('Validating response...')
+            return self._handle_response(  # pylint: disable=protected-access
+                self._call(spec, bound.arguments))  # pylint: disable=protected-access
+
+        return wrapper
+
+    def _handle_response(self, response: requests.Response) -> CircleCIPropertyHolder:
+        """
+        Hook applied to the value returned by every endpoint method.
+
+        Args:
+            response (requests.Response): the response of the endpoint
+
+        Returns:
+            CircleCIPropertyHolder: the converted response
+        """
+        return self._build_resource(response)
+
+    def _build_resource(self, response) -> CircleCIPropertyHolder:
+        """
+        Convert a response from the CircleCI API into a CircleCIPropertyHolder.
+
+        Args:
+            response (requests.Response): the response to convert
+
+        Returns:
+            CircleCIPropertyHolder: the converted response
+
+        Raises:
+            CircleCIError: if the response status is not successful
+        """
+        response_data = decode_response(response, self.json_codec)
+        metadata = {'status_code': response.status_code, 'url': str(response.url)}
+        transfer = getattr(response, 'transfer', None)
+        if isinstance(transfer, Transfer):
+            metadata.update({'wire_bytes': transfer.wire_bytes,
+                             'decoded_bytes': transfer.decoded_bytes})
+        if isinstance(response_data, dict):
+            response_data.update({'metadata': metadata})
+        elif isinstance(response_data, list):
+            response_data = {'response': response_data, 'metadata': metadata}
+        if response.status_code in range(200, 299):
+            self.log.info('Response validated successfully.')
+            return dict_to_circleci_resource(response_data)
+        self.log.error('Failed to validate response.')
+        raise CircleCIError('Failed to validate response.', response.status_code,
+                            response=response)
+
+    def _stream(self, spec: Endpoint, arguments: dict):
+        """
+        Perform the request of a streamable endpoint, yielding its items one at a time as they
+        are parsed from the response body.
+
+        Streamed requests go through the same retries, breakers, limiters and scheduler as the
+        others until the response arrives, but are neither coalesced nor cached.
+
+        Args:
+            spec (Endpoint): the endpoint
+            arguments (dict): the arguments of the endpoint method
+
+        Returns:
+            Iterator[CircleCIPropertyHolder]: the items of the response
+
+        Raises:
+            CircleCIError: if the response status is not successful
+        """
+        with ExitStack() as stack:
+            response = self._request(spec.method, spec.path(arguments), spec.body(arguments),
+                                     spec, stack)
+            if response.status_code not in range(200, 299):
+                self._build_resource(response.read())
+            metadata = {'status_code': response.status_code, 'url': str(response.url)}
+            parser = ItemParser()
+            for chunk in response.chunks:
+                for item in parser.feed(chunk):
+                    yield self._build_item(item, metadata)
+            for item in parser.close():
+                yield self._build_item(item, metadata)
+
+    @staticmethod
+    def _build_item(item, metadata: dict) -> CircleCIPropertyHolder:
+        """
+        Convert an item of a streamed response into a CircleCIPropertyHolder.
+
+        Args:
+            item: the parsed item
+            metadata (dict): the metadata of the response
+
+        Returns:
+            CircleCIPropertyHolder: the converted item
+        """
+        if not isinstance(item, dict):
+            return dict_to_circleci_resource(item, is_first_iteration=False)
+        item['metadata'] = dict(metadata)
+        return dict_to_circleci_resource(item)
+
     # -------------------------------- Context Endpoints -------------------------------- #
 
-    @response_validation
+    @api_endpoint
     def create_context(self, name: str,
                        owner_id: str,
                        owner_type: str = "organization") -> CircleCIPropertyHolder or Response:
@@ -179,46 +1222,31 @@ class CircleCI:
         \"type\":\"organization\"}}"
 
         """
-        endpoint = "/api/v2/context"
-        payload = {
-            "name": name,
-            "owner": {
-                "id": owner_id,
-                "type": owner_type
-            }
-        }
-        return self._post(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def list_contexts(self) -> CircleCIPropertyHolder or Response:
         """
         List all contexts for the owner.
         :return: list of contexts
         """
-        endpoint = "/api/v2/context"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def delete_context(self, context_id: str) -> CircleCIPropertyHolder or Response:
         """
         Delete a context.
         :param context_id: context id (uuid)
         :return: response (json)
         """
-        endpoint = f"/api/v2/context/{context_id}"
-        return self._delete(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_context(self, context_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get a context.
         :param context_id: context id (uuid)
         :return: context dict (json)
         """
-        endpoint = f"/api/v2/context/{context_id}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def list_environment_variables_in_context(
             self, context_id: str,
             page_token: str or None = None) -> CircleCIPropertyHolder or Response:
@@ -228,11 +1256,8 @@ class CircleCI:
         :param page_token: page token (str)
         :return: list of environment variables
         """
-        endpoint = f"/api/v2/context/{context_id}/environment-variable" \
-                   f"{'?page-token=' + page_token if page_token else ''}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def remove_environment_variable_from_context(
             self, context_id: str,
             env_var_name: str) -> CircleCIPropertyHolder or Response:
@@ -242,10 +1267,8 @@ class CircleCI:
         :param env_var_name: environment variable name (str)
         :return: response
         """
-        endpoint = f"/api/v2/context/{context_id}/environment-variable/{env_var_name}"
-        return self._delete(endpoint)
 
-    @response_validation
+    @api_endpoint
     def add_or_update_env_variable(self, context_id: str,
                                    env_var_name: str,
                                    env_var_value: str) -> CircleCIPropertyHolder or Response:
@@ -256,23 +1279,16 @@ class CircleCI:
         :param env_var_value: environment variable value (str)
         :return: response
         """
-        endpoint = f"/api/v2/context/{context_id}/environment-variable/{env_var_name}"
-        payload = {
-            "value": env_var_value
-        }
-        return self._put(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def get_context_restrictions(self, context_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get the restrictions for a context.
         :param context_id: context id (uuid)
         :return: response
         """
-        endpoint = f"/api/v2/context/{context_id}/restrictions"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_context_restriction(self, context_id: str,
                                    restriction_type: str,
                                    restriction_value: str) -> CircleCIPropertyHolder or Response:
@@ -283,14 +1299,8 @@ class CircleCI:
         :param restriction_value: restriction value (str)
         :return: response
         """
-        endpoint = f"/api/v2/context/{context_id}/restrictions"
-        payload = {
-            "restriction_type": restriction_type,
-            "restriction_value": restriction_value
-        }
-        return self._post(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def delete_context_restriction(self, context_id: str,
                                    restriction_id: str) -> CircleCIPropertyHolder or Response:
         """
@@ -299,51 +1309,55 @@ class CircleCI:
         :param restriction_id: restriction id (uuid)
         :return: response
         """
-        endpoint = f"/api/v2/context/{context_id}/restrictions/{restriction_id}"
-        return self._delete(endpoint)
 
     # -------------------------------- User Endpoints -------------------------------- #
 
-    @response_validation
-    def get_current_user_information(self) -> CircleCIPropertyHolder or Response:
+    def get_current_user_information(self,
+                                     refresh: bool = False) -> CircleCIPropertyHolder or Response:
         """
-        Get information about the user.
+        Get information about the user. The result is cached by the client.
+        :param refresh: fetch the information again instead of using the cache (bool)
         :return: user information
         """
-        endpoint = "/api/v2/me"
-        return self._get(endpoint)
+        if refresh or self._current_user is None:
+            self._current_user = self._get_current_user_information()
+        return self._current_user
 
     @response_validation
-    def get_user_projects(self) -> CircleCIPropertyHolder or Response:
+    def _get_current_user_information(self) -> CircleCIPropertyHolder or Response:
+        """
+        Fetch information about the user.
+        :return: user information
+        """
+        return self._call(ENDPOINTS["get_current_user_information"], {})
+
+    @api_endpoint
+    def get_user_projects(self, *,
+                          stream: bool = False) -> CircleCIPropertyHolder or Response:
         """
         Get all projects for the user.
-        :return: user projects
+        :param stream: yield the projects one at a time as they are received (bool)
+        :return: user projects, or an iterator of projects when streaming
         """
-        endpoint = "/api/v1.1/projects"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_user_collaborations(self) -> CircleCIPropertyHolder or Response:
         """
         Get all collaborations for the user.
         :return: user collaborations
         """
-        endpoint = "/api/v2/me/collaborations"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_user_information(self, user_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get information about a user.
         :param user_id: user id (uuid)
         :return: user information
         """
-        endpoint = f"/api/v2/user/{user_id}"
-        return self._get(endpoint)
 
     # -------------------------------- Pipeline Endpoints -------------------------------- #
 
-    @response_validation
+    @api_endpoint
     def get_list_of_pipelines_user_follow(self, org_slug: str or None = None,
                                           page_token: str or None = None,
                                           mine: bool = False) -> CircleCIPropertyHolder or Response:
@@ -351,16 +1365,8 @@ class CircleCI:
         Get list of pipelines user is following.
         :return: list of pipelines
         """
-        params = {
-            "org-slug": org_slug,
-            "page-token": page_token,
-            "mine": "true" if mine else None
-        }
-        query_string = "&".join(f"{k}={v}" for k, v in params.items() if v)
-        endpoint = f"/api/v2/pipeline{'?' + query_string if query_string else ''}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def continue_pipeline(self, continuation_key: str,
                           configuration: str,
                           parameters: dict) -> CircleCIPropertyHolder or Response:
@@ -371,45 +1377,32 @@ class CircleCI:
         :param parameters: parameters (dict)
         :return: response
         """
-        endpoint = "/api/v2/pipeline/continue"
-        payload = {
-            "continuation-key": continuation_key,
-            "configuration": configuration,
-            "parameters": parameters
-        }
-        return self._post(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def get_pipeline_by_id(self, pipeline_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get a pipeline by id.
         :param pipeline_id: pipeline id (uuid)
         :return: pipeline
         """
-        endpoint = f"/api/v2/pipeline/{pipeline_id}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_pipeline_config_by_id(self, pipeline_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get the configuration for a pipeline by id.
         :param pipeline_id: pipeline id (uuid)
         :return: pipeline configuration
         """
-        endpoint = f"/api/v2/pipeline/{pipeline_id}/config"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_pipeline_values_by_id(self, pipeline_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get the values for a pipeline by id.
         :param pipeline_id: pipeline id (uuid)
         :return: pipeline values
         """
-        endpoint = f"/api/v2/pipeline/{pipeline_id}/values"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_pipeline_workflow_by_id(
             self, pipeline_id: str,
             page_token: str or None = None) -> CircleCIPropertyHolder or Response:
@@ -419,34 +1412,226 @@ class CircleCI:
         :param page_token: page token (str)
         :return: pipeline workflow
         """
-        endpoint = f"/api/v2/pipeline/{pipeline_id}/workflow" \
-                   f"{'?page-token=' + page_token if page_token else ''}"
-        return self._get(endpoint)
 
     @response_validation
     def trigger_pipeline(self, project_slug: str,
                          branch: str = None,
                          tag: str = None,
-                         parameters: dict = None) -> CircleCIPropertyHolder or Response:
+                         parameters: dict = None,
+                         *,
+                         reconcile: bool = False) -> CircleCIPropertyHolder or Response:
         """
         Trigger a pipeline.
         :param project_slug: vcs-slug/org-name/repo-name | e.g.: gh/CircleCI-Public/api-preview-docs
         :param branch: branch (str)
         :param tag: tag (str)
         :param parameters: parameters (dict)
+        :param reconcile: retry a trigger lost to a timeout or server error only if no matching
+                          pipeline was created by the current user meanwhile (bool)
         :return: response
         """
         if branch and tag:
             raise CircleCIError(
                 "Both `branch` and `tag` cannot be provided. Please provide only one.")
 
-        endpoint = f"/api/v2/project/{project_slug}/pipeline"
-        payload = {k: v for k, v in
-                   {"branch": branch, "tag": tag, "parameters": parameters or {}}.items() if v}
+        spec = ENDPOINTS["trigger_pipeline"]
+        arguments = {"project_slug": project_slug, "branch": branch, "tag": tag,
+                     "parameters": parameters}
+        endpoint, payload = spec.path(arguments), spec.body(arguments)
+        if reconcile:
+            return self._post_reconciled(project_slug, endpoint, payload)
+        return self._request(spec.method, endpoint, payload, spec)
 
-        return self._post(endpoint, payload)
+    def _post_reconciled(self, project_slug: str,
+                         endpoint: str,
+                         payload: dict) -> requests.Response:
+        """
+        Trigger a pipeline, resending the trigger after a timeout or server error only if the
+        pipelines of the current user show that it was not created.
 
-    @response_validation
+        Only the pipelines created since the first trigger, less `CLOCK_SKEW`, are searched,
+        and the pipeline must be on the branch or tag of the trigger, the default branch of the
+        project when it names neither. Nothing is read before an outcome is ambiguous.
+
+        Args:
+            project_slug (str): project slug
+            endpoint (str): API endpoint of the trigger
+            payload (dict): request payload
+
+        Returns:
+            response: the response of the trigger, or a response holding the pipeline found
+
+        Raises:
+            Exception: the transport error of the last trigger once the retries are exhausted
+        """
+        policy = self.retry_policy.for_endpoint(endpoint, ENDPOINTS["trigger_pipeline"].retry)
+        arguments = {"project_slug": project_slug}
+        expected = None
+        since = time.time() - CLOCK_SKEW
+        attempt = 0
+        while True:
+            response = error = None
+            try:
+                response = self._post(endpoint, payload)
+            except self.transport.errors as transport_error:
+                error = transport_error
+            delay = self._trigger_retry_delay(project_slug, policy, attempt, response, error)
+            if delay is None:
+                return self._trigger_result(response, error)
+            time.sleep(delay)
+            if is_ambiguous(response):
+                if expected is None:
+                    expected = self._expected_trigger(arguments, payload)
+                found = self._triggered_pipeline(
+                    self._call(ENDPOINTS["get_pipeline_triggered_by_current_user"], arguments),
+                    expected, since)
+                if found is not None:
+                    return found
+            attempt += 1
+
+    def _trigger_retry_delay(self, project_slug: str,  # pylint: disable=too-many-arguments
+                             policy: RetryPolicy,
+                             attempt: int,
+                             response,
+                             error: Exception or None) -> float or None:
+        """
+        Decide whether a pipeline trigger is sent again.
+
+        Args:
+            project_slug (str): project slug
+            policy (RetryPolicy): the retry policy of the trigger endpoint
+            attempt (int): the zero-based number of the retry that would follow
+            response: the response of the trigger, None if no response was received
+            error (Exception): the transport error of the trigger
+
+        Returns:
+            float or None: the delay before the next trigger, or None if the trigger succeeded,
+                failed for good or may not be sent again
+        """
+        if response is not None and response.status_code != 429 and not is_ambiguous(response):
+            return None
+        if attempt >= policy.max_retries:
+            return None
+        delay = policy.delay(attempt, response)
+        if delay is None or not self._budget_allows(delay):
+            return None
+        self.log.warning('Pipeline trigger for %s failed (%s), retrying in %.2fs.',
+                         project_slug, error or response.status_code, delay)
+        return delay
+
+    @staticmethod
+    def _trigger_result(response, error: Exception or None) -> requests.Response:
+        """
+        The outcome of the last pipeline trigger sent.
+
+        Args:
+            response: the response of the trigger, None if no response was received
+            error (Exception): the transport error of the trigger
+
+        Returns:
+            response: the response of the trigger
+
+        Raises:
+            Exception: the transport error if no response was received
+        """
+        if error is not None:
+            raise error
+        return response
+
+    def _reconciling(self, response) -> dict:
+        """
+        Decode a response needed to reconcile a pipeline trigger.
+
+        Args:
+            response: the response
+
+        Returns:
+            dict: the decoded response
+
+        Raises:
+            CircleCIError: if the response status is not successful
+        """
+        if response.status_code not in range(200, 299):
+            raise CircleCIError('Cannot reconcile the pipeline trigger.', response.status_code,
+                                response=response)
+        return decode_response(response, self.json_codec)
+
+    def _listed_pipelines(self, response) -> list:
+        """
+        The pipelines of a response listing the pipelines of the current user.
+
+        Args:
+            response: the response listing the pipelines
+
+        Returns:
+            list: the pipelines, newest first
+
+        Raises:
+            CircleCIError: if the pipelines could not be listed
+        """
+        return self._reconciling(response).get('items', [])
+
+    def _expected_trigger(self, arguments: dict, payload: dict) -> dict:
+        """
+        The payload of a trigger with the branch or tag of the pipeline it creates.
+
+        Args:
+            arguments (dict): the path arguments of the project
+            payload (dict): the payload of the trigger
+
+        Returns:
+            dict: the payload, completed with the default branch if it names no branch or tag
+
+        Raises:
+            CircleCIError: if the project could not be read
+        """
+        if "branch" in payload or "tag" in payload:
+            return payload
+        return self._on_default_branch(payload, self._call(ENDPOINTS["get_project"], arguments))
+
+    def _on_default_branch(self, payload: dict, response) -> dict:
+        """
+        Complete the payload of a trigger naming no branch or tag with the branch the API
+        triggers, the default branch of the project.
+
+        Args:
+            payload (dict): the payload of the trigger
+            response: the response holding the project
+
+        Returns:
+            dict: the payload with its branch
+
+        Raises:
+            CircleCIError: if the project could not be read
+        """
+        vcs_info = self._reconciling(response).get('vcs_info') or {}
+        return {**payload, "branch": vcs_info.get('default_branch')}
+
+    def _triggered_pipeline(self, response,
+                            payload: dict,
+                            since: float) -> InMemoryResponse or None:
+        """
+        Find the pipeline created by a trigger among the recent pipelines of the current user.
+
+        Args:
+            response: the response listing the pipelines of the current user
+            payload (dict): the payload of the trigger, with its branch or tag
+            since (float): POSIX timestamp before which the pipeline cannot have been created
+
+        Returns:
+            InMemoryResponse or None: a response holding the pipeline, None if there is none
+
+        Raises:
+            CircleCIError: if the pipelines could not be listed
+        """
+        pipeline = find_triggered_pipeline(self._listed_pipelines(response), payload, since)
+        if pipeline is None:
+            return None
+        self.log.info('Pipeline trigger already created pipeline %s.', pipeline.get('id'))
+        return InMemoryResponse(response.status_code, self.json_codec.encode(pipeline),
+                                url=str(response.url))
+
+    @api_endpoint
     def get_all_pipelines_for_project(
             self, project_slug: str,
             page_token: str or None = None,
@@ -458,16 +1643,8 @@ class CircleCI:
         :param branch: branch (str)
         :return: pipelines
         """
-        params = {
-            "branch": branch,
-            "page-token": page_token,
-        }
-        query_string = "&".join(f"{k}={v}" for k, v in params.items() if v)
-        endpoint = f"/api/v2/project/{project_slug}/pipeline" \
-                   f"{'?' + query_string if query_string else ''}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_pipeline_triggered_by_current_user(
             self, project_slug: str,
             page_token: str or None = None) -> CircleCIPropertyHolder or Response:
@@ -477,11 +1654,8 @@ class CircleCI:
         :param page_token: page token (str)
         :return: pipeline
         """
-        endpoint = f"/api/v2/project/{project_slug}/pipeline/mine" \
-                   f"{'?page-token=' + page_token if page_token else ''}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_pipeline_by_number(self, project_slug: str,
                                pipeline_number: int) -> CircleCIPropertyHolder or Response:
         """
@@ -490,22 +1664,18 @@ class CircleCI:
         :param pipeline_number: pipeline number (int)
         :return: pipeline
         """
-        endpoint = f"/api/v2/project/{project_slug}/pipeline/{pipeline_number}"
-        return self._get(endpoint)
 
     # -------------------------------- Job Endpoints -------------------------------- #
 
-    @response_validation
+    @api_endpoint
     def cancel_job_by_id(self, job_id: str) -> CircleCIPropertyHolder or Response:
         """
         Cancel a job by id.
         :param job_id: job id (uuid)
         :return: response
         """
-        endpoint = f"/api/v2/job/{job_id}/cancel"
-        return self._post(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_job_by_number(self, project_slug: str,
                           job_number: int) -> CircleCIPropertyHolder or Response:
         """
@@ -514,10 +1684,8 @@ class CircleCI:
         :param job_number: job number (int)
         :return: job
         """
-        endpoint = f"/api/v2/project/{project_slug}/job/{job_number}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def cancel_job_by_number(self, project_slug: str,
                              job_number: int) -> CircleCIPropertyHolder or Response:
         """
@@ -526,10 +1694,8 @@ class CircleCI:
         :param job_number: job number (int)
         :return: response
         """
-        endpoint = f"/api/v2/project/{project_slug}/job/{job_number}/cancel"
-        return self._post(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_job_artifacts(self, project_slug: str,
                           job_number: str) -> CircleCIPropertyHolder or Response:
         """
@@ -538,34 +1704,32 @@ class CircleCI:
         :param job_number: job number (int)
         :return: job artifacts
         """
-        endpoint = f"/api/v2/project/{project_slug}/{job_number}/artifacts"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_job_metadata(self, project_slug: str,
-                         job_number: str) -> CircleCIPropertyHolder or Response:
+                         job_number: str,
+                         *,
+                         stream: bool = False) -> CircleCIPropertyHolder or Response:
         """
         Get job metadata.
         :param project_slug: vcs-slug/org-name/repo-name | e.g.: gh/CircleCI-Public/api-preview-docs
         :param job_number: job number (int)
-        :return: job metadata
+        :param stream: yield the test results one at a time as they are received, leaving out
+                       the next page token of the response (bool)
+        :return: job metadata, or an iterator of test results when streaming
         """
-        endpoint = f"/api/v2/project/{project_slug}/{job_number}/tests"
-        return self._get(endpoint)
 
     # -------------------------------- Workflow Endpoints -------------------------------- #
 
-    @response_validation
+    @api_endpoint
     def get_workflow_by_id(self, workflow_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get a workflow by id.
         :param workflow_id: workflow id (uuid)
         :return: workflow
         """
-        endpoint = f"/api/v2/workflow/{workflow_id}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def approve_workflow_job(self, workflow_id: str,
                              job_id: str) -> CircleCIPropertyHolder or Response:
         """
@@ -574,20 +1738,16 @@ class CircleCI:
         :param job_id: job id (uuid)
         :return: response
         """
-        endpoint = f"/api/v2/workflow/{workflow_id}/approve/{job_id}"
-        return self._post(endpoint)
 
-    @response_validation
+    @api_endpoint
     def cancel_workflow(self, workflow_id: str) -> CircleCIPropertyHolder or Response:
         """
         Cancel a running workflow.
         :param workflow_id: workflow id (uuid)
         :return: response
         """
-        endpoint = f"/api/v2/workflow/{workflow_id}/cancel"
-        return self._post(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_workflow_jobs(self, workflow_id: str,
                           page_token: str or None = None) -> CircleCIPropertyHolder or Response:
         """
@@ -596,11 +1756,8 @@ class CircleCI:
         :param page_token: page token (str)
         :return: workflow jobs
         """
-        endpoint = f"/api/v2/workflow/{workflow_id}/job" \
-                   f"{'?page-token=' + page_token if page_token else ''}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def rerun_workflow(self, workflow_id: str,
                        enable_ssh: bool = False,
                        from_failed: bool = False,
@@ -615,19 +1772,10 @@ class CircleCI:
         :param sparse_tree: sparse tree (bool)
         :return: response
         """
-        endpoint = f"/api/v2/workflow/{workflow_id}/rerun"
-        payload = {k: v for k, v in {
-            "enable_ssh": enable_ssh,
-            "from_failed": from_failed,
-            "jobs": jobs,
-            "sparse_tree": sparse_tree
-        }.items() if v is not None}
-
-        return self._post(endpoint, payload)
 
     # -------------------------------- Webhook Endpoints -------------------------------- #
 
-    @response_validation
+    @api_endpoint
     def get_webhooks(self, scope_id: str,
                      scope_type: str) -> CircleCIPropertyHolder or Response:
         """
@@ -636,10 +1784,8 @@ class CircleCI:
         :param scope_type: scope type (str)
         :return: webhooks
         """
-        endpoint = f"/api/v2/webhook?scope-id={scope_id}&scope-type={scope_type}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_outbound_webhook(self, name: str,
                                 events: list,
                                 url: str,
@@ -656,28 +1802,16 @@ class CircleCI:
         :param scope: scope (dict)
         :return: response
         """
-        endpoint = "/api/v2/webhook"
-        payload = {
-            "name": name,
-            "events": events,
-            "url": url,
-            "verify-tls": verify_tls,
-            "signing-secret": signing_secret,
-            "scope": scope
-        }
-        return self._post(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def get_webhook_by_id(self, webhook_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get a webhook by id.
         :param webhook_id: webhook id (uuid)
         :return: webhook
         """
-        endpoint = f"/api/v2/webhook/{webhook_id}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def update_webhook_by_id(self, webhook_id: str,
                              name: str,
                              events: list,
@@ -694,29 +1828,18 @@ class CircleCI:
         :param signing_secret: signing secret (str)
         :return: response
         """
-        endpoint = f"/api/v2/webhook/{webhook_id}"
-        payload = {
-            "name": name,
-            "events": events,
-            "url": url,
-            "verify-tls": verify_tls,
-            "signing-secret": signing_secret
-        }
-        return self._put(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def delete_webhook_by_id(self, webhook_id: str) -> CircleCIPropertyHolder or Response:
         """
         Delete a webhook by id.
         :param webhook_id: webhook id (uuid)
         :return: response
         """
-        endpoint = f"/api/v2/webhook/{webhook_id}"
-        return self._delete(endpoint)
 
     # ------------------------- OIDC Token Management Endpoints ------------------------- #
 
-    @response_validation
+    @api_endpoint
     def delete_org_level_claims(self, org_id: str,
                                 claims: str) -> CircleCIPropertyHolder or Response:
         """
@@ -725,20 +1848,16 @@ class CircleCI:
         :param claims: comma separated list of claims to delete (str)
         :return: response
         """
-        endpoint = f"/api/v2/org/{org_id}/oidc-custom-claims?claims={claims}"
-        return self._delete(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_org_level_claims(self, org_id: str) -> CircleCIPropertyHolder or Response:
         """
         Get organization level claims.
         :param org_id: organization id (uuid)
         :return: claims
         """
-        endpoint = f"/api/v2/org/{org_id}/oidc-custom-claims"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_or_update_org_level_claims(self, org_id: str,
                                           audience: list,
                                           ttl: str) -> CircleCIPropertyHolder or Response:
@@ -749,15 +1868,8 @@ class CircleCI:
         :param ttl: ttl (str)
         :return: response
         """
-        endpoint = f"/api/v2/org/{org_id}/oidc-custom-claims"
-        payload = {k: v for k, v in {
-            "audience": audience,
-            "ttl": ttl
-        }.items() if v is not None}
 
-        return self._patch(endpoint, payload)
-
-    @response_validation
+    @api_endpoint
     def delete_project_level_claims(self, org_id: str,
                                     project_id: str,
                                     claims: str) -> CircleCIPropertyHolder or Response:
@@ -768,10 +1880,8 @@ class CircleCI:
         :param claims: comma separated list of claims to delete (str)
         :return: response
         """
-        endpoint = f"/api/v2/org/{org_id}/project/{project_id}/oidc-custom-claims?claims={claims}"
-        return self._delete(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_project_level_claims(self, org_id: str,
                                  project_id: str) -> CircleCIPropertyHolder or Response:
         """
@@ -780,10 +1890,8 @@ class CircleCI:
         :param project_id: project id (uuid)
         :return: claims
         """
-        endpoint = f"/api/v2/org/{org_id}/project/{project_id}/oidc-custom-claims"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_or_update_project_level_claims(self, org_id: str,
                                               project_id: str,
                                               audience: list,
@@ -796,27 +1904,18 @@ class CircleCI:
         :param ttl: ttl (str)
         :return: response
         """
-        endpoint = f"/api/v2/org/{org_id}/project/{project_id}/oidc-custom-claims"
-        payload = {k: v for k, v in {
-            "audience": audience,
-            "ttl": ttl
-        }.items() if v is not None}
-
-        return self._patch(endpoint, payload)
 
     # -------------------------------- Project Endpoints -------------------------------- #
 
-    @response_validation
+    @api_endpoint
     def get_project(self, project_slug: str) -> CircleCIPropertyHolder or Response:
         """
         Get a project.
         :param project_slug: vcs-slug/org-name/repo-name | e.g.: gh/CircleCI-Public/api-preview-docs
         :return: project
         """
-        endpoint = f"/api/v2/project/{project_slug}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_checkout_key(self, project_slug: str,
                             key_type: str) -> CircleCIPropertyHolder or Response:
         """
@@ -825,13 +1924,8 @@ class CircleCI:
         :param key_type: key_type (str)
         :return: response
         """
-        endpoint = f"/api/v2/project/{project_slug}/checkout-key"
-        payload = {
-            "type": key_type
-        }
-        return self._post(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def get_all_checkout_keys(self, project_slug: str,
                               digest: str) -> CircleCIPropertyHolder or Response:
         """
@@ -840,11 +1934,8 @@ class CircleCI:
         :param digest: digest (str)
         :return: checkout keys
         """
-        endpoint = f"/api/v2/project/{project_slug}/checkout-key" \
-                   f"{'?digest=' + digest if digest else ''}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def delete_checkout_key(self, project_slug: str,
                             fingerprint: str) -> CircleCIPropertyHolder or Response:
         """
@@ -853,10 +1944,8 @@ class CircleCI:
         :param fingerprint: fingerprint (str)
         :return: response
         """
-        endpoint = f"/api/v2/project/{project_slug}/checkout-key/{fingerprint}"
-        return self._delete(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_checkout_key(self, project_slug: str,
                          fingerprint: str) -> CircleCIPropertyHolder or Response:
         """
@@ -865,10 +1954,8 @@ class CircleCI:
         :param fingerprint: fingerprint (str)
         :return: checkout key
         """
-        endpoint = f"/api/v2/project/{project_slug}/checkout-key/{fingerprint}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_env_var(self, project_slug: str,
                        name: str,
                        value: str) -> CircleCIPropertyHolder or Response:
@@ -879,24 +1966,16 @@ class CircleCI:
         :param value: value (str)
         :return: response
         """
-        endpoint = f"/api/v2/project/{project_slug}/envvar"
-        payload = {
-            "name": name,
-            "value": value
-        }
-        return self._post(endpoint, payload)
 
-    @response_validation
+    @api_endpoint
     def get_all_env_vars(self, project_slug: str) -> CircleCIPropertyHolder or Response:
         """
         Get all environment variables.
         :param project_slug: vcs-slug/org-name/repo-name | e.g.: gh/CircleCI-Public/api-preview-docs
         :return: environment variables
         """
-        endpoint = f"/api/v2/project/{project_slug}/envvar"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def delete_env_var(self, project_slug: str,
                        name: str) -> CircleCIPropertyHolder or Response:
         """
@@ -905,10 +1984,8 @@ class CircleCI:
         :param name: name (str)
         :return: response
         """
-        endpoint = f"/api/v2/project/{project_slug}/envvar/{name}"
-        return self._delete(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_masked_env_var(self, project_slug: str,
                            name: str) -> CircleCIPropertyHolder or Response:
         """
@@ -917,10 +1994,8 @@ class CircleCI:
         :param name: name (str)
         :return: masked environment variable
         """
-        endpoint = f"/api/v2/project/{project_slug}/envvar/{name}"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def create_new_project(self, vcs_type: str,
                            org_name: str,
                            repo_name: str) -> CircleCIPropertyHolder or Response:
@@ -931,10 +2006,8 @@ class CircleCI:
         :param repo_name: repository name (str)
         :return: response
         """
-        endpoint = f"/api/v2/project/{vcs_type}/{org_name}/{repo_name}"
-        return self._post(endpoint)
 
-    @response_validation
+    @api_endpoint
     def get_project_setting(self, vcs_type: str,
                             org_name: str,
                             repo_name: str) -> CircleCIPropertyHolder or Response:
@@ -945,10 +2018,8 @@ class CircleCI:
         :param repo_name: repository name (str)
         :return: response
         """
-        endpoint = f"/api/v2/project/{vcs_type}/{org_name}/{repo_name}/settings"
-        return self._get(endpoint)
 
-    @response_validation
+    @api_endpoint
     def update_project_setting(self, vcs_type: str,
                                org_name: str,
                                repo_name: str,
@@ -961,28 +2032,30 @@ class CircleCI:
         :param settings: settings (dict)
         :return: response
         """
-        endpoint = f"/api/v2/project/{vcs_type}/{org_name}/{repo_name}/settings"
-        payload = {
-            "advanced": settings
-        }
-        return self._patch(endpoint, payload)
 
     # -------------------------------- Custom Methods -------------------------------- #
 
-    def get_last_build_artifacts_by_project_name(self, project_slug: str,
-                                                 branch: str) -> CircleCIPropertyHolder or Response:
+    def get_last_build_artifacts_by_project_name(
+            self, project_slug: str,
+            branch: str,
+            deadline: float or None = None) -> CircleCIPropertyHolder or Response:
         """
         Get build artifacts by project name.
 
         Args:
             project_slug (str): project slug
             branch (str): branch name
+            deadline (float): seconds all the underlying requests may take together
 
         Returns:
             CircleCIPropertyHolder or Response: build artifacts urls
+
+        Raises:
+            DeadlineExceededError: if the deadline passes before the artifacts are fetched
         """
-        pipeline_id = self.get_all_pipelines_for_project(project_slug,
-                                                         branch=branch).items[0].id
-        workflow_id = self.get_pipeline_workflow_by_id(pipeline_id).items[0].id
-        job_number = self.get_workflow_jobs(workflow_id).items[0].job_number
-        return self.get_job_artifacts(project_slug, job_number)
+        with time_budget(deadline):
+            pipeline_id = self.get_all_pipelines_for_project(project_slug,
+                                                             branch=branch).items[0].id
+            workflow_id = self.get_pipeline_workflow_by_id(pipeline_id).items[0].id
+            job_number = self.get_workflow_jobs(workflow_id).items[0].job_number
+            return self.get_job_artifacts(project_slug, job_number)
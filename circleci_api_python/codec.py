@@ -0,0 +1,153 @@
+""" JSON codecs used to encode request payloads and decode response bodies. """
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class JSONCodec:
+    """
+    Encodes request payloads and decodes response bodies with the standard `json` module.
+
+    Subclasses plug in faster libraries; `default_codec` picks the fastest one installed.
+    """
+
+    name = "json"
+
+    def encode(self, data) -> bytes:
+        """
+        Encode a request payload.
+
+        Args:
+            data (dict or list): the payload
+
+        Returns:
+            bytes: the UTF-8 encoded JSON document
+        """
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False,
+                          allow_nan=False).encode("utf-8")
+
+    def decode(self, content: bytes or str):
+        """
+        Decode a response body.
+
+        Args:
+            content (bytes or str): the JSON document
+
+        Returns:
+            dict or list: the decoded body
+        """
+        return json.loads(content)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """ JSON codec backed by `orjson`. """
+
+    name = "orjson"
+
+    def encode(self, data) -> bytes:
+        return orjson.dumps(data)  # pylint: disable=no-member
+
+    def decode(self, content: bytes or str):
+        return orjson.loads(content)  # pylint: disable=no-member
+
+
+class MsgspecCodec(JSONCodec):
+    """ JSON codec backed by `msgspec`. """
+
+    name = "msgspec"
+
+    def encode(self, data) -> bytes:
+        return msgspec.json.encode(data)
+
+    def decode(self, content: bytes or str):
+        return msgspec.json.decode(content)
+
+
+class UjsonCodec(JSONCodec):
+    """ JSON codec backed by `ujson`. """
+
+    name = "ujson"
+
+    def encode(self, data) -> bytes:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    def decode(self, content: bytes or str):
+        return ujson.loads(content)
+
+
+# Codecs by name, fastest first, with the module each one needs.
+CODECS = {
+    "orjson": (OrjsonCodec, orjson),
+    "msgspec": (MsgspecCodec, msgspec),
+    "ujson": (UjsonCodec, ujson),
+    "json": (JSONCodec, json),
+}
+
+
+def get_codec(name: str) -> JSONCodec:
+    """
+    Create a codec by name.
+
+    Args:
+        name (str): "orjson", "msgspec", "ujson" or "json"
+
+    Returns:
+        JSONCodec: the codec
+
+    Raises:
+        ValueError: if the codec is unknown or its library is not installed
+    """
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected one of {tuple(CODECS)}.")
+    codec, module = CODECS[name]
+    if module is None:
+        raise ValueError(f"The {name} JSON codec needs `pip install {name}`.")
+    return codec()
+
+
+def default_codec() -> JSONCodec:
+    """
+    Create the fastest codec whose library is installed.
+
+    Returns:
+        JSONCodec: the codec, the standard library one if no faster library is installed
+    """
+    return next(codec() for codec, module in CODECS.values() if module is not None)
+
+
+def decode_response(response, codec: JSONCodec):
+    """
+    Decode the JSON body of a response.
+
+    Responses without a raw body, such as those replayed by the conditional cache, decode
+    themselves through their `json()` method.
+
+    Args:
+        response: the response
+        codec (JSONCodec): the codec decoding raw bodies
+
+    Returns:
+        dict or list: the decoded body
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, str)):
+        return codec.decode(content)
+    return response.json()
@@ -0,0 +1,178 @@
+""" Adaptive concurrency limiting for the CircleCI API client. """
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+def congestion_signal(response) -> bool:
+    """
+    Tell whether the outcome of a request shows the API is overloaded.
+
+    Args:
+        response: the response received, None if the request failed
+
+    Returns:
+        bool: True for failed requests, 429 and 5xx responses
+    """
+    return response is None or response.status_code == 429 or response.status_code >= 500
+
+
+class AdaptiveConcurrencyLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Limits the number of requests in flight with additive-increase/multiplicative-decrease.
+
+    Every successful request raises the limit by `increase / limit`, adding about `increase`
+    slots per round of requests. A request that fails, is throttled (429) or answered with a
+    5xx, or whose smoothed latency exceeds `latency_tolerance` times the lowest recently
+    observed latency, multiplies the limit by `decrease`, at most once per observed round trip.
+    The limiter can be shared by threads and asyncio tasks.
+    """
+
+    def __init__(self, initial_limit: float = 4,
+                 min_limit: float = 1,
+                 max_limit: float = 64,
+                 increase: float = 1.0,
+                 decrease: float = 0.5,
+                 latency_tolerance: float or None = 3.0,
+                 window: int = 100):
+        """
+        Creates an AdaptiveConcurrencyLimiter.
+
+        Args:
+            initial_limit (float): number of requests allowed in flight at first
+            min_limit (float): lower bound of the limit
+            max_limit (float): upper bound of the limit
+            increase (float): slots added per round of successful requests
+            decrease (float): factor applied to the limit on congestion
+            latency_tolerance (float): smoothed latency, relative to the lowest recent latency,
+                                       seen as congestion; None to only react to errors
+            window (int): number of recent latencies the lowest latency is taken from
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max_limit, max(min_limit, initial_limit)))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self._latencies = deque(maxlen=window)
+        self._smoothed = None
+        self._last_decrease = float('-inf')
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """ The number of requests currently holding a slot. """
+        return self._in_flight
+
+    def after_fork(self) -> None:
+        """ Start over with no requests in flight in a forked child. """
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = deque()
+        self._in_flight = 0
+
+    def _take(self) -> bool:
+        if self._in_flight < max(1, int(self.limit)):
+            self._in_flight += 1
+            return True
+        return False
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot if one is free.
+
+        Returns:
+            bool: True if a slot was taken
+        """
+        with self._lock:
+            return self._take()
+
+    def acquire(self, timeout: float or None = None) -> bool:
+        """
+        Block until a slot is free and take it.
+
+        Args:
+            timeout (float): maximum number of seconds to wait, None to wait indefinitely
+
+        Returns:
+            bool: True if a slot was taken, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(self._take, timeout)
+
+    async def acquire_async(self, timeout: float or None = None) -> bool:
+        """
+        Wait without blocking the event loop until a slot is free and take it.
+
+        Args:
+            timeout (float): maximum number of seconds to wait, None to wait indefinitely
+
+        Returns:
+            bool: True if a slot was taken, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        expires = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._take():
+                    return True
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            remaining = None if expires is None else expires - loop.time()
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), remaining)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+    def _wake(self) -> None:
+        """ Wake the threads and tasks waiting for a slot. Called with the lock held. """
+        self._condition.notify_all()
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:  # the event loop of the waiter is closed
+                pass
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """
+        Return a slot and adapt the limit to the outcome of the request.
+
+        Args:
+            latency (float): response time of the request in seconds
+            failed (bool): whether the request failed, was throttled or hit a server error
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            self._latencies.append(latency)
+            self._smoothed = latency if self._smoothed is None else \
+                0.8 * self._smoothed + 0.2 * latency
+            if failed or self._congested():
+                # Only the first congestion signal of a round trip shrinks the limit.
+                if now - self._last_decrease >= self._smoothed:
+                    self.limit = max(self.min_limit, self.limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            self._wake()
+
+    def _congested(self) -> bool:
+        if self.latency_tolerance is None or len(self._latencies) < 2:
+            return False
+        return self._smoothed > self.latency_tolerance * min(self._latencies)
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
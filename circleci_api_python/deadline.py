@@ -0,0 +1,67 @@
+""" Time budgets shared by the requests of composite CircleCI API calls. """
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+# Monotonic time at which the innermost active budget expires.
+_DEADLINE = contextvars.ContextVar("circleci_api_python_deadline", default=None)
+
+
+@contextmanager
+def time_budget(seconds: float or None):
+    """
+    Limit the total time spent by the requests made within the block.
+
+    The budget follows the current thread or asyncio task. Nested budgets never extend the
+    budget of an enclosing block.
+
+    Args:
+        seconds (float): the time budget, None for no limit
+    """
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    if current is not None:
+        expires = min(expires, current)
+    token = _DEADLINE.set(expires)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_budget() -> float or None:
+    """
+    The time left of the innermost active budget.
+
+    Returns:
+        float or None: seconds left, negative once spent, None outside of any budget
+    """
+    expires = _DEADLINE.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def budget_timeout(timeout, budget: float or None):
+    """
+    Cap a request timeout to the time left of a budget.
+
+    Args:
+        timeout (tuple or float): (connect, read) timeout or a single timeout in seconds
+        budget (float): seconds left of the budget, None for no limit
+
+    Returns:
+        tuple or float: the capped timeout
+    """
+    if budget is None:
+        return timeout
+    if timeout is None:
+        return budget
+    if isinstance(timeout, tuple):
+        return tuple(budget if part is None else min(part, budget) for part in timeout)
+    return min(timeout, budget)
@@ -0,0 +1,289 @@
+""" Declarative registry of the CircleCI API endpoints.
+
+Every endpoint method of the client is described by one `Endpoint` of the `ENDPOINTS` table:
+its HTTP method, path template, query parameters, payload shape, retry policy and whether it
+is idempotent and cacheable. Path templates are compiled when this module is imported.
+"""
+from __future__ import annotations
+
+import re
+from urllib.parse import quote, urlencode
+
+from circleci_api_python.retry import RetryPolicy
+
+# Characters left unescaped in path segments (RFC 3986 pchar).
+SEGMENT_SAFE = "!$&'()*+,;=:@"
+# Characters left unescaped in query values.
+QUERY_SAFE = ","
+
+_FIELD = re.compile(r"{(\w+)(?::(path))?}")
+
+
+class Route:
+    """
+    A path template such as "/api/v2/project/{project_slug:path}/pipeline/{pipeline_number}".
+
+    Field values are percent-encoded as a single path segment, except for `:path` fields
+    whose slashes are kept, such as project slugs.
+    """
+
+    __slots__ = ('template', 'fields', '_parts', '_tail')
+
+    def __init__(self, template: str):
+        """
+        Compile a Route.
+
+        Args:
+            template (str): the path template
+        """
+        self.template = template
+        self._parts = []
+        position = 0
+        for match in _FIELD.finditer(template):
+            safe = SEGMENT_SAFE + "/" if match.group(2) else SEGMENT_SAFE
+            self._parts.append((template[position:match.start()], match.group(1), safe))
+            position = match.end()
+        self._tail = template[position:]
+        self.fields = tuple(field for _, field, _ in self._parts)
+
+    def expand(self, arguments: dict) -> str:
+        """
+        Build the path of a request.
+
+        Args:
+            arguments (dict): the values of the fields
+
+        Returns:
+            str: the encoded path
+        """
+        return "".join(literal + quote(str(arguments[field]), safe=safe)
+                       for literal, field, safe in self._parts) + self._tail
+
+
+def _query_value(value):
+    if value is True:
+        return "true"
+    return value if value else None
+
+
+class Endpoint:  # pylint: disable=too-many-instance-attributes
+    """
+    The description of one API endpoint.
+    """
+
+    __slots__ = ('method', 'route', 'query', 'payload', 'omit', 'idempotent', 'cacheable',
+                 'streamable', 'retry')
+
+    def __init__(self, method: str,  # pylint: disable=too-many-arguments
+                 template: str,
+                 query: dict or None = None,
+                 payload: dict or None = None,
+                 omit: str or None = None,
+                 idempotent: bool or None = None,
+                 cacheable: bool or None = None,
+                 streamable: bool = False,
+                 retry: RetryPolicy or None = None):
+        """
+        Creates an Endpoint.
+
+        Args:
+            method (str): HTTP method
+            template (str): path template, see `Route`
+            query (dict): query parameter names keyed by method argument; empty and None
+                          values are left out, True is sent as "true"
+            payload (dict): payload keys keyed by method argument, dots nesting objects;
+                            None for requests without a body
+            omit (str): "none" to leave None values out of the payload, "empty" to leave all
+                        empty values out
+            idempotent (bool): whether the request may be retried, overriding the methods
+                               of the retry policy; None to follow the HTTP method
+            cacheable (bool): whether responses may be coalesced and revalidated with
+                              the conditional cache; defaults to True for GET requests
+            streamable (bool): whether the response is a list, or an object holding an
+                               `items` list, that may be parsed incrementally
+            retry (RetryPolicy): the retry policy of the endpoint, unless an override prefix
+                                 of the client policy matches; None for the client policy
+        """
+        self.method = method
+        self.route = Route(template)
+        self.query = tuple((query or {}).items())
+        self.payload = tuple(payload.items()) if payload is not None else None
+        self.omit = omit
+        self.idempotent = idempotent
+        self.cacheable = method == "GET" if cacheable is None else cacheable
+        self.streamable = streamable
+        self.retry = retry
+
+    @property
+    def arguments(self) -> frozenset:
+        """ The names of the method arguments used by the endpoint. """
+        return frozenset(self.route.fields + tuple(name for name, _ in self.query)
+                         + tuple(name for name, _ in self.payload or ()))
+
+    @property
+    def key(self) -> str:
+        """ The method and path template identifying the endpoint, e.g. "GET /api/v2/me". """
+        return f"{self.method} {self.route.template}"
+
+    def _omitted(self, value) -> bool:
+        if self.omit == "none":
+            return value is None
+        if self.omit == "empty":
+            return not value
+        return False
+
+    def path(self, arguments: dict) -> str:
+        """
+        Build the path and query string of a request.
+
+        Args:
+            arguments (dict): the arguments of the endpoint method
+
+        Returns:
+            str: the encoded path and query string
+        """
+        path = self.route.expand(arguments)
+        query = [(key, _query_value(arguments.get(name))) for name, key in self.query]
+        query = [(key, value) for key, value in query if value is not None]
+        if query:
+            path += "?" + urlencode(query, safe=QUERY_SAFE, quote_via=quote)
+        return path
+
+    def body(self, arguments: dict) -> dict or None:
+        """
+        Build the payload of a request.
+
+        Args:
+            arguments (dict): the arguments of the endpoint method
+
+        Returns:
+            dict or None: the payload, None for requests without a body
+        """
+        if self.payload is None:
+            return None
+        payload = {}
+        for name, key in self.payload:
+            value = arguments.get(name)
+            if self._omitted(value):
+                continue
+            *parents, leaf = key.split(".")
+            target = payload
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = value
+        return payload
+
+
+PROJECT = "/api/v2/project/{project_slug:path}"
+PAGE = {"page_token": "page-token"}
+CLAIMS = {"audience": "audience", "ttl": "ttl"}
+WEBHOOK = {"name": "name", "events": "events", "url": "url", "verify_tls": "verify-tls",
+           "signing_secret": "signing-secret"}
+
+ENDPOINTS = {
+    # Contexts
+    "create_context": Endpoint(
+        "POST", "/api/v2/context",
+        payload={"name": "name", "owner_id": "owner.id", "owner_type": "owner.type"}),
+    "list_contexts": Endpoint("GET", "/api/v2/context"),
+    "delete_context": Endpoint("DELETE", "/api/v2/context/{context_id}"),
+    "get_context": Endpoint("GET", "/api/v2/context/{context_id}"),
+    "list_environment_variables_in_context": Endpoint(
+        "GET", "/api/v2/context/{context_id}/environment-variable", query=PAGE),
+    "remove_environment_variable_from_context": Endpoint(
+        "DELETE", "/api/v2/context/{context_id}/environment-variable/{env_var_name}"),
+    "add_or_update_env_variable": Endpoint(
+        "PUT", "/api/v2/context/{context_id}/environment-variable/{env_var_name}",
+        payload={"env_var_value": "value"}),
+    "get_context_restrictions": Endpoint("GET", "/api/v2/context/{context_id}/restrictions"),
+    "create_context_restriction": Endpoint(
+        "POST", "/api/v2/context/{context_id}/restrictions",
+        payload={"restriction_type": "restriction_type",
+                 "restriction_value": "restriction_value"}),
+    "delete_context_restriction": Endpoint(
+        "DELETE", "/api/v2/context/{context_id}/restrictions/{restriction_id}"),
+    # Users
+    "get_current_user_information": Endpoint("GET", "/api/v2/me"),
+    "get_user_projects": Endpoint("GET", "/api/v1.1/projects", streamable=True),
+    "get_user_collaborations": Endpoint("GET", "/api/v2/me/collaborations"),
+    "get_user_information": Endpoint("GET", "/api/v2/user/{user_id}"),
+    # Pipelines
+    "get_list_of_pipelines_user_follow": Endpoint(
+        "GET", "/api/v2/pipeline",
+        query={"org_slug": "org-slug", "page_token": "page-token", "mine": "mine"}),
+    "continue_pipeline": Endpoint(
+        "POST", "/api/v2/pipeline/continue",
+        payload={"continuation_key": "continuation-key", "configuration": "configuration",
+                 "parameters": "parameters"}),
+    "get_pipeline_by_id": Endpoint("GET", "/api/v2/pipeline/{pipeline_id}"),
+    "get_pipeline_config_by_id": Endpoint("GET", "/api/v2/pipeline/{pipeline_id}/config"),
+    "get_pipeline_values_by_id": Endpoint("GET", "/api/v2/pipeline/{pipeline_id}/values"),
+    "get_pipeline_workflow_by_id": Endpoint(
+        "GET", "/api/v2/pipeline/{pipeline_id}/workflow", query=PAGE),
+    "trigger_pipeline": Endpoint(
+        "POST", PROJECT + "/pipeline",
+        payload={"branch": "branch", "tag": "tag", "parameters": "parameters"}, omit="empty"),
+    "get_all_pipelines_for_project": Endpoint(
+        "GET", PROJECT + "/pipeline", query={"branch": "branch", "page_token": "page-token"}),
+    "get_pipeline_triggered_by_current_user": Endpoint(
+        "GET", PROJECT + "/pipeline/mine", query=PAGE),
+    "get_pipeline_by_number": Endpoint("GET", PROJECT + "/pipeline/{pipeline_number}"),
+    # Jobs
+    "cancel_job_by_id": Endpoint("POST", "/api/v2/job/{job_id}/cancel", idempotent=True),
+    "get_job_by_number": Endpoint("GET", PROJECT + "/job/{job_number}"),
+    "cancel_job_by_number": Endpoint("POST", PROJECT + "/job/{job_number}/cancel",
+                                     idempotent=True),
+    "get_job_artifacts": Endpoint("GET", PROJECT + "/{job_number}/artifacts"),
+    "get_job_metadata": Endpoint("GET", PROJECT + "/{job_number}/tests", streamable=True),
+    # Workflows
+    "get_workflow_by_id": Endpoint("GET", "/api/v2/workflow/{workflow_id}"),
+    "approve_workflow_job": Endpoint("POST", "/api/v2/workflow/{workflow_id}/approve/{job_id}"),
+    "cancel_workflow": Endpoint("POST", "/api/v2/workflow/{workflow_id}/cancel",
+                                idempotent=True),
+    "get_workflow_jobs": Endpoint("GET", "/api/v2/workflow/{workflow_id}/job", query=PAGE),
+    "rerun_workflow": Endpoint(
+        "POST", "/api/v2/workflow/{workflow_id}/rerun",
+        payload={"enable_ssh": "enable_ssh", "from_failed": "from_failed", "jobs": "jobs",
+                 "sparse_tree": "sparse_tree"}, omit="none"),
+    # Webhooks
+    "get_webhooks": Endpoint(
+        "GET", "/api/v2/webhook", query={"scope_id": "scope-id", "scope_type": "scope-type"}),
+    "create_outbound_webhook": Endpoint("POST", "/api/v2/webhook",
+                                        payload={**WEBHOOK, "scope": "scope"}),
+    "get_webhook_by_id": Endpoint("GET", "/api/v2/webhook/{webhook_id}"),
+    "update_webhook_by_id": Endpoint("PUT", "/api/v2/webhook/{webhook_id}", payload=WEBHOOK),
+    "delete_webhook_by_id": Endpoint("DELETE", "/api/v2/webhook/{webhook_id}"),
+    # OIDC token management
+    "delete_org_level_claims": Endpoint(
+        "DELETE", "/api/v2/org/{org_id}/oidc-custom-claims", query={"claims": "claims"}),
+    "get_org_level_claims": Endpoint("GET", "/api/v2/org/{org_id}/oidc-custom-claims"),
+    "create_or_update_org_level_claims": Endpoint(
+        "PATCH", "/api/v2/org/{org_id}/oidc-custom-claims", payload=CLAIMS, omit="none"),
+    "delete_project_level_claims": Endpoint(
+        "DELETE", "/api/v2/org/{org_id}/project/{project_id}/oidc-custom-claims",
+        query={"claims": "claims"}),
+    "get_project_level_claims": Endpoint(
+        "GET", "/api/v2/org/{org_id}/project/{project_id}/oidc-custom-claims"),
+    "create_or_update_project_level_claims": Endpoint(
+        "PATCH", "/api/v2/org/{org_id}/project/{project_id}/oidc-custom-claims",
+        payload=CLAIMS, omit="none"),
+    # Projects
+    "get_project": Endpoint("GET", PROJECT),
+    "create_checkout_key": Endpoint("POST", PROJECT + "/checkout-key",
+                                    payload={"key_type": "type"}),
+    "get_all_checkout_keys": Endpoint("GET", PROJECT + "/checkout-key",
+                                      query={"digest": "digest"}),
+    "delete_checkout_key": Endpoint("DELETE", PROJECT + "/checkout-key/{fingerprint}"),
+    "get_checkout_key": Endpoint("GET", PROJECT + "/checkout-key/{fingerprint}"),
+    "create_env_var": Endpoint("POST", PROJECT + "/envvar",
+                               payload={"name": "name", "value": "value"}),
+    "get_all_env_vars": Endpoint("GET", PROJECT + "/envvar"),
+    "delete_env_var": Endpoint("DELETE", PROJECT + "/envvar/{name}"),
+    "get_masked_env_var": Endpoint("GET", PROJECT + "/envvar/{name}"),
+    "create_new_project": Endpoint("POST", "/api/v2/project/{vcs_type}/{org_name}/{repo_name}"),
+    "get_project_setting": Endpoint(
+        "GET", "/api/v2/project/{vcs_type}/{org_name}/{repo_name}/settings"),
+    "update_project_setting": Endpoint(
+        "PATCH", "/api/v2/project/{vcs_type}/{org_name}/{repo_name}/settings",
+        payload={"settings": "advanced"}),
+}
@@ -67,3 +67,46 @@ class CircleCIError(Exception):
             message += f"\n\t{details}"
 
         return message
+
+
+class CircuitOpenError(CircleCIError):
+    """
+    Raised without sending the request while the circuit breaker of an endpoint family is open.
+    """
+
+    def __init__(self, family: str,
+                 retry_in: float = 0.0,
+                 url: str or None = None):
+        """
+        Creates a CircuitOpenError.
+
+        Args:
+            family (str): The endpoint family whose breaker is open.
+            retry_in (float): The seconds until the breaker lets a probe request through.
+            url (str): The URL of the rejected request.
+
+        Returns:
+            CircuitOpenError: The CircuitOpenError instance.
+        """
+        super().__init__(f"Circuit breaker for the '{family}' endpoints is open, "
+                         f"retry in {retry_in:.1f}s.", url=url)
+        self.family = family
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(CircleCIError):
+    """
+    Raised when the time budget of a call is spent before its requests completed.
+    """
+
+    def __init__(self, url: str or None = None):
+        """
+        Creates a DeadlineExceededError.
+
+        Args:
+            url (str): The URL of the request that could not be completed in time.
+
+        Returns:
+            DeadlineExceededError: The DeadlineExceededError instance.
+        """
+        super().__init__("Deadline exceeded before the request completed.", url=url)
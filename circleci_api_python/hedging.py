@@ -0,0 +1,96 @@
+""" Hedged requests for the CircleCI API client. """
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+
+class HedgePolicy:  # pylint: disable=too-many-instance-attributes
+    """
+    Decides when a second copy of a slow idempotent GET is sent.
+
+    The hedge delay is a percentile of the recently observed response times: a request still
+    unanswered by then is duplicated and whichever copy answers first wins. Every request
+    earns `budget_ratio` of a hedge token, and a hedge spends a whole one, so hedges can never
+    add more than that share of extra load.
+    """
+
+    def __init__(self, percentile: float = 95,
+                 initial_delay: float = 1.0,
+                 min_delay: float = 0.01,
+                 budget_ratio: float = 0.1,
+                 max_budget: float = 10,
+                 window: int = 1000,
+                 min_samples: int = 20):
+        """
+        Creates a HedgePolicy.
+
+        Args:
+            percentile (float): response time percentile after which a hedge is sent
+            initial_delay (float): hedge delay used until `min_samples` were observed
+            min_delay (float): lower bound of the hedge delay
+            budget_ratio (float): hedge tokens earned per request
+            max_budget (float): maximum number of hedge tokens saved up
+            window (int): number of recent response times kept
+            min_samples (int): response times needed before the percentile is used
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.budget_ratio = budget_ratio
+        self.max_budget = max_budget
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._budget = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+
+    def after_fork(self) -> None:
+        """ Reset the lock in a forked child, keeping the observed latencies. """
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """
+        The time to wait for a response before hedging.
+
+        Returns:
+            float: the hedge delay in seconds
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, latency: float) -> None:
+        """
+        Record the response time of a request copy.
+
+        Args:
+            latency (float): response time in seconds
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def start(self) -> None:
+        """ Record a new hedgeable request, earning a share of a hedge token. """
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.max_budget, self._budget + self.budget_ratio)
+
+    def try_hedge(self) -> bool:
+        """
+        Spend a hedge token if one is available.
+
+        Returns:
+            bool: True if a hedge may be sent
+        """
+        with self._lock:
+            # Tolerate the rounding error of adding up fractional budget ratios.
+            if self._budget < 1 - 1e-9:
+                return False
+            self._budget = max(0.0, self._budget - 1)
+            self.hedges += 1
+            return True
@@ -0,0 +1,215 @@
+""" Per-endpoint latency histograms and the read timeouts derived from them. """
+from __future__ import annotations
+
+import contextvars
+import math
+import threading
+from contextlib import contextmanager
+
+# Key of the registered endpoint whose requests are being sent, see `Endpoint.key`.
+_ENDPOINT = contextvars.ContextVar("circleci_api_python_endpoint", default=None)
+
+
+@contextmanager
+def measured_endpoint(key: str or None):
+    """
+    Attribute the requests sent within the block to an endpoint.
+
+    Args:
+        key (str): the endpoint key, None for requests outside of the registry
+    """
+    token = _ENDPOINT.set(key)
+    try:
+        yield
+    finally:
+        _ENDPOINT.reset(token)
+
+
+def current_endpoint() -> str or None:
+    """
+    The endpoint the requests of the current context are attributed to.
+
+    Returns:
+        str or None: the endpoint key, None outside of any `measured_endpoint` block
+    """
+    return _ENDPOINT.get()
+
+
+class LatencyHistogram:
+    """
+    Counts response times in logarithmic buckets.
+
+    Each bucket is `resolution` times wider than the previous one, so percentiles are
+    overestimated by at most that ratio whatever the latency. Once `max_samples` were counted
+    all counts are halved, letting the histogram follow latencies that drift over time.
+    A histogram is not thread-safe on its own.
+    """
+
+    def __init__(self, resolution: float = 1.1,
+                 min_latency: float = 0.001,
+                 max_latency: float = 600.0,
+                 max_samples: int = 10000):
+        """
+        Creates a LatencyHistogram.
+
+        Args:
+            resolution (float): ratio between the upper bounds of consecutive buckets
+            min_latency (float): upper bound of the first bucket in seconds
+            max_latency (float): latencies above are counted in the last bucket
+            max_samples (int): number of samples after which older samples are decayed
+        """
+        self.resolution = resolution
+        self.min_latency = min_latency
+        self.max_samples = max_samples
+        size = math.ceil(math.log(max_latency / min_latency, resolution)) + 1
+        self._counts = [0.0] * size
+        self.count = 0.0
+
+    def _bucket(self, latency: float) -> int:
+        if latency <= self.min_latency:
+            return 0
+        index = math.ceil(math.log(latency / self.min_latency, self.resolution))
+        return min(index, len(self._counts) - 1)
+
+    def observe(self, latency: float) -> None:
+        """
+        Count a response time.
+
+        Args:
+            latency (float): response time in seconds
+        """
+        if self.count >= self.max_samples:
+            self._counts = [count / 2 for count in self._counts]
+            self.count /= 2
+        self._counts[self._bucket(latency)] += 1
+        self.count += 1
+
+    def percentile(self, percentile: float) -> float or None:
+        """
+        The upper bound of the bucket holding a percentile of the response times.
+
+        Args:
+            percentile (float): the percentile, between 0 and 100
+
+        Returns:
+            float or None: the latency in seconds, None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = self.count * percentile / 100
+        seen = 0.0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if count and seen >= rank:
+                return self.min_latency * self.resolution ** index
+        return self.min_latency * self.resolution ** (len(self._counts) - 1)
+
+
+class AdaptiveTimeouts:  # pylint: disable=too-many-instance-attributes
+    """
+    Keeps a latency histogram per endpoint and derives read timeouts from it.
+
+    Once an endpoint has `min_samples` responses, its read timeout becomes the `percentile`
+    of its response times multiplied by `factor`, bounded by `floor` and `ceiling`. Stuck
+    requests to fast endpoints then fail early, while slow endpoints are given the time they
+    need instead of timing out and being retried. The client counts a request that timed out
+    as answered at its read timeout, so the timeout rises again when an endpoint slows down.
+    With `adapt=False` the histograms are only recorded, for `stats`.
+    """
+
+    def __init__(self, percentile: float = 99,  # pylint: disable=too-many-arguments
+                 factor: float = 2.0,
+                 floor: float = 1.0,
+                 ceiling: float = 120.0,
+                 min_samples: int = 50,
+                 adapt: bool = True):
+        """
+        Creates an AdaptiveTimeouts.
+
+        Args:
+            percentile (float): response time percentile the read timeout is derived from
+            factor (float): safety factor applied to the percentile
+            floor (float): lower bound of the derived read timeouts in seconds
+            ceiling (float): upper bound of the derived read timeouts in seconds
+            min_samples (int): responses needed before the timeout of an endpoint adapts
+            adapt (bool): derive read timeouts, or only record the histograms
+        """
+        self.percentile = percentile
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.adapt = adapt
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def after_fork(self) -> None:
+        """ Reset the lock in a forked child, keeping the observed latencies. """
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, latency: float) -> None:
+        """
+        Record the response time of a request.
+
+        Args:
+            key (str): the endpoint key
+            latency (float): response time in seconds
+        """
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(latency)
+
+    def read_timeout(self, key: str or None) -> float or None:
+        """
+        The read timeout derived from the response times of an endpoint.
+
+        Args:
+            key (str): the endpoint key, None for requests outside of the registry
+
+        Returns:
+            float or None: the read timeout in seconds, None until it can be derived
+        """
+        if not self.adapt or key is None:
+            return None
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None or histogram.count < self.min_samples:
+                return None
+            latency = histogram.percentile(self.percentile)
+        return min(self.ceiling, max(self.floor, latency * self.factor))
+
+    def timeout(self, key: str or None, timeout):
+        """
+        Replace the read part of a request timeout with the one derived for an endpoint.
+
+        Args:
+            key (str): the endpoint key, None for requests outside of the registry
+            timeout (tuple or float): the configured (connect, read) or single timeout
+
+        Returns:
+            tuple or float: the timeout of the request
+        """
+        read = self.read_timeout(key)
+        if read is None:
+            return timeout
+        if isinstance(timeout, tuple):
+            return timeout[0], read
+        return read
+
+    def stats(self) -> dict:
+        """
+        Summarize the response times observed per endpoint.
+
+        Returns:
+            dict: count, p50, p99 and derived read timeout keyed by endpoint key
+        """
+        with self._lock:
+            summary = {key: {"count": round(histogram.count),
+                             "p50": histogram.percentile(50),
+                             "p99": histogram.percentile(99)}
+                       for key, histogram in self._histograms.items()}
+        for key, values in summary.items():
+            values["read_timeout"] = self.read_timeout(key)
+        return summary
@@ -0,0 +1,256 @@
+""" Client-side rate limiting for the CircleCI API client. """
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from circleci_api_python.retry import parse_retry_after
+
+
+def _header(headers, *names: str) -> str or None:
+    """
+    Return the first string value found among the given header names.
+
+    Args:
+        headers: response headers
+        names (str): candidate header names
+
+    Returns:
+        str or None: the header value
+    """
+    for name in names:
+        value = headers.get(name)
+        if isinstance(value, str):
+            return value
+    return None
+
+
+def parse_rate_limit_headers(headers) -> tuple:
+    """
+    Parse the rate limit headers of a response.
+
+    Both the `X-RateLimit-*` and the `RateLimit-*` forms are understood. A reset value larger
+    than a day is treated as a Unix timestamp, otherwise as a number of seconds.
+
+    Args:
+        headers: response headers
+
+    Returns:
+        tuple: (limit, remaining, reset_in_seconds), each None when absent
+    """
+    def number(suffix: str) -> float or None:
+        value = _header(headers, f'X-RateLimit-{suffix}', f'RateLimit-{suffix}')
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    limit, remaining, reset = number('Limit'), number('Remaining'), number('Reset')
+    if reset is not None and reset > 86400:
+        reset = max(0.0, reset - time.time())
+    return limit, remaining, reset
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every thread using a client.
+
+    Requests reserve a token and wait for it, so bursts above the rate are spread out instead
+    of being sent at once. The rate adapts to the `X-RateLimit-*` headers of the responses, and
+    `Retry-After` or an exhausted quota pauses all requests until the server allows more.
+    """
+
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate: float = 10.0,
+                 burst: int = 10,
+                 min_rate: float = 0.1,
+                 max_rate: float or None = None):
+        """
+        Creates a RateLimiter.
+
+        Args:
+            rate (float): initial number of requests per second
+            burst (int): number of requests that may be sent back to back
+            min_rate (float): lower bound of the adapted rate
+            max_rate (float): upper bound of the adapted rate, defaults to the initial rate
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = self._clock()
+        self._paused_until = 0.0
+
+    def after_fork(self) -> None:
+        """ Give a forked child a fresh lock, keeping the bucket state. """
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _state(self):
+        """ Hold exclusive access to the bucket state. """
+        with self._lock:
+            yield
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Reserve a token for one request.
+
+        Returns:
+            float: the number of seconds to wait before sending the request
+        """
+        with self._state():
+            now = self._clock()
+            self._refill(max(now, self._paused_until))
+            self._tokens -= 1
+            wait = max(0.0, self._paused_until - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self) -> None:
+        """ Block until a request may be sent. """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a while.
+
+        Args:
+            seconds (float): length of the pause
+        """
+        with self._state():
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._updated = max(self._updated, self._paused_until)
+            self._tokens = min(self._tokens, 0.0)
+
+    def update(self, response) -> None:
+        """
+        Adapt the limiter to the rate limit information of a response.
+
+        Args:
+            response: the response received
+        """
+        headers = getattr(response, 'headers', None)
+        if headers is None:
+            return
+        retry_after = parse_retry_after(_header(headers, 'Retry-After'))
+        if response.status_code == 429:
+            with self._state():
+                self.rate = max(self.min_rate, self.rate / 2)
+            self.pause(retry_after if retry_after is not None else 1 / self.rate)
+            return
+        if retry_after is not None:
+            self.pause(retry_after)
+
+        _, remaining, reset = parse_rate_limit_headers(headers)
+        if remaining is None or reset is None:
+            return
+        if remaining <= 0:
+            self.pause(reset)
+            return
+        # Spread the remaining quota evenly over what is left of the window.
+        with self._state():
+            self.rate = min(self.max_rate, max(self.min_rate, remaining / max(reset, 1.0)))
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Token bucket shared by every process on the host through a memory-mapped state file.
+
+    All processes created with the same `path` draw from one bucket, so the total request
+    rate of e.g. prefork workers stays under the quota of a shared token. Access to the state
+    is serialized with `flock`, which makes this limiter available on POSIX systems only.
+    """
+
+    _clock = staticmethod(time.time)
+    _layout = struct.Struct('4d')
+
+    def __init__(self, path: str,
+                 rate: float = 10.0,
+                 burst: int = 10,
+                 min_rate: float = 0.1,
+                 max_rate: float or None = None):
+        """
+        Creates a SharedRateLimiter.
+
+        Args:
+            path (str): state file shared by the cooperating processes
+            rate (float): initial number of requests per second
+            burst (int): number of requests that may be sent back to back
+            min_rate (float): lower bound of the adapted rate
+            max_rate (float): upper bound of the adapted rate, defaults to the initial rate
+        """
+        if fcntl is None:
+            raise OSError("SharedRateLimiter requires fcntl, which is not available "
+                          "on this platform.")
+        super().__init__(rate=rate, burst=burst, min_rate=min_rate, max_rate=max_rate)
+        self.path = path
+        self._fd = None
+        self._map = None
+        self._pid = None
+        self._open()
+
+    def _open(self) -> None:
+        """ Open and map the state file, initializing it if it is new. """
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < self._layout.size:
+                os.ftruncate(self._fd, self._layout.size)
+                os.pwrite(self._fd, self._layout.pack(self.rate, self._tokens,
+                                                      self._updated, self._paused_until), 0)
+            self._map = mmap.mmap(self._fd, self._layout.size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._pid = os.getpid()
+
+    def close(self) -> None:
+        """ Unmap and close the state file. """
+        if self._map is not None:
+            self._map.close()
+            os.close(self._fd)
+            self._map = self._fd = None
+
+    def after_fork(self) -> None:
+        """ Reopen the state file, as the flock is tied to the file shared with the parent. """
+        if self._pid != os.getpid():
+            self.close()
+            super().after_fork()
+            self._open()
+
+    @contextmanager
+    def _state(self):
+        """ Load the shared state under an exclusive file lock and store it back afterwards. """
+        # flock is tied to the open file, which a forked child shares with its parent.
+        self.after_fork()
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                (self.rate, self._tokens,
+                 self._updated, self._paused_until) = self._layout.unpack_from(self._map)
+                yield
+                self._layout.pack_into(self._map, 0, self.rate, self._tokens,
+                                       self._updated, self._paused_until)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
@@ -0,0 +1,85 @@
+""" Reconciliation of pipeline triggers whose outcome is unknown. """
+from __future__ import annotations
+
+from datetime import datetime
+
+# Seconds subtracted from the trigger time to tolerate clock skew with the API servers.
+CLOCK_SKEW = 30.0
+
+
+def parse_timestamp(value: str or None) -> float or None:
+    """
+    Parse an ISO 8601 timestamp of the CircleCI API.
+
+    Args:
+        value (str): the timestamp, e.g. "2023-01-01T12:00:00.000Z"
+
+    Returns:
+        float or None: the POSIX timestamp, or None if the value is unusable
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def is_ambiguous(response) -> bool:
+    """
+    Tell whether the pipeline may have been created although the trigger failed.
+
+    Args:
+        response: the response of the trigger, None if no response was received
+
+    Returns:
+        bool: True for lost requests and server errors
+    """
+    return response is None or response.status_code >= 500
+
+
+def pipeline_matches(pipeline: dict, payload: dict, since: float) -> bool:
+    """
+    Tell whether a listed pipeline was created by a trigger.
+
+    The pipeline must be on the branch, or tag, of the payload: a payload without either
+    must name the default branch of the project. Parameters are compared with the
+    `trigger_parameters` of the pipeline when it lists them.
+
+    Args:
+        pipeline (dict): a pipeline listed by the API
+        payload (dict): the payload of the trigger
+        since (float): POSIX timestamp before which the pipeline cannot have been created
+
+    Returns:
+        bool: True if the branch, tag, parameters and creation time of the pipeline match
+    """
+    created_at = parse_timestamp(pipeline.get("created_at"))
+    if created_at is None or created_at < since:
+        return False
+    vcs = pipeline.get("vcs") or {}
+    if vcs.get("tag") != payload.get("tag"):
+        return False
+    if "tag" not in payload and vcs.get("branch") != payload.get("branch"):
+        return False
+    listed = pipeline.get("trigger_parameters")
+    if payload.get("parameters") and isinstance(listed, dict):
+        return all(listed.get(name) == value for name, value in payload["parameters"].items())
+    return True
+
+
+def find_triggered_pipeline(pipelines: list, payload: dict, since: float) -> dict or None:
+    """
+    Find the pipeline created by a trigger among recently listed pipelines.
+
+    Args:
+        pipelines (list): pipelines listed by the API, newest first
+        payload (dict): the payload of the trigger
+        since (float): POSIX timestamp before which the pipeline cannot have been created
+
+    Returns:
+        dict or None: the oldest matching pipeline, None if there is none
+    """
+    matches = [pipeline for pipeline in pipelines
+               if pipeline_matches(pipeline, payload, since)]
+    return matches[-1] if matches else None
@@ -0,0 +1,155 @@
+""" Retry policy for the CircleCI API client. """
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def parse_retry_after(value: str or None) -> float or None:
+    """
+    Parse a `Retry-After` header value.
+
+    Args:
+        value (str): The header value, either delay seconds or an HTTP date.
+
+    Returns:
+        float or None: The number of seconds to wait, or None if the value is unusable.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, `Retry-After` support and a total time budget.
+    """
+
+    def __init__(self,
+                 max_retries: int = 3,
+                 retry_delay: float = 1,
+                 max_delay: float = 30,
+                 total_timeout: float or None = None,
+                 methods: frozenset = IDEMPOTENT_METHODS,
+                 status_codes: frozenset = RETRY_STATUS_CODES,
+                 overrides: dict or None = None,
+                 clamp_retry_after: bool = True):
+        """
+        Creates a RetryPolicy.
+
+        Args:
+            max_retries (int): The maximum number of retries after the first attempt.
+            retry_delay (float): The base delay in seconds, doubled on every retry.
+            max_delay (float): The upper bound of a single delay in seconds.
+            total_timeout (float): The total time in seconds retries may take, None for no limit.
+            methods (frozenset): The HTTP methods that may be retried.
+            status_codes (frozenset): The HTTP status codes that trigger a retry.
+            overrides (dict): Policies keyed by endpoint path prefix, e.g. "/api/v2/workflow".
+            clamp_retry_after (bool): Whether a `Retry-After` longer than `max_delay` is shortened
+                to it; if False, such a response is not retried.
+        """
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.total_timeout = total_timeout
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.overrides = overrides or {}
+        self.clamp_retry_after = clamp_retry_after
+
+    def for_endpoint(self, endpoint: str, default: RetryPolicy or None = None) -> RetryPolicy:
+        """
+        Resolve the policy for an endpoint, using the longest matching override prefix.
+
+        Args:
+            endpoint (str): API endpoint
+            default (RetryPolicy): The policy declared by the endpoint, used when no override
+                matches; None for this policy.
+
+        Returns:
+            RetryPolicy: The policy to apply.
+        """
+        path = endpoint.split('?', 1)[0]
+        matches = [prefix for prefix in self.overrides if path.startswith(prefix)]
+        if not matches:
+            return default or self
+        return self.overrides[max(matches, key=len)]
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute a full-jitter backoff delay.
+
+        Args:
+            attempt (int): The zero-based number of the retry.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        return random.uniform(0, min(self.max_delay, self.retry_delay * 2 ** attempt))
+
+    def delay(self, attempt: int, response=None) -> float or None:
+        """
+        Compute the delay before a retry: the `Retry-After` of the response if it has one, the
+        backoff otherwise.
+
+        Args:
+            attempt (int): The zero-based number of the retry.
+            response (Response): The response of the last attempt, None if there was none.
+
+        Returns:
+            float or None: The delay in seconds, or None if `Retry-After` asks for a wait longer
+                than `max_delay` and `clamp_retry_after` is off.
+        """
+        headers = getattr(response, 'headers', None) or {}
+        delay = parse_retry_after(headers.get('Retry-After'))
+        if delay is None:
+            return self.backoff(attempt)
+        if delay > self.max_delay:
+            return self.max_delay if self.clamp_retry_after else None
+        return delay
+
+    def next_delay(self, method: str,
+                   attempt: int,
+                   elapsed: float,
+                   response=None,
+                   error: Exception or None = None,
+                   idempotent: bool or None = None) -> float or None:
+        """
+        Decide whether a request should be retried.
+
+        Args:
+            method (str): The HTTP method.
+            attempt (int): The zero-based number of the retry that would follow.
+            elapsed (float): The seconds spent on the request so far.
+            response (Response): The response of the last attempt.
+            error (Exception): The transport error of the last attempt.
+            idempotent (bool): Whether the endpoint may be retried, None to decide from `methods`.
+
+        Returns:
+            float or None: The delay before the next attempt, or None to stop retrying.
+        """
+        retryable = method.upper() in self.methods if idempotent is None else idempotent
+        if attempt >= self.max_retries or not retryable:
+            return None
+        if error is None and (response is None or response.status_code not in self.status_codes):
+            return None
+
+        delay = self.delay(attempt, response)
+        if delay is None:
+            return None
+        if self.total_timeout is not None and elapsed + delay > self.total_timeout:
+            return None
+        return delay
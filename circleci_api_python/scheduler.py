@@ -0,0 +1,198 @@
+""" Priority scheduling of the requests sent by the CircleCI API client. """
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# Request priorities, most urgent first.
+PRIORITIES = ("high", "normal", "low")
+
+_PRIORITY = contextvars.ContextVar("circleci_api_python_priority", default="normal")
+
+
+def _check_priority(priority: str) -> None:
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}, expected one of {PRIORITIES}.")
+
+
+@contextmanager
+def request_priority(priority: str):
+    """
+    Send the requests made within the block with a priority.
+
+    The priority follows the current thread or asyncio task, like time budgets.
+
+    Args:
+        priority (str): "high", "normal" or "low"
+
+    Raises:
+        ValueError: if the priority is unknown
+    """
+    _check_priority(priority)
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def current_priority() -> str:
+    """
+    The priority of the requests made in the current context.
+
+    Returns:
+        str: the priority, "normal" outside of any `request_priority` block
+    """
+    return _PRIORITY.get()
+
+
+class PriorityScheduler:
+    """
+    Shares a number of request slots between priority classes.
+
+    A class may only use the slots not reserved for the classes above it, so capacity is
+    always left for urgent requests however many background requests are queued. When a slot
+    frees up, waiting requests of a higher class take it first. The scheduler can be shared by
+    threads and asyncio tasks.
+    """
+
+    def __init__(self, capacity: int = 10, reserved: dict or None = None):
+        """
+        Creates a PriorityScheduler.
+
+        Args:
+            capacity (int): number of requests in flight across all classes
+            reserved (dict): slots reserved per class, unusable by the classes below it;
+                             defaults to two slots reserved for "high"
+
+        Raises:
+            ValueError: if a class is unknown or would be left without slots
+        """
+        reserved = {"high": 2} if reserved is None else reserved
+        for priority in reserved:
+            _check_priority(priority)
+        self.capacity = capacity
+        self.reserved = dict(reserved)
+        self._limits = {}
+        for rank, priority in enumerate(PRIORITIES):
+            self._limits[priority] = capacity - sum(reserved.get(above, 0)
+                                                    for above in PRIORITIES[:rank])
+            if self._limits[priority] < 1:
+                raise ValueError(f"No capacity left for {priority!r} requests.")
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = deque()
+        self._in_flight = dict.fromkeys(PRIORITIES, 0)
+        self._waiting = dict.fromkeys(PRIORITIES, 0)
+
+    @property
+    def in_flight(self) -> dict:
+        """ The number of requests holding a slot, per priority. """
+        return dict(self._in_flight)
+
+    def after_fork(self) -> None:
+        """ Forget the slots and waiters of the parent process in a forked child. """
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = deque()
+        self._in_flight = dict.fromkeys(PRIORITIES, 0)
+        self._waiting = dict.fromkeys(PRIORITIES, 0)
+
+    def _take(self, priority: str) -> bool:
+        rank = PRIORITIES.index(priority)
+        if any(self._waiting[above] for above in PRIORITIES[:rank]):
+            return False
+        if sum(self._in_flight.values()) >= self._limits[priority]:
+            return False
+        self._in_flight[priority] += 1
+        return True
+
+    def acquire(self, priority: str = "normal", timeout: float or None = None) -> bool:
+        """
+        Block until a slot is available to the priority and take it.
+
+        Args:
+            priority (str): priority of the request
+            timeout (float): maximum number of seconds to wait, None to wait indefinitely
+
+        Returns:
+            bool: True if a slot was taken, False on timeout
+        """
+        with self._condition:
+            if self._take(priority):
+                return True
+            self._waiting[priority] += 1
+            try:
+                return self._condition.wait_for(lambda: self._take(priority), timeout)
+            finally:
+                self._waiting[priority] -= 1
+                self._wake()
+
+    async def acquire_async(self, priority: str = "normal",
+                            timeout: float or None = None) -> bool:
+        """
+        Wait without blocking the event loop until a slot is available to the priority and
+        take it.
+
+        Args:
+            priority (str): priority of the request
+            timeout (float): maximum number of seconds to wait, None to wait indefinitely
+
+        Returns:
+            bool: True if a slot was taken, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        expires = None if timeout is None else loop.time() + timeout
+        with self._lock:
+            if self._take(priority):
+                return True
+            self._waiting[priority] += 1
+        try:
+            while True:
+                with self._lock:
+                    if self._take(priority):
+                        return True
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+                remaining = None if expires is None else expires - loop.time()
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), remaining)
+                except asyncio.TimeoutError:
+                    return False
+                finally:
+                    with self._lock:
+                        if (loop, waiter) in self._waiters:
+                            self._waiters.remove((loop, waiter))
+        finally:
+            with self._lock:
+                self._waiting[priority] -= 1
+                self._wake()
+
+    def _wake(self) -> None:
+        """ Make the waiting threads and tasks check for a slot. Called with the lock held. """
+        self._condition.notify_all()
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:  # the event loop of the waiter is closed
+                pass
+
+    def release(self, priority: str = "normal") -> None:
+        """
+        Return the slot taken by a request.
+
+        Args:
+            priority (str): priority the slot was taken with
+        """
+        with self._lock:
+            self._in_flight[priority] -= 1
+            self._wake()
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,100 @@
+""" Coalescing of identical in-flight requests for the CircleCI API client. """
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent import futures
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing of concurrent calls sharing a key.
+
+    The first caller of a key runs the call; callers arriving while it is in flight wait for
+    it and receive the same result or exception instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, func, timeout: float or None = None):
+        """
+        Run `func`, or join the call of the same key already in flight.
+
+        Args:
+            key (Hashable): identity of the call
+            func (Callable): the call to run
+            timeout (float): seconds to wait for a joined call, None to wait until it completes
+
+        Returns:
+            the result of the call
+
+        Raises:
+            concurrent.futures.TimeoutError: if a joined call did not complete in time
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = futures.Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return call.result(timeout=timeout)
+        try:
+            result = func()
+        except BaseException as error:
+            self._forget(key)
+            call.set_exception(error)
+            raise
+        self._forget(key)
+        call.set_result(result)
+        return result
+
+    def _forget(self, key) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalescing of concurrent coroutine calls sharing a key within one event loop.
+
+    The call runs in its own task, so a cancelled caller does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.shared = 0
+
+    async def do(self, key, func, timeout: float or None = None):
+        """
+        Await `func()`, or join the call of the same key already in flight.
+
+        Args:
+            key (Hashable): identity of the call
+            func (Callable): coroutine function performing the call
+            timeout (float): seconds to wait for the call, None to wait until it completes
+
+        Returns:
+            the result of the call
+
+        Raises:
+            asyncio.TimeoutError: if the call did not complete in time
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+    def _finished(self, key, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled meanwhile.
+            task.exception()
@@ -0,0 +1,231 @@
+""" Incremental parsing of the JSON list responses of the CircleCI API. """
+from __future__ import annotations
+
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_NUMBER = "0123456789.eE+-"
+
+# Parser states.
+_START = "start"
+_MEMBER = "member"
+_AFTER_MEMBER = "after member"
+_ITEM = "item"
+_AFTER_ITEM = "after item"
+_DONE = "done"
+
+
+class ItemParser:  # pylint: disable=too-many-instance-attributes
+    """
+    Parses the items of a JSON list response as its body is received.
+
+    The response is either a list, or an object whose `key` member is the list as in the
+    paginated responses of the API v2. Complete items are returned as soon as their last byte
+    is fed, and only the unparsed tail of the body is kept, so memory use is bounded by the
+    largest item rather than by the response. The other members of an object response, such
+    as its `next_page_token`, are collected in `fields`.
+    """
+
+    def __init__(self, key: str = "items"):
+        """
+        Creates an ItemParser.
+
+        Args:
+            key (str): the member holding the list in object responses
+        """
+        self.key = key
+        self.fields = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._pending = []
+        self._pending_size = 0
+        self._wanted = 0
+        self._state = _START
+        self._first = True
+        self._in_list = False
+        self._end = False
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Parse the next chunk of the body.
+
+        Args:
+            chunk (bytes): the chunk received
+
+        Returns:
+            list: the items completed by the chunk
+
+        Raises:
+            json.JSONDecodeError: if the body is not a list or an object holding a list
+        """
+        text = self._decoder.decode(chunk)
+        self._pending.append(text)
+        self._pending_size += len(text)
+        # An incomplete value is parsed again from its start: wait until the unparsed text has
+        # doubled so that a large item is not parsed once per chunk.
+        if len(self._buffer) - self._position + self._pending_size < self._wanted:
+            return []
+        return self._parse()
+
+    def close(self) -> list:
+        """
+        Parse the end of the body.
+
+        Returns:
+            list: the last items of the body
+
+        Raises:
+            json.JSONDecodeError: if the body is truncated or not valid
+        """
+        self._pending.append(self._decoder.decode(b"", final=True))
+        self._end = True
+        items = self._parse()
+        if self._state != _DONE:
+            raise json.JSONDecodeError("Unexpected end of the response", self._buffer,
+                                       len(self._buffer))
+        return items
+
+    def _parse(self) -> list:
+        self._buffer = self._buffer[self._position:] + "".join(self._pending)
+        self._position = 0
+        self._pending = []
+        self._pending_size = 0
+        items = []
+        while self._step(items):
+            pass
+        self._wanted = 2 * (len(self._buffer) - self._position)
+        return items
+
+    def _skip(self, position: int) -> int:
+        return _WHITESPACE.match(self._buffer, position).end()
+
+    def _value(self, position: int):
+        """
+        Decode the value starting at a position.
+
+        Args:
+            position (int): the start of the value
+
+        Returns:
+            tuple or None: the value and its end, None if it may not be complete yet
+        """
+        try:
+            value, end = _DECODER.raw_decode(self._buffer, position)
+        except json.JSONDecodeError:
+            if self._end:
+                raise
+            return None
+        # A number may go on in the next chunk, even after a prefix such as "1." or "1e".
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and not self._end \
+                and (end == len(self._buffer) or self._buffer[end] in _NUMBER):
+            return None
+        return value, end
+
+    def _unexpected(self, position: int, expected: str):
+        return json.JSONDecodeError(f"Expecting {expected}", self._buffer, position)
+
+    def _step(self, items: list) -> bool:  # pylint: disable=too-many-return-statements
+        """
+        Consume the next token of the body.
+
+        Args:
+            items (list): the list completed items are appended to
+
+        Returns:
+            bool: False once more of the body is needed
+        """
+        position = self._skip(self._position)
+        if self._state == _DONE:
+            if position < len(self._buffer):
+                raise self._unexpected(position, "the end of the response")
+            self._position = position
+            return False
+        if position == len(self._buffer):
+            return False
+        char = self._buffer[position]
+        if self._state == _START:
+            if char not in "[{":
+                raise self._unexpected(position, "a list or an object")
+            self._in_list = char == "["
+            self._state = _ITEM if self._in_list else _MEMBER
+            self._position = position + 1
+            return True
+        if self._state in (_AFTER_MEMBER, _AFTER_ITEM):
+            return self._separator(position, char)
+        if self._state == _ITEM:
+            if char == "]" and self._first:
+                return self._separator(position, char)
+            value = self._value(position)
+            if value is None:
+                return False
+            items.append(value[0])
+            self._position = value[1]
+            self._state = _AFTER_ITEM
+            return True
+        if char == "}" and self._first:
+            return self._separator(position, char)
+        return self._member(position)
+
+    def _separator(self, position: int, char: str) -> bool:
+        """
+        Consume a comma or the end of the list or object being parsed.
+
+        Args:
+            position (int): the position of the character
+            char (str): the character
+
+        Returns:
+            bool: True
+        """
+        closing = "]" if self._state in (_ITEM, _AFTER_ITEM) else "}"
+        if char == ",":
+            self._state = _ITEM if closing == "]" else _MEMBER
+            self._first = False
+        elif char == closing:
+            # The list closes the response, or the member holding it.
+            self._state = _AFTER_MEMBER if closing == "]" and not self._in_list else _DONE
+            self._in_list = False
+        else:
+            raise self._unexpected(position, f"',' or '{closing}'")
+        self._position = position + 1
+        return True
+
+    def _member(self, position: int) -> bool:
+        """
+        Consume a member of an object response, entering its list if it holds the items.
+
+        Args:
+            position (int): the position of the member name
+
+        Returns:
+            bool: False if the member is not complete yet
+        """
+        if self._buffer[position] != '"':
+            raise self._unexpected(position, "a member name")
+        name = self._value(position)
+        if name is None:
+            return False
+        colon = self._skip(name[1])
+        if colon == len(self._buffer):
+            return False
+        if self._buffer[colon] != ":":
+            raise self._unexpected(colon, "':'")
+        start = self._skip(colon + 1)
+        if start == len(self._buffer):
+            return False
+        if name[0] == self.key and self._buffer[start] == "[":
+            self._state = _ITEM
+            self._first = True
+            self._position = start + 1
+            return True
+        value = self._value(start)
+        if value is None:
+            return False
+        self.fields[name[0]] = value[0]
+        self._state = _AFTER_MEMBER
+        self._position = value[1]
+        return True
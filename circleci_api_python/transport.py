@@ -0,0 +1,832 @@
+""" Transports used by the CircleCI API client to send HTTP requests. """
+from __future__ import annotations
+
+import abc
+import asyncio
+import json
+import logging
+import threading
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from circleci_api_python.codec import default_codec
+from circleci_api_python.utils import create_session
+
+LOG = logging.getLogger("circleci_api_python")
+
+# Size of the chunks streamed response bodies are read in.
+STREAM_CHUNK_SIZE = 64 * 1024
+# Seconds a warmup request may take to connect and to be answered.
+WARMUP_TIMEOUT = 10.0
+
+
+def _json_headers(headers: dict or None) -> dict:
+    return {**(headers or {}), "Content-Type": "application/json"}
+
+
+def _warm_up(head, url: str, connections: int, errors: tuple) -> int:
+    """
+    Send warmup requests to a host from concurrent threads, so that each needs a connection.
+
+    Args:
+        head (Callable): sends one HEAD request to the host
+        url (str): URL of the host
+        connections (int): number of requests to send
+        errors (tuple): exceptions of the failed requests, logged instead of raised
+
+    Returns:
+        int: the number of requests answered
+    """
+    opened = []
+
+    def send():
+        try:
+            head()
+            opened.append(url)
+        except errors as error:
+            LOG.debug('Warming up a connection to %s failed: %s', url, error)
+
+    threads = [threading.Thread(target=send) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(opened)
+
+
+class Transfer:
+    """
+    Byte counts of a single response body.
+    """
+
+    __slots__ = ('wire_bytes', 'decoded_bytes')
+
+    def __init__(self, wire_bytes: int, decoded_bytes: int):
+        self.wire_bytes = wire_bytes
+        self.decoded_bytes = decoded_bytes
+
+    def __repr__(self) -> str:
+        return f"Transfer(wire_bytes={self.wire_bytes}, decoded_bytes={self.decoded_bytes})"
+
+
+class TransferStats:
+    """
+    Thread-safe byte counters of all the responses received by a transport.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+    def record(self, response, wire_bytes: int, content: bytes) -> None:
+        """
+        Record the body sizes of a response and attach them to it as `response.transfer`.
+
+        Args:
+            response: the response received
+            wire_bytes (int): number of body bytes received over the wire
+            content (bytes): the decompressed body
+        """
+        if isinstance(content, bytes):
+            self.record_sizes(response, wire_bytes, len(content))
+
+    def record_sizes(self, response, wire_bytes: int, decoded_bytes: int) -> None:
+        """
+        Record the body sizes of a response whose body was not kept, such as a streamed one.
+
+        Args:
+            response: the response received
+            wire_bytes (int): number of body bytes received over the wire
+            decoded_bytes (int): number of decompressed body bytes
+        """
+        if not isinstance(wire_bytes, int):
+            return
+        response.transfer = Transfer(wire_bytes, decoded_bytes)
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+
+    @property
+    def saved_bytes(self) -> int:
+        """ The number of bytes compression kept off the wire. """
+        return self.decoded_bytes - self.wire_bytes
+
+
+def _chunks(content: bytes):
+    for start in range(0, len(content), STREAM_CHUNK_SIZE):
+        yield content[start:start + STREAM_CHUNK_SIZE]
+
+
+async def _async_chunks(content: bytes):
+    for chunk in _chunks(content):
+        yield chunk
+
+
+def _recorded_chunks(stats: TransferStats, response: StreamedResponse, chunks, wire_bytes):
+    """
+    Yield the chunks of a streamed body, recording its sizes once it is read to the end.
+
+    Args:
+        stats (TransferStats): the counters of the transport
+        response (StreamedResponse): the response the sizes are attached to
+        chunks (Iterator[bytes]): the chunks of the body
+        wire_bytes (Callable[[], int]): returns the number of body bytes received over the wire
+    """
+    decoded_bytes = 0
+    for chunk in chunks:
+        decoded_bytes += len(chunk)
+        yield chunk
+    stats.record_sizes(response, wire_bytes(), decoded_bytes)
+
+
+async def _async_recorded_chunks(stats: TransferStats, response: StreamedResponse, chunks,
+                                 wire_bytes):
+    """
+    Asynchronous variant of `_recorded_chunks`.
+    """
+    decoded_bytes = 0
+    async for chunk in chunks:
+        decoded_bytes += len(chunk)
+        yield chunk
+    stats.record_sizes(response, wire_bytes(), decoded_bytes)
+
+
+class StreamedResponse:
+    """
+    A response whose body is received chunk by chunk, see `Transport.stream`.
+    """
+
+    def __init__(self, status_code: int, headers, url, chunks):
+        """
+        Creates a StreamedResponse.
+
+        Args:
+            status_code (int): HTTP status code
+            headers: response headers
+            url: the URL of the response
+            chunks: iterator, or async iterator, of the body chunks
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self.chunks = chunks
+
+    def read(self) -> InMemoryResponse:
+        """
+        Read the rest of the body.
+
+        Returns:
+            InMemoryResponse: the response with its whole body
+        """
+        return InMemoryResponse(self.status_code, b"".join(self.chunks), dict(self.headers),
+                                str(self.url))
+
+    async def aread(self) -> InMemoryResponse:
+        """
+        Read the rest of the body from an async iterator of chunks.
+
+        Returns:
+            InMemoryResponse: the response with its whole body
+        """
+        content = b"".join([chunk async for chunk in self.chunks])
+        return InMemoryResponse(self.status_code, content, dict(self.headers), str(self.url))
+
+
+class Transport(abc.ABC):
+    """
+    Base class of the transports used by `CircleCI` to send requests.
+
+    Subclasses implement `request`, as a coroutine for the transports of `AsyncCircleCI`.
+    """
+
+    # Exceptions raised by the transport for failures worth retrying.
+    errors: tuple = ()
+    # Exceptions raised by the transport when a response is not received in time.
+    timeout_errors: tuple = ()
+
+    def __init__(self):
+        self.stats = TransferStats()
+        # Encodes payloads; the client sets its own codec on the transport it uses.
+        self.codec = default_codec()
+
+    @abc.abstractmethod
+    def request(self, method: str,
+                url: str,
+                headers: dict or None = None,
+                payload: dict or None = None,
+                timeout: tuple or None = None):
+        """
+        Send a single request.
+
+        Args:
+            method (str): HTTP method
+            url (str): absolute request URL
+            headers (dict): request headers
+            payload (dict): JSON request payload
+            timeout (tuple): (connect, read) timeout in seconds
+
+        Returns:
+            response: an object exposing `status_code`, `headers`, `url` and `json()`
+        """
+
+    @contextmanager
+    def stream(self, method: str,
+               url: str,
+               headers: dict or None = None,
+               timeout: tuple or None = None):
+        """
+        Send a request without a body and yield its response as a `StreamedResponse`, whose
+        connection is held until the block exits.
+
+        This default implementation reads the whole body with `request` first; transports
+        able to read it incrementally override it.
+
+        Args:
+            method (str): HTTP method
+            url (str): absolute request URL
+            headers (dict): request headers
+            timeout (tuple): (connect, read) timeout in seconds
+        """
+        response = self.request(method, url, headers=headers, timeout=timeout)
+        yield StreamedResponse(response.status_code, response.headers, response.url,
+                               _chunks(response.content))
+
+    @asynccontextmanager
+    async def stream_async(self, method: str,
+                           url: str,
+                           headers: dict or None = None,
+                           timeout: tuple or None = None):
+        """
+        Asynchronous variant of `stream`, for transports whose `request` is a coroutine.
+
+        Args:
+            method (str): HTTP method
+            url (str): absolute request URL
+            headers (dict): request headers
+            timeout (tuple): (connect, read) timeout in seconds
+        """
+        response = await self.request(method, url, headers=headers, timeout=timeout)
+        yield StreamedResponse(response.status_code, response.headers, response.url,
+                               _async_chunks(response.content))
+
+    def close(self) -> None:
+        """
+        Release the resources held by the transport.
+        """
+
+    def warmup(self, url: str, connections: int = 1) -> int:  # pylint: disable=unused-argument
+        """
+        Open pooled connections to a host ahead of the first request.
+
+        Args:
+            url (str): URL of the host
+            connections (int): number of connections to open
+
+        Returns:
+            int: the number of connections opened
+        """
+        return 0
+
+    def after_fork(self) -> None:
+        """
+        Drop the state inherited from the parent process in a forked child.
+
+        Connections pooled by the parent must not be shut down gracefully here, as the parent
+        keeps using them.
+        """
+        self.stats = TransferStats()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport sending requests through a pooled keep-alive `requests.Session`.
+
+    The session and its urllib3 connection pools are shared by all threads. With
+    `per_thread_sessions` every thread gets a session of its own instead, so no session state
+    such as the cookie jar is ever touched by two threads at once.
+    """
+
+    errors = (requests.ConnectionError, requests.Timeout)
+    timeout_errors = (requests.ReadTimeout,)
+
+    def __init__(self, pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 session: requests.Session or None = None,
+                 per_thread_sessions: bool = False):
+        """
+        Creates a RequestsTransport.
+
+        Args:
+            pool_connections (int): number of host pools to cache
+            pool_maxsize (int): maximum number of connections kept per host
+            keep_alive (bool): keep connections open between requests
+            session (requests.Session): an existing session to use instead of a new one
+            per_thread_sessions (bool): give every thread its own pooled session
+        """
+        super().__init__()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.per_thread_sessions = per_thread_sessions and session is None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions = []
+        self._session = None
+        if not self.per_thread_sessions:
+            self._session = session or self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = create_session(pool_connections=self.pool_connections,
+                                 pool_maxsize=self.pool_maxsize,
+                                 keep_alive=self.keep_alive)
+        with self._lock:
+            self._sessions.append(session)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """ The session used by the calling thread. """
+        if self._session is not None:
+            return self._session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._create_session()
+        return session
+
+    def request(self, method: str,
+                url: str,
+                headers: dict or None = None,
+                payload: dict or None = None,
+                timeout: tuple or None = None) -> requests.Response:
+        send = getattr(self.session, method.lower())
+        if payload is None:
+            response = send(url, headers=headers, timeout=timeout)
+        else:
+            response = send(url, headers=_json_headers(headers), data=self.codec.encode(payload),
+                            timeout=timeout)
+        # urllib3 decompresses the body chunk by chunk while reading it; tell() reports
+        # the compressed number of bytes read from the socket.
+        content = response.content
+        raw = getattr(response, 'raw', None)
+        if raw is not None:
+            self.stats.record(response, raw.tell(), content)
+        return response
+
+    @contextmanager
+    def stream(self, method: str,
+               url: str,
+               headers: dict or None = None,
+               timeout: tuple or None = None):
+        send = getattr(self.session, method.lower())
+        response = send(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            streamed = StreamedResponse(response.status_code, response.headers, response.url,
+                                        None)
+            streamed.chunks = _recorded_chunks(self.stats, streamed,
+                                               response.iter_content(STREAM_CHUNK_SIZE),
+                                               response.raw.tell)
+            yield streamed
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        if self._session is not None and self._session not in sessions:
+            sessions.append(self._session)
+        for session in sessions:
+            session.close()
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        """
+        Open connections by sending concurrent HEAD requests to the host through the shared
+        session, so its proxy and TLS settings apply. At most `pool_maxsize` connections are
+        opened, as the pool keeps no more.
+
+        With `per_thread_sessions` nothing is opened: the connections would belong to the
+        session of the warming thread, which no other thread uses.
+        """
+        if self.per_thread_sessions:
+            LOG.debug('Not warming up per-thread sessions.')
+            return 0
+        session = self.session
+        return _warm_up(lambda: session.head(url, allow_redirects=False, timeout=WARMUP_TIMEOUT),
+                        url, min(connections, self.pool_maxsize), requests.RequestException)
+
+    def after_fork(self) -> None:
+        super().after_fork()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if self.per_thread_sessions:
+            self._sessions = []
+            return
+        # Closing an HTTP/1.1 connection only closes the child's copy of the socket; the
+        # session itself keeps working with fresh pools.
+        self._session.close()
+
+
+def _httpx_timeout(timeout: tuple or None):
+    """
+    Convert a (connect, read) timeout tuple into an httpx timeout.
+
+    Args:
+        timeout (tuple): (connect, read) timeout in seconds
+
+    Returns:
+        httpx.Timeout or None: the equivalent httpx timeout
+    """
+    if timeout is None:
+        return None
+    connect_timeout, read_timeout = timeout
+    # Requests waiting for a free connection are queued instead of timing out.
+    return httpx.Timeout(read_timeout, connect=connect_timeout, pool=None)
+
+
+def _httpx_client_options(pool_maxsize: int,
+                          keep_alive: bool,
+                          http2: bool,
+                          prior_knowledge: bool) -> dict:
+    """
+    Build the keyword arguments shared by `httpx.Client` and `httpx.AsyncClient`.
+
+    Args:
+        pool_maxsize (int): maximum number of open connections
+        keep_alive (bool): keep connections open between requests
+        http2 (bool): negotiate HTTP/2 with the server
+        prior_knowledge (bool): speak HTTP/2 without negotiation, e.g. to an h2c server
+
+    Returns:
+        dict: the client options
+    """
+    if httpx is None:
+        raise ImportError("httpx transports require the `httpx` package. "
+                          "Install it with `pip install circleci-api-python[async]`, "
+                          "or `circleci-api-python[http2]` for HTTP/2 support.")
+    limits = httpx.Limits(max_connections=pool_maxsize,
+                          max_keepalive_connections=pool_maxsize if keep_alive else 0)
+    # httpx advertises and incrementally decodes gzip and deflate, plus brotli and zstd
+    # when the optional decoders are installed.
+    return {"limits": limits,
+            "http2": http2 or prior_knowledge,
+            "http1": not prior_knowledge}
+
+
+class _EventLoopThread:
+    """
+    An event loop running in a daemon thread, running the coroutines of other threads.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="circleci-httpx",
+                                        daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine):
+        """
+        Run a coroutine in the loop and wait for its outcome.
+
+        Args:
+            coroutine (Coroutine): the coroutine
+
+        Returns:
+            the result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    @property
+    def stopped(self) -> bool:
+        """ Whether the loop was stopped. """
+        return self.loop.is_closed()
+
+    def stop(self) -> None:
+        """ Stop the loop and its thread. """
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+async def _next_chunk(chunks) -> bytes or None:
+    async for chunk in chunks:
+        return chunk
+    return None
+
+
+async def _open_stream(client: httpx.AsyncClient, method: str, url: str, headers: dict or None,
+                       timeout: tuple or None) -> tuple:
+    stack = AsyncExitStack()
+    response = await stack.enter_async_context(
+        client.stream(method, url, headers=headers, timeout=_httpx_timeout(timeout)))
+    return stack, response
+
+
+async def _warm_up_async(client: httpx.AsyncClient, url: str, connections: int) -> int:
+    """
+    Send concurrent warmup requests to a host, so that each needs a connection unless they
+    are multiplexed over HTTP/2.
+
+    Args:
+        client (httpx.AsyncClient): the client sending the requests
+        url (str): URL of the host
+        connections (int): number of requests to send
+
+    Returns:
+        int: the number of requests answered
+    """
+    async def head() -> bool:
+        try:
+            await client.head(url, timeout=WARMUP_TIMEOUT)
+            return True
+        except httpx.HTTPError as error:
+            LOG.debug('Warming up a connection to %s failed: %s', url, error)
+            return False
+
+    return sum(await asyncio.gather(*(head() for _ in range(connections))))
+
+
+class HttpxTransport(Transport):
+    """
+    Transport sending requests through an `httpx.AsyncClient`, HTTP/2 enabled by default.
+
+    With HTTP/2 concurrent requests from many threads are multiplexed over a few connections
+    instead of needing one connection per in-flight request. The connection state of httpx
+    HTTP/2 is not thread-safe, so the requests of all threads are run by an event loop in a
+    thread of the transport, and the calling threads wait for their responses.
+    """
+
+    errors = (httpx.TransportError,) if httpx is not None else ()
+    timeout_errors = (httpx.ReadTimeout,) if httpx is not None else ()
+
+    def __init__(self, pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 http2: bool = True,
+                 prior_knowledge: bool = False,
+                 client: httpx.AsyncClient or None = None):
+        """
+        Creates an HttpxTransport.
+
+        Args:
+            pool_maxsize (int): maximum number of open connections
+            keep_alive (bool): keep connections open between requests
+            http2 (bool): negotiate HTTP/2 with the server
+            prior_knowledge (bool): speak HTTP/2 without negotiation, e.g. to an h2c server
+            client (httpx.AsyncClient): an existing client to use instead of a new one
+        """
+        super().__init__()
+        self.pool_maxsize = pool_maxsize
+        self._options = None
+        if client is None:
+            self._options = _httpx_client_options(pool_maxsize, keep_alive, http2,
+                                                  prior_knowledge)
+            client = httpx.AsyncClient(**self._options)
+        self.client = client
+        self._loop = _EventLoopThread()
+
+    def request(self, method: str,
+                url: str,
+                headers: dict or None = None,
+                payload: dict or None = None,
+                timeout: tuple or None = None) -> httpx.Response:
+        if payload is not None:
+            headers, payload = _json_headers(headers), self.codec.encode(payload)
+        response = self._loop.run(self.client.request(method, url,
+                                                      headers=headers,
+                                                      content=payload,
+                                                      timeout=_httpx_timeout(timeout)))
+        self.stats.record(response, response.num_bytes_downloaded, response.content)
+        return response
+
+    @contextmanager
+    def stream(self, method: str,
+               url: str,
+               headers: dict or None = None,
+               timeout: tuple or None = None):
+        opened, response = self._loop.run(_open_stream(self.client, method, url, headers,
+                                                       timeout))
+        try:
+            streamed = StreamedResponse(response.status_code, response.headers, response.url,
+                                        None)
+            streamed.chunks = _recorded_chunks(self.stats, streamed,
+                                               self._chunks(response),
+                                               lambda: response.num_bytes_downloaded)
+            yield streamed
+        finally:
+            self._loop.run(opened.aclose())
+
+    def _chunks(self, response: httpx.Response):
+        chunks = response.aiter_bytes(STREAM_CHUNK_SIZE)
+        while True:
+            chunk = self._loop.run(_next_chunk(chunks))
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        if self._loop.stopped:
+            return
+        self._loop.run(self.client.aclose())
+        self._loop.stop()
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        """
+        Open connections by sending concurrent HEAD requests to the host, at most
+        `pool_maxsize`. With HTTP/2 they share a single connection.
+        """
+        return self._loop.run(_warm_up_async(self.client, url,
+                                             min(connections, self.pool_maxsize)))
+
+    def after_fork(self) -> None:
+        super().after_fork()
+        # The thread of the event loop did not survive the fork. A client passed in by the
+        # caller cannot be rebuilt with the same configuration.
+        self._loop = _EventLoopThread()
+        if self._options is not None:
+            self.client = httpx.AsyncClient(**self._options)
+
+
+class HttpxAsyncTransport(Transport):
+    """
+    Asynchronous transport sending requests through a shared `httpx.AsyncClient` pool.
+    """
+
+    errors = (httpx.TransportError,) if httpx is not None else ()
+    timeout_errors = (httpx.ReadTimeout,) if httpx is not None else ()
+
+    def __init__(self, pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 http2: bool = False,
+                 prior_knowledge: bool = False,
+                 client: httpx.AsyncClient or None = None):
+        """
+        Creates an HttpxAsyncTransport.
+
+        Args:
+            pool_maxsize (int): maximum number of open connections
+            keep_alive (bool): keep connections open between requests
+            http2 (bool): negotiate HTTP/2 with the server
+            prior_knowledge (bool): speak HTTP/2 without negotiation, e.g. to an h2c server
+            client (httpx.AsyncClient): an existing client to use instead of a new one
+        """
+        super().__init__()
+        self.pool_maxsize = pool_maxsize
+        self._options = None
+        if client is None:
+            self._options = _httpx_client_options(pool_maxsize, keep_alive, http2,
+                                                  prior_knowledge)
+            client = httpx.AsyncClient(**self._options)
+        self.client = client
+
+    async def request(self, method: str,  # pylint: disable=invalid-overridden-method
+                      url: str,
+                      headers: dict or None = None,
+                      payload: dict or None = None,
+                      timeout: tuple or None = None) -> httpx.Response:
+        if payload is not None:
+            headers, payload = _json_headers(headers), self.codec.encode(payload)
+        response = await self.client.request(method, url,
+                                             headers=headers,
+                                             content=payload,
+                                             timeout=_httpx_timeout(timeout))
+        self.stats.record(response, response.num_bytes_downloaded, response.content)
+        return response
+
+    @asynccontextmanager
+    async def stream_async(self, method: str,
+                           url: str,
+                           headers: dict or None = None,
+                           timeout: tuple or None = None):
+        async with self.client.stream(method, url, headers=headers,
+                                      timeout=_httpx_timeout(timeout)) as response:
+            streamed = StreamedResponse(response.status_code, response.headers, response.url,
+                                        None)
+            streamed.chunks = _async_recorded_chunks(self.stats, streamed,
+                                                     response.aiter_bytes(STREAM_CHUNK_SIZE),
+                                                     lambda: response.num_bytes_downloaded)
+            yield streamed
+
+    async def close(self) -> None:  # pylint: disable=invalid-overridden-method
+        await self.client.aclose()
+
+    async def warmup(self, url: str,  # pylint: disable=invalid-overridden-method
+                     connections: int = 1) -> int:
+        """
+        Open connections by sending concurrent HEAD requests to the host, at most
+        `pool_maxsize`. With HTTP/2 they share a single connection.
+        """
+        return await _warm_up_async(self.client, url, min(connections, self.pool_maxsize))
+
+    def after_fork(self) -> None:
+        super().after_fork()
+        if self._options is not None:
+            self.client = httpx.AsyncClient(**self._options)
+
+
+class InMemoryResponse:
+    """
+    A canned response served by `InMemoryTransport`.
+    """
+
+    def __init__(self, status_code: int = 200,
+                 content: bytes = b"",
+                 headers: dict or None = None,
+                 url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        """ The response body decoded as UTF-8. """
+        return self.content.decode("utf-8")
+
+    def json(self) -> dict or list:
+        """ The response body decoded as JSON. """
+        return json.loads(self.content)
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport serving canned responses without any network I/O.
+
+    Responses are registered per method and endpoint; unknown routes get a 404.
+    """
+
+    def __init__(self, base_url: str = "https://circleci.com"):
+        """
+        Creates an InMemoryTransport.
+
+        Args:
+            base_url (str): the base URL stripped from request URLs to find routes
+        """
+        super().__init__()
+        self.base_url = base_url
+        self.routes = {}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def after_fork(self) -> None:
+        super().after_fork()
+        self._lock = threading.Lock()
+
+    def add_response(self, method: str,
+                     endpoint: str,
+                     data: dict or list or None = None,
+                     status_code: int = 200,
+                     headers: dict or None = None) -> None:
+        """
+        Register a canned response.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint including the query string, e.g. "/api/v2/me"
+            data (dict or list): JSON body of the response
+            status_code (int): HTTP status code
+            headers (dict): response headers
+        """
+        content = json.dumps(data if data is not None else {}).encode("utf-8")
+        self.routes[(method.upper(), endpoint)] = (status_code, content, headers or {})
+
+    def request(self, method: str,
+                url: str,
+                headers: dict or None = None,
+                payload: dict or None = None,
+                timeout: tuple or None = None) -> InMemoryResponse:
+        with self._lock:
+            self.calls += 1
+        endpoint = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        route = self.routes.get((method.upper(), endpoint))
+        if route is None:
+            return InMemoryResponse(404, b'{"message": "Not found"}', url=url)
+        status_code, content, response_headers = route
+        return InMemoryResponse(status_code, content, dict(response_headers), url)
+
+
+class AsyncInMemoryTransport(InMemoryTransport):
+    """
+    Asynchronous variant of `InMemoryTransport` for use with `AsyncCircleCI`.
+    """
+
+    async def request(self, method: str,  # pylint: disable=invalid-overridden-method
+                      url: str,
+                      headers: dict or None = None,
+                      payload: dict or None = None,
+                      timeout: tuple or None = None) -> InMemoryResponse:
+        return InMemoryTransport.request(self, method, url, headers, payload, timeout)
+
+    async def close(self) -> None:  # pylint: disable=invalid-overridden-method
+        pass
+
+    async def warmup(self, url: str,  # pylint: disable=invalid-overridden-method
+                     connections: int = 1) -> int:
+        return 0
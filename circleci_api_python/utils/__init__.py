@@ -3,25 +3,32 @@
 from __future__ import annotations
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
 
-def validate_login(base_url: str,
-                   headers: dict) -> tuple[bool, requests.Response]:
+def create_session(pool_connections: int = 10,
+                   pool_maxsize: int = 10,
+                   keep_alive: bool = True) -> requests.Session:
     """
-    Validate the login of the user.
+    Create a pooled HTTP session.
 
     Args:
-        base_url (str): The base URL of the CircleCI API.
-        headers (dict): The headers to use for the request.
+        pool_connections (int): The number of host pools to cache.
+        pool_maxsize (int): The maximum number of connections kept per host.
+        keep_alive (bool): Keep connections open between requests.
 
     Returns:
-        tuple[bool, requests.Response]: A tuple containing a boolean indicating if
-                                        the login was successful and the response.
+        requests.Session: The configured session.
     """
-    endpoint = '/api/v2/me'
-    response = requests.get(base_url + endpoint,
-                            headers=headers,
-                            timeout=3)
-    if response.status_code == 200:
-        return True, response
-    return False, response
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Advertise every encoding urllib3 can decode: gzip and deflate, plus brotli and zstd
+    # when the optional decoders are installed.
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
@@ -0,0 +1,99 @@
+""" Configurable fake transports shared by the test cases """
+import asyncio
+import json
+import time
+
+import requests
+
+from circleci_api_python.scheduler import current_priority
+from circleci_api_python.transport import (AsyncInMemoryTransport, InMemoryResponse,
+                                           InMemoryTransport)
+
+
+class FakeTransport(InMemoryTransport):
+    """
+    InMemoryTransport answering after a delay and recording how it was called.
+
+    Every request records its timeout and priority class and counts towards the highest number
+    of requests served at once. Registered routes are served as usual; any other route gets
+    `status_code` and `headers` with the body {"id": "abc", "call": n}, n being the 0-based
+    number of the call. Requests whose read timeout is below `latency` raise a ReadTimeout.
+    """
+
+    errors = (requests.Timeout,)
+    timeout_errors = (requests.ReadTimeout,)
+
+    def __init__(self, delay: float = 0.0,
+                 first_delay: float or None = None,
+                 latency: float = 0.0,
+                 status_code: int = 200,
+                 headers: dict or None = None):
+        """
+        Creates a FakeTransport.
+
+        Args:
+            delay (float): seconds every request takes
+            first_delay (float): seconds the first request takes instead of `delay`
+            latency (float): read timeouts below this time out
+            status_code (int): HTTP status code of the unregistered routes
+            headers (dict): response headers of the unregistered routes
+        """
+        super().__init__()
+        self.delay = delay
+        self.first_delay = first_delay
+        self.latency = latency
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.timeouts = []
+        self.priorities = []
+        self.active = 0
+        self.peak = 0
+
+    def _enter(self, timeout: tuple or None) -> tuple:
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+            self.timeouts.append(timeout)
+            self.priorities.append(current_priority())
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if call == 0 and self.first_delay is not None:
+            return call, self.first_delay
+        return call, self.delay
+
+    def _leave(self, method: str, url: str, call: int, timeout: tuple or None) -> InMemoryResponse:
+        with self._lock:
+            self.active -= 1
+        if timeout is not None and timeout[1] < self.latency:
+            raise requests.ReadTimeout(url)
+        endpoint = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        route = self.routes.get((method.upper(), endpoint))
+        if route is None:
+            content = json.dumps({"id": "abc", "call": call}).encode("utf-8")
+            return InMemoryResponse(self.status_code, content, dict(self.headers), url)
+        status_code, content, response_headers = route
+        return InMemoryResponse(status_code, content, dict(response_headers), url)
+
+    def request(self, method: str,
+                url: str,
+                headers: dict or None = None,
+                payload: dict or None = None,
+                timeout: tuple or None = None) -> InMemoryResponse:
+        call, delay = self._enter(timeout)
+        time.sleep(delay)
+        return self._leave(method, url, call, timeout)
+
+
+class AsyncFakeTransport(FakeTransport, AsyncInMemoryTransport):
+    """
+    Asynchronous variant of `FakeTransport` for use with `AsyncCircleCI`.
+    """
+
+    async def request(self, method: str,  # pylint: disable=invalid-overridden-method
+                      url: str,
+                      headers: dict or None = None,
+                      payload: dict or None = None,
+                      timeout: tuple or None = None) -> InMemoryResponse:
+        call, delay = self._enter(timeout)
+        await asyncio.sleep(delay)
+        return self._leave(method, url, call, timeout)
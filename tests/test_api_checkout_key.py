@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_checkout_key_successful(self, mock_post: Mock) -> None:
         """
         Test create checkout key successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Checkout key created successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_checkout_key_invalid_project(self, mock_post: Mock) -> None:
         """
         Test create checkout key with invalid project
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.create_checkout_key("gh/CircleCI-Public/nonexistent-project", "deploy-key")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_checkout_key_server_error(self, mock_post: Mock) -> None:
         """
         Test create checkout key with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.create_checkout_key("gh/CircleCI-Public/api-preview-docs", "deploy-key")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_checkout_keys_successful(self, mock_get: Mock) -> None:
         """
         Test get all checkout keys successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -93,13 +93,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'fingerprint': 'fingerprint1', 'type': 'deploy-key'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_checkout_keys_with_digest(self, mock_get: Mock) -> None:
         """
         Test get all checkout keys with digest
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -117,13 +117,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'fingerprint': 'fingerprint1', 'type': 'deploy-key'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_checkout_keys_not_found(self, mock_get: Mock) -> None:
         """
         Test get all checkout keys not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -137,13 +137,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_all_checkout_keys("gh/CircleCI-Public/nonexistent-project", "")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_checkout_keys_server_error(self, mock_get: Mock) -> None:
         """
         Test get all checkout keys with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -157,13 +157,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_all_checkout_keys("gh/CircleCI-Public/api-preview-docs", "")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_checkout_key_successful(self, mock_delete: Mock) -> None:
         """
         Test delete checkout key successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -180,13 +180,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Checkout key deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_checkout_key_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete checkout key not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -201,13 +201,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.delete_checkout_key("gh/CircleCI-Public/api-preview-docs",
                                        "nonexistent-fingerprint")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_checkout_key_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete checkout key with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -222,13 +222,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.delete_checkout_key("gh/CircleCI-Public/api-preview-docs",
                                        "fingerprint")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_checkout_key_successful(self, mock_get: Mock) -> None:
         """
         Test get checkout key successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -245,13 +245,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"fingerprint": "fingerprint1", "type": "deploy-key"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_checkout_key_not_found(self, mock_get: Mock) -> None:
         """
         Test get checkout key not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -266,13 +266,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_checkout_key("gh/CircleCI-Public/api-preview-docs",
                                     "nonexistent-fingerprint")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_checkout_key_server_error(self, mock_get: Mock) -> None:
         """
         Test get checkout key with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -287,13 +287,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_checkout_key("gh/CircleCI-Public/api-preview-docs",
                                     "fingerprint1")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_env_var_successful(self, mock_post: Mock) -> None:
         """
         Test create environment variable successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -311,13 +311,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {"message": "Environment variable created successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_env_var_invalid_project(self, mock_post: Mock) -> None:
         """
         Test create environment variable with invalid project
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -332,13 +332,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_env_var("gh/CircleCI-Public/invalid-project",
                                   "ENV_VAR", "value")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_env_var_server_error(self, mock_post: Mock) -> None:
         """
         Test create environment variable with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -353,13 +353,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_env_var("gh/CircleCI-Public/api-preview-docs",
                                   "ENV_VAR", "value")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_env_vars_successful(self, mock_get: Mock) -> None:
         """
         Test get all environment variables successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -375,13 +375,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {'response': [{'name': 'ENV_VAR', 'value': 'value'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_env_vars_not_found(self, mock_get: Mock) -> None:
         """
         Test get all environment variables not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -395,13 +395,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_all_env_vars("gh/CircleCI-Public/api-preview-docs")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_env_vars_server_error(self, mock_get: Mock) -> None:
         """
         Test get all environment variables with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -415,13 +415,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_all_env_vars("gh/CircleCI-Public/api-preview-docs")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_env_var_successful(self, mock_delete: Mock) -> None:
         """
         Test delete environment variable successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -439,13 +439,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {"message": "Environment variable deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_env_var_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete environment variable not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -460,13 +460,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.delete_env_var("gh/CircleCI-Public/api-preview-docs",
                                   "ENV_VAR")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_env_var_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete environment variable with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -481,13 +481,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.delete_env_var("gh/CircleCI-Public/api-preview-docs",
                                   "ENV_VAR")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_masked_env_var_successful(self, mock_get: Mock) -> None:
         """
         Test get masked environment variable successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -504,13 +504,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"name": "ENV_VAR", "value": "masked_value"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_masked_env_var_not_found(self, mock_get: Mock) -> None:
         """
         Test get masked environment variable not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -525,13 +525,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_masked_env_var("gh/CircleCI-Public/api-preview-docs",
                                       "ENV_VAR")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_masked_env_var_server_error(self, mock_get: Mock) -> None:
         """
         Test get masked environment variable with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client context endpoints """
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_context_successful(self, mock_post: Mock) -> None:
         """
         Test create context successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -32,13 +32,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data, {"name": "test_context",
                                              "owner": {"id": "owner_id", "type": "organization"}})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_context_invalid_owner(self, mock_post: Mock) -> None:
         """
         Test create context with invalid owner
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -52,13 +52,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.create_context("test_context", "invalid_owner")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_context_server_error(self, mock_post: Mock) -> None:
         """
         Test create context with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -72,13 +72,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.create_context("test_context", "owner_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_contexts_successful(self, mock_get: Mock) -> None:
         """
         Test list contexts successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -95,13 +95,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'id': 'context_id', 'name': 'context_name'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_contexts_not_found(self, mock_get: Mock) -> None:
         """
         Test list contexts not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -115,13 +115,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.list_contexts()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_contexts_server_error(self, mock_get: Mock) -> None:
         """
         Test list contexts with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -135,13 +135,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.list_contexts()
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_context_successful(self, mock_delete: Mock) -> None:
         """
         Test delete context successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -157,13 +157,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Context deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_context_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete context not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -177,13 +177,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_context("invalid_context_id")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_context_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete context with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -197,13 +197,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_context("context_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_context_successful(self, mock_get: Mock) -> None:
         """
         Test get context successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -219,13 +219,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "context_id", "name": "context_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_context_not_found(self, mock_get: Mock) -> None:
         """
         Test get context not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -239,13 +239,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_context("invalid_context_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_context_server_error(self, mock_get: Mock) -> None:
         """
         Test get context with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -259,13 +259,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_context("context_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_environment_variables_in_context_successful(self, mock_get: Mock) -> None:
         """
         Test list environment variables in context successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -281,13 +281,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {'response': [{'name': 'ENV_VAR', 'value': 'value'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_environment_variables_in_context_not_found(self, mock_get: Mock) -> None:
         """
         Test list environment variables in context not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -301,13 +301,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.list_environment_variables_in_context("invalid_context_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_environment_variables_in_context_server_error(self, mock_get: Mock) -> None:
         """
         Test list environment variables in context with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -321,13 +321,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.list_environment_variables_in_context("context_id")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_remove_environment_variable_from_context_successful(self, mock_delete: Mock) -> None:
         """
         Test remove environment variable from context successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -345,13 +345,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {"message": "Environment variable removed successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_remove_environment_variable_from_context_not_found(self, mock_delete: Mock) -> None:
         """
         Test remove environment variable from context not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -366,13 +366,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.remove_environment_variable_from_context("invalid_context_id",
                                                             "env_var_name")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_remove_environment_variable_from_context_server_error(self, mock_delete: Mock) -> None:
         """
         Test remove environment variable from context with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -387,13 +387,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.remove_environment_variable_from_context("context_id",
                                                             "env_var_name")
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_or_update_env_variable_successful(self, mock_put: Mock) -> None:
         """
         Test add or update environment variable successful
 
         Args:
-            mock_put (Mock): Mock object for requests.put
+            mock_put (Mock): Mock object for requests.Session.put
 
         Returns:
             None
@@ -413,13 +413,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {"message": "Environment variable added/updated successfully"})
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_or_update_env_variable_not_found(self, mock_put: Mock) -> None:
         """
         Test add or update environment variable not found
 
         Args:
-            mock_put (Mock): Mock object for requests.put
+            mock_put (Mock): Mock object for requests.Session.put
 
         Returns:
             None
@@ -435,13 +435,13 @@ class TestCircleCIClient(unittest.TestCase):
                                               "env_var_name",
                                               "env_var_value")
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_or_update_env_variable_server_error(self, mock_put: Mock) -> None:
         """
         Test add or update environment variable with server error
 
         Args:
-            mock_put (Mock): Mock object for requests.put
+            mock_put (Mock): Mock object for requests.Session.put
 
         Returns:
             None
@@ -457,13 +457,13 @@ class TestCircleCIClient(unittest.TestCase):
                                               "env_var_name",
                                               "env_var_value")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_context_restrictions_successful(self, mock_get: Mock) -> None:
         """
         Test get context restrictions successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -479,13 +479,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"restrictions": ["restriction1", "restriction2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_context_restrictions_not_found(self, mock_get: Mock) -> None:
         """
         Test get context restrictions not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -499,13 +499,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_context_restrictions("invalid_context_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_context_restrictions_server_error(self, mock_get: Mock) -> None:
         """
         Test get context restrictions with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -519,13 +519,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_context_restrictions("context_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_context_restriction_successful(self, mock_post: Mock) -> None:
         """
         Test create context restriction successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -543,13 +543,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Restriction created successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_context_restriction_invalid_context(self, mock_post: Mock) -> None:
         """
         Test create context restriction with invalid context
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -565,13 +565,13 @@ class TestCircleCIClient(unittest.TestCase):
                                               "restriction_type",
                                               "restriction_value")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_context_restriction_server_error(self, mock_post: Mock) -> None:
         """
         Test create context restriction with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -587,13 +587,13 @@ class TestCircleCIClient(unittest.TestCase):
                                               "restriction_type",
                                               "restriction_value")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_context_restriction_successful(self, mock_delete: Mock) -> None:
         """
         Test delete context restriction successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -610,13 +610,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Restriction deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_context_restriction_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete context restriction not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -631,13 +631,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.delete_context_restriction("invalid_context_id",
                                               "restriction_id")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_context_restriction_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete context restriction with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
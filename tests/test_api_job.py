@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_job_by_id_successful(self, mock_post: Mock) -> None:
         """
         Test cancel job by id successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Job cancelled successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_job_by_id_not_found(self, mock_post: Mock) -> None:
         """
         Test cancel job by id not found
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.cancel_job_by_id("invalid_job_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_job_by_id_server_error(self, mock_post: Mock) -> None:
         """
         Test cancel job by id with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.cancel_job_by_id("job_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_by_number_successful(self, mock_get: Mock) -> None:
         """
         Test get job by number successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -92,13 +92,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "job_id", "name": "job_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_by_number_not_found(self, mock_get: Mock) -> None:
         """
         Test get job by number not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -112,13 +112,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_job_by_number("gh/CircleCI-Public/api-preview-docs", 999)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_by_number_server_error(self, mock_get: Mock) -> None:
         """
         Test get job by number with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -132,13 +132,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_job_by_number("gh/CircleCI-Public/api-preview-docs", 1)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_job_by_number_successful(self, mock_post: Mock) -> None:
         """
         Test cancel job by number successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -154,13 +154,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Job cancelled successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_job_by_number_not_found(self, mock_post: Mock) -> None:
         """
         Test cancel job by number not found
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -174,13 +174,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.cancel_job_by_number("gh/CircleCI-Public/api-preview-docs", 999)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_job_by_number_server_error(self, mock_post: Mock) -> None:
         """
         Test cancel job by number with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -194,13 +194,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.cancel_job_by_number("gh/CircleCI-Public/api-preview-docs", 1)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_artifacts_successful(self, mock_get: Mock) -> None:
         """
         Test get job artifacts successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -217,13 +217,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'path': 'artifact_path', 'url': 'artifact_url'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_artifacts_not_found(self, mock_get: Mock) -> None:
         """
         Test get job artifacts not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -237,13 +237,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_job_artifacts("gh/CircleCI-Public/api-preview-docs", "999")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_artifacts_server_error(self, mock_get: Mock) -> None:
         """
         Test get job artifacts with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -257,13 +257,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_job_artifacts("gh/CircleCI-Public/api-preview-docs", "1")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_metadata_successful(self, mock_get: Mock) -> None:
         """
         Test get job metadata successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -279,13 +279,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"tests": ["test1", "test2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_metadata_not_found(self, mock_get: Mock) -> None:
         """
         Test get job metadata not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -299,13 +299,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_job_metadata("gh/CircleCI-Public/api-preview-docs", "999")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_job_metadata_server_error(self, mock_get: Mock) -> None:
         """
         Test get job metadata with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
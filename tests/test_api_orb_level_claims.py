@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_org_level_claims_successful(self, mock_delete: Mock) -> None:
         """
         Test delete org level claims successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Claims deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_org_level_claims_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete org level claims not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_org_level_claims("org_id", "claim1,claim2")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_org_level_claims_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete org level claims with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_org_level_claims("org_id", "claim1,claim2")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_org_level_claims_successful(self, mock_get: Mock) -> None:
         """
         Test get org level claims successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -92,13 +92,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"claims": ["claim1", "claim2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_org_level_claims_not_found(self, mock_get: Mock) -> None:
         """
         Test get org level claims not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -112,13 +112,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_org_level_claims("org_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_org_level_claims_server_error(self, mock_get: Mock) -> None:
         """
         Test get org level claims with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -132,13 +132,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_org_level_claims("org_id")
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_create_or_update_org_level_claims_successful(self, mock_patch: Mock) -> None:
         """
         Test create or update org level claims successful
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -155,13 +155,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Claims created or updated successfully"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_create_or_update_org_level_claims_invalid_org(self, mock_patch: Mock) -> None:
         """
         Test create or update org level claims with invalid
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -176,13 +176,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_or_update_org_level_claims("invalid_org_id", ["audience1", "audience2"],
                                                      "3600")
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_create_or_update_org_level_claims_server_error(self, mock_patch: Mock) -> None:
         """
         Test create or update org level claims with server error
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -196,13 +196,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.create_or_update_org_level_claims("org_id", ["audience1", "audience2"], "3600")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_project_level_claims_successful(self, mock_delete: Mock) -> None:
         """
         Test delete project level claims successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -218,13 +218,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Claims deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_project_level_claims_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete project level claims not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -238,13 +238,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_project_level_claims("org_id", "project_id", "claim1,claim2")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_project_level_claims_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete project level claims with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -258,13 +258,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_project_level_claims("org_id", "project_id", "claim1,claim2")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_level_claims_successful(self, mock_get: Mock) -> None:
         """
         Test get project level claims successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -280,13 +280,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"claims": ["claim1", "claim2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_level_claims_not_found(self, mock_get: Mock) -> None:
         """
         Test get project level claims not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -300,13 +300,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_project_level_claims("org_id", "project_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_level_claims_server_error(self, mock_get: Mock) -> None:
         """
         Test get project level claims with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -320,13 +320,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_project_level_claims("org_id", "project_id")
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_create_or_update_project_level_claims_successful(self, mock_patch: Mock) -> None:
         """
         Test create or update project level claims successful
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -343,13 +343,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Claims created or updated successfully"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_create_or_update_project_level_claims_invalid_org(self, mock_patch: Mock) -> None:
         """
         Test create or update project level claims with invalid
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -364,13 +364,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_or_update_project_level_claims("invalid_org_id", "project_id",
                                                          ["audience1", "audience2"], "3600")
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_create_or_update_project_level_claims_server_error(self, mock_patch: Mock) -> None:
         """
         Test create or update project level claims with server error
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_continue_pipeline_successful(self, mock_post: Mock) -> None:
         """
         Test continue pipeline successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -32,13 +32,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Pipeline continued successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_continue_pipeline_invalid_key(self, mock_post: Mock) -> None:
         """
         Test continue pipeline with invalid key
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -54,13 +54,13 @@ class TestCircleCIClient(unittest.TestCase):
                                      "configuration",
                                      {"param": "value"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_continue_pipeline_server_error(self, mock_post: Mock) -> None:
         """
         Test continue pipeline with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -76,13 +76,13 @@ class TestCircleCIClient(unittest.TestCase):
                                      "configuration",
                                      {"param": "value"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_by_id_successful(self, mock_get: Mock) -> None:
         """
         Test get pipeline by id successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -98,13 +98,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "pipeline_id", "name": "pipeline_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_by_id_not_found(self, mock_get: Mock) -> None:
         """
         Test get pipeline by id not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -118,13 +118,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_by_id("invalid_pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_by_id_server_error(self, mock_get: Mock) -> None:
         """
         Test get pipeline by id with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -138,13 +138,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_by_id("pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_config_by_id_successful(self, mock_get: Mock) -> None:
         """
         Test get pipeline config by id successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -160,13 +160,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"config": "pipeline_config"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_config_by_id_not_found(self, mock_get: Mock) -> None:
         """
         Test get pipeline config by id not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -180,13 +180,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_config_by_id("invalid_pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_config_by_id_server_error(self, mock_get: Mock) -> None:
         """
         Test get pipeline config by id with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -200,13 +200,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_config_by_id("pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_values_by_id_successful(self, mock_get: Mock) -> None:
         """
         Test get pipeline values by id successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -222,13 +222,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"values": "pipeline_values"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_values_by_id_not_found(self, mock_get: Mock) -> None:
         """
         Test get pipeline values by id not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -242,13 +242,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_values_by_id("invalid_pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_values_by_id_server_error(self, mock_get: Mock) -> None:
         """
         Test get pipeline values by id with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -262,13 +262,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_values_by_id("pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_workflow_by_id_successful(self, mock_get: Mock) -> None:
         """
         Test get pipeline workflow by id successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -284,13 +284,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"workflow": "workflow_data"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_workflow_by_id_not_found(self, mock_get: Mock) -> None:
         """
         Test get pipeline workflow by id not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -304,13 +304,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_workflow_by_id("invalid_pipeline_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_workflow_by_id_server_error(self, mock_get: Mock) -> None:
         """
         Test get pipeline workflow by id with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -324,13 +324,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_workflow_by_id("pipeline_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_trigger_pipeline_successful(self, mock_post: Mock) -> None:
         """
         Test trigger pipeline successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -346,13 +346,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Pipeline triggered successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_trigger_pipeline_server_error(self, mock_post: Mock) -> None:
         """
         Test trigger pipeline with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -366,13 +366,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.trigger_pipeline("gh/CircleCI-Public/api-preview-docs", branch="main")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_pipelines_for_project_successful(self, mock_get: Mock) -> None:
         """
         Test get all pipelines for project successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -388,13 +388,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"pipelines": ["pipeline1", "pipeline2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_pipelines_for_project_with_branch(self, mock_get: Mock) -> None:
         """
         Test get all pipelines for project with branch
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -411,13 +411,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"pipelines": ["pipeline1"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_pipelines_for_project_not_found(self, mock_get: Mock) -> None:
         """
         Test get all pipelines for project not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -431,13 +431,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_all_pipelines_for_project("invalid_project_slug")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_pipelines_for_project_server_error(self, mock_get: Mock) -> None:
         """
         Test get all pipelines for project with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -451,13 +451,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_all_pipelines_for_project("gh/CircleCI-Public/api-preview-docs")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_triggered_by_current_user_successful(self, mock_get: Mock) -> None:
         """
         Test get pipeline triggered by current user successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -474,13 +474,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"pipelines": ["pipeline1", "pipeline2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_triggered_by_current_user_with_page_token(self, mock_get: Mock) -> None:
         """
         Test get pipeline triggered by current user with page token
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -497,13 +497,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"pipelines": ["pipeline1"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_triggered_by_current_user_not_found(self, mock_get: Mock) -> None:
         """
         Test get pipeline triggered by current user not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -517,13 +517,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_triggered_by_current_user("invalid_project_slug")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_triggered_by_current_user_server_error(self, mock_get: Mock) -> None:
         """
         Test get pipeline triggered by current user with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -537,13 +537,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_triggered_by_current_user("gh/CircleCI-Public/api-preview-docs")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_by_number_successful(self, mock_get: Mock) -> None:
         """
         Test get pipeline by number successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -559,13 +559,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "pipeline_id", "name": "pipeline_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_by_number_not_found(self, mock_get: Mock) -> None:
         """
         Test get pipeline by number not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -579,13 +579,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_pipeline_by_number("gh/CircleCI-Public/api-preview-docs", 999)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pipeline_by_number_server_error(self, mock_get: Mock) -> None:
         """
         Test get pipeline by number with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
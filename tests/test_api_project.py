@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_successful(self, mock_get: Mock) -> None:
         """
         Test get project successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "project_id", "name": "project_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_not_found(self, mock_get: Mock) -> None:
         """
         Test get project not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_project("gh/CircleCI-Public/nonexistent-project")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_server_error(self, mock_get: Mock) -> None:
         """
         Test get project with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_project("gh/CircleCI-Public/api-preview-docs")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_new_project_successful(self, mock_post: Mock) -> None:
         """
         Test create new project successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -93,13 +93,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Project created successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_new_project_invalid_vcs_type(self, mock_post: Mock) -> None:
         """
         Test create new project with invalid VCS type
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -114,13 +114,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_new_project("invalid_vcs", "CircleCI-Public",
                                       "api-preview-docs")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_new_project_not_found(self, mock_post: Mock) -> None:
         """
         Test create new project not found
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -135,13 +135,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_new_project("gh", "NonExistentOrg",
                                       "NonExistentRepo")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_new_project_server_error(self, mock_post: Mock) -> None:
         """
         Test create new project with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -156,13 +156,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.create_new_project("gh", "CircleCI-Public",
                                       "api-preview-docs")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_setting_successful(self, mock_get: Mock) -> None:
         """
         Test get project setting successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -179,13 +179,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"settings": "some_settings"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_setting_not_found(self, mock_get: Mock) -> None:
         """
         Test get project setting not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -200,13 +200,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_project_setting("gh", "NonExistentOrg",
                                        "NonExistentRepo")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_project_setting_server_error(self, mock_get: Mock) -> None:
         """
         Test get project setting with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -221,13 +221,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_project_setting("gh", "CircleCI-Public",
                                        "api-preview-docs")
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_update_project_setting_successful(self, mock_patch: Mock) -> None:
         """
         Test update project setting successful
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -245,13 +245,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Settings updated successfully"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_update_project_setting_invalid_vcs_type(self, mock_patch: Mock) -> None:
         """
         Test update project setting with invalid VCS type
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -267,13 +267,13 @@ class TestCircleCIClient(unittest.TestCase):
                                           "api-preview-docs",
                                           {"key": "value"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_update_project_setting_not_found(self, mock_patch: Mock) -> None:
         """
         Test update project setting not found
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -289,13 +289,13 @@ class TestCircleCIClient(unittest.TestCase):
                                           "NonExistentRepo",
                                           {"key": "value"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_update_project_setting_server_error(self, mock_patch: Mock) -> None:
         """
         Test update project setting with server error
 
         Args:
-            mock_patch (Mock): Mock object for requests.patch
+            mock_patch (Mock): Mock object for requests.Session.patch
 
         Returns:
             None
@@ -311,13 +311,13 @@ class TestCircleCIClient(unittest.TestCase):
                                           "api-preview-docs",
                                           {"key": "value"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_last_build_artifacts_by_project_name_successful(self, mock_get: Mock) -> None:
         """
         Test get last build artifacts by project name successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -350,14 +350,14 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'path': 'artifact_path', 'url': 'artifact_url'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_last_build_artifacts_by_project_name_pipeline_not_found(self,
                                                                          mock_get: Mock) -> None:
         """
         Test get last build artifacts by project name pipeline not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -373,14 +373,14 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_last_build_artifacts_by_project_name("gh/CircleCI-Public/api-preview-docs",
                                                             "main")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_last_build_artifacts_by_project_name_workflow_not_found(self,
                                                                          mock_get: Mock) -> None:
         """
         Test get last build artifacts by project name workflow not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -400,13 +400,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_last_build_artifacts_by_project_name("gh/CircleCI-Public/api-preview-docs",
                                                             "main")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_last_build_artifacts_by_project_name_job_not_found(self, mock_get: Mock) -> None:
         """
         Test get last build artifacts by project name job not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -431,13 +431,13 @@ class TestCircleCIClient(unittest.TestCase):
             client.get_last_build_artifacts_by_project_name("gh/CircleCI-Public/api-preview-docs",
                                                             "main")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_last_build_artifacts_by_project_name_server_error(self, mock_get: Mock) -> None:
         """
         Test get last build artifacts by project name with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
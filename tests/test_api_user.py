@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_current_user_information_successful(self, mock_get: Mock) -> None:
         """
         Test get current user information successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "user_id", "name": "user_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_current_user_information_not_found(self, mock_get: Mock) -> None:
         """
         Test get current user information not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_current_user_information()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_current_user_information_server_error(self, mock_get: Mock) -> None:
         """
         Test get current user information with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_current_user_information()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_projects_successful(self, mock_get: Mock) -> None:
         """
         Test get user projects successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -93,13 +93,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'id': 'project_id', 'name': 'project_name'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_projects_not_found(self, mock_get: Mock) -> None:
         """
         Test get user projects not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -113,13 +113,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_user_projects()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_projects_server_error(self, mock_get: Mock) -> None:
         """
         Test get user projects with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -133,13 +133,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_user_projects()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_collaborations_successful(self, mock_get: Mock) -> None:
         """
         Test get user collaborations successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -156,13 +156,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {'response': [{'id': 'collab_id', 'name': 'collab_name'}]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_collaborations_not_found(self, mock_get: Mock) -> None:
         """
         Test get user collaborations not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -176,13 +176,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_user_collaborations()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_collaborations_server_error(self, mock_get: Mock) -> None:
         """
         Test get user collaborations with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -196,13 +196,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_user_collaborations()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_information_successful(self, mock_get: Mock) -> None:
         """
         Test get user information successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -218,13 +218,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "user_id", "name": "user_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_information_not_found(self, mock_get: Mock) -> None:
         """
         Test get user information not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -238,13 +238,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_user_information("invalid_user_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_user_information_server_error(self, mock_get: Mock) -> None:
         """
         Test get user information with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -258,13 +258,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_user_information("user_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_list_of_pipelines_user_follow_successful(self, mock_get: Mock) -> None:
         """
         Test get list of pipelines user follow successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -280,13 +280,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"pipelines": ["pipeline1", "pipeline2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_list_of_pipelines_user_follow_not_found(self, mock_get: Mock) -> None:
         """
         Test get list of pipelines user follow not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -300,13 +300,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_list_of_pipelines_user_follow(org_slug="invalid_org_slug")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_list_of_pipelines_user_follow_server_error(self, mock_get: Mock) -> None:
         """
         Test get list of pipelines user follow with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
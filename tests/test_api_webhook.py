@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_webhooks_successful(self, mock_get: Mock) -> None:
         """
         Test get webhooks successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"webhooks": ["webhook1", "webhook2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_webhooks_not_found(self, mock_get: Mock) -> None:
         """
         Test get webhooks not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_webhooks("invalid_scope_id", "scope_type")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_webhooks_server_error(self, mock_get: Mock) -> None:
         """
         Test get webhooks with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_webhooks("scope_id", "scope_type")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_outbound_webhook_successful(self, mock_post: Mock) -> None:
         """
         Test create outbound webhook successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -99,13 +99,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Webhook created successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_outbound_webhook_invalid_scope(self, mock_post: Mock) -> None:
         """
         Test create outbound webhook with invalid scope
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -126,13 +126,13 @@ class TestCircleCIClient(unittest.TestCase):
                 scope={"type": "invalid_type", "id": "project_id"}
             )
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_outbound_webhook_server_error(self, mock_post: Mock) -> None:
         """
         Test create outbound webhook with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -153,13 +153,13 @@ class TestCircleCIClient(unittest.TestCase):
                 scope={"type": "project", "id": "project_id"}
             )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_webhook_by_id_successful(self, mock_get: Mock) -> None:
         """
         Test get webhook by id successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -175,13 +175,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "webhook_id", "name": "webhook_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_webhook_by_id_not_found(self, mock_get: Mock) -> None:
         """
         Test get webhook by id not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -195,13 +195,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_webhook_by_id("webhook_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_webhook_by_id_server_error(self, mock_get: Mock) -> None:
         """
         Test get webhook by id with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -215,13 +215,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_webhook_by_id("webhook_id")
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_update_webhook_by_id_successful(self, mock_put: Mock) -> None:
         """
         Test update webhook by id successful
 
         Args:
-            mock_put (Mock): Mock object for requests.put
+            mock_put (Mock): Mock object for requests.Session.put
 
         Returns:
             None
@@ -244,13 +244,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Webhook updated successfully"})
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_update_webhook_by_id_not_found(self, mock_put: Mock) -> None:
         """
         Test update webhook by id not found
 
         Args:
-            mock_put (Mock): Mock object for requests.put
+            mock_put (Mock): Mock object for requests.Session.put
 
         Returns:
             None
@@ -271,13 +271,13 @@ class TestCircleCIClient(unittest.TestCase):
                 signing_secret="new_secret"
             )
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_update_webhook_by_id_server_error(self, mock_put: Mock) -> None:
         """
         Test update webhook by id with server error
 
         Args:
-            mock_put (Mock): Mock object for requests.put
+            mock_put (Mock): Mock object for requests.Session.put
 
         Returns:
             None
@@ -298,13 +298,13 @@ class TestCircleCIClient(unittest.TestCase):
                 signing_secret="new_secret"
             )
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_webhook_by_id_successful(self, mock_delete: Mock) -> None:
         """
         Test delete webhook by id successful
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -320,13 +320,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Webhook deleted successfully"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_webhook_by_id_not_found(self, mock_delete: Mock) -> None:
         """
         Test delete webhook by id not found
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
@@ -340,13 +340,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.delete_webhook_by_id("webhook_id")
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_webhook_by_id_server_error(self, mock_delete: Mock) -> None:
         """
         Test delete webhook by id with server error
 
         Args:
-            mock_delete (Mock): Mock object for requests.delete
+            mock_delete (Mock): Mock object for requests.Session.delete
 
         Returns:
             None
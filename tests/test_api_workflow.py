@@ -8,13 +8,13 @@ from circleci_api_python.client import CircleCI, CircleCIError
 class TestCircleCIClient(unittest.TestCase):
     """ Tests for the CircleCI client. """
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_workflow_by_id_successful(self, mock_get: Mock) -> None:
         """
         Test get workflow by id successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -30,13 +30,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"id": "workflow_id", "name": "workflow_name"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_workflow_by_id_not_found(self, mock_get: Mock) -> None:
         """
         Test get workflow by id not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -50,13 +50,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_workflow_by_id("invalid_workflow_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_workflow_by_id_server_error(self, mock_get: Mock) -> None:
         """
         Test get workflow by id with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -70,13 +70,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_workflow_by_id("workflow_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_approve_workflow_job_successful(self, mock_post: Mock) -> None:
         """
         Test approve workflow job successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -92,13 +92,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Job approved successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_approve_workflow_job_not_found(self, mock_post: Mock) -> None:
         """
         Test approve workflow job not found
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -112,13 +112,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.approve_workflow_job("invalid_workflow_id", "invalid_job_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_approve_workflow_job_server_error(self, mock_post: Mock) -> None:
         """
         Test approve workflow job with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -132,13 +132,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.approve_workflow_job("workflow_id", "job_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_workflow_successful(self, mock_post: Mock) -> None:
         """
         Test cancel workflow successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -154,13 +154,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Workflow cancelled successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_workflow_not_found(self, mock_post: Mock) -> None:
         """
         Test cancel workflow not found
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -174,13 +174,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.cancel_workflow("invalid_workflow_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_cancel_workflow_server_error(self, mock_post: Mock) -> None:
         """
         Test cancel workflow with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -194,13 +194,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.cancel_workflow("workflow_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_jobs_for_workflow_successful(self, mock_get: Mock) -> None:
         """
         Test get all jobs for workflow successful
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -216,13 +216,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"jobs": ["job1", "job2"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_jobs_for_workflow_with_page_token(self, mock_get: Mock) -> None:
         """
         Test get all jobs for workflow with page token
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -238,13 +238,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"jobs": ["job1"]})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_jobs_for_workflow_not_found(self, mock_get: Mock) -> None:
         """
         Test get all jobs for workflow not found
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -258,13 +258,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_workflow_jobs("invalid_workflow_id")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_all_jobs_for_workflow_server_error(self, mock_get: Mock) -> None:
         """
         Test get all jobs for workflow with server error
 
         Args:
-            mock_get (Mock): Mock object for requests.get
+            mock_get (Mock): Mock object for requests.Session.get
 
         Returns:
             None
@@ -278,13 +278,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.get_workflow_jobs("workflow_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_rerun_workflow_successful(self, mock_post: Mock) -> None:
         """
         Test rerun workflow successful
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -300,13 +300,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Workflow rerun successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_rerun_workflow_with_ssh(self, mock_post: Mock) -> None:
         """
         Test rerun workflow with SSH
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -322,13 +322,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Workflow rerun with SSH successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_rerun_workflow_from_failed(self, mock_post: Mock) -> None:
         """
         Test rerun workflow from failed
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -344,13 +344,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.metadata.status_code, 200)
         self.assertEqual(response.raw_data, {"message": "Workflow rerun from failed successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_rerun_workflow_with_jobs(self, mock_post: Mock) -> None:
         """
         Test rerun workflow with jobs
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -368,13 +368,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.raw_data,
                          {"message": "Workflow rerun with specific jobs successfully"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_rerun_workflow_not_found(self, mock_post: Mock) -> None:
         """
         Test rerun workflow not found
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -388,13 +388,13 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             client.rerun_workflow("invalid_workflow_id")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_rerun_workflow_server_error(self, mock_post: Mock) -> None:
         """
         Test rerun workflow with server error
 
         Args:
-            mock_post (Mock): Mock object for requests.post
+            mock_post (Mock): Mock object for requests.Session.post
 
         Returns:
             None
@@ -0,0 +1,177 @@
+""" Test cases for the AsyncCircleCI class """
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, Mock
+
+from circleci_api_python import AsyncCircleCI, CircleCIError
+from circleci_api_python.resources import CircleCIPropertyHolder
+
+
+def make_response(status_code: int, data) -> Mock:
+    """
+    Build a mocked httpx response.
+
+    Args:
+        status_code (int): HTTP status code
+        data (dict or list): decoded JSON body
+
+    Returns:
+        Mock: the mocked response
+    """
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.url = "https://circleci.com/api/v2/dummy"
+    response.json.return_value = data
+    return response
+
+
+class TestAsyncCircleCIClient(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the AsyncCircleCI class
+    """
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    async def test_get_context_successful(self, mock_request):
+        """
+        Test that an endpoint method is a coroutine returning a CircleCIPropertyHolder
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_request.return_value = make_response(200, {"id": "context_id", "name": "ctx"})
+
+        async with AsyncCircleCI(token="dummy_token") as client:
+            response = await client.get_context("context_id")
+
+        self.assertIsInstance(response, CircleCIPropertyHolder)
+        self.assertEqual(response.name, "ctx")
+        self.assertEqual(response.metadata.status_code, 200)
+        method, url = mock_request.call_args.args
+        self.assertEqual(method, "GET")
+        self.assertEqual(url, "https://circleci.com/api/v2/context/context_id")
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    async def test_post_payload_sent(self, mock_request):
+        """
+        Test that payloads are passed to the async connection pool
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_request.return_value = make_response(201, {"id": "pipeline_id"})
+
+        async with AsyncCircleCI(token="dummy_token") as client:
+            response = await client.trigger_pipeline("gh/org/repo", branch="main")
+
+        self.assertEqual(response.id, "pipeline_id")
+        self.assertEqual(json.loads(mock_request.call_args.kwargs["content"]), {"branch": "main"})
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["Content-Type"],
+                         "application/json")
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    async def test_error_response_raises(self, mock_request):
+        """
+        Test that an unsuccessful response raises a CircleCIError
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_request.return_value = make_response(404, {"message": "Not Found"})
+
+        async with AsyncCircleCI(token="dummy_token") as client:
+            with self.assertRaises(CircleCIError):
+                await client.get_workflow_by_id("workflow_id")
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    async def test_login_validation_deferred(self, mock_request):
+        """
+        Test that login validation happens on the first request
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_request.return_value = make_response(401, {"message": "Unauthorized"})
+
+        async with AsyncCircleCI(token="dummy_token", login_validation=True) as client:
+            mock_request.assert_not_called()
+            with self.assertRaises(CircleCIError) as context:
+                await client.list_contexts()
+        self.assertIn("Cannot login", context.exception.text)
+        mock_request.assert_called_once()
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    async def test_current_user_information_cached(self, mock_request):
+        """
+        Test that the current user is fetched once
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_request.return_value = make_response(200, {"login": "user"})
+
+        async with AsyncCircleCI(token="dummy_token") as client:
+            first = await client.get_current_user_information()
+            second = await client.get_current_user_information()
+
+        self.assertIs(first, second)
+        mock_request.assert_called_once()
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    async def test_last_build_artifacts(self, mock_request):
+        """
+        Test the composite artifacts method awaits each step
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_request.side_effect = [
+            make_response(200, {"items": [{"id": "pipeline_id"}]}),
+            make_response(200, {"items": [{"id": "workflow_id"}]}),
+            make_response(200, {"items": [{"job_number": 7}]}),
+            make_response(200, {"items": [{"url": "https://artifact"}]}),
+        ]
+
+        async with AsyncCircleCI(token="dummy_token") as client:
+            response = await client.get_last_build_artifacts_by_project_name("gh/org/repo",
+                                                                             "main")
+
+        self.assertEqual(response.items[0].url, "https://artifact")
+        self.assertEqual(mock_request.call_args.args[1],
+                         "https://circleci.com/api/v2/project/gh/org/repo/7/artifacts")
+
+    async def test_sync_context_manager_rejected(self):
+        """
+        Test that a plain `with` block points at `async with` instead of leaking the pool
+
+        Returns:
+            None
+        """
+        client = AsyncCircleCI(token="dummy_token")
+
+        with self.assertRaisesRegex(TypeError, "async with"):
+            with client:
+                pass
+        await client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
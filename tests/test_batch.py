@@ -0,0 +1,256 @@
+""" Test cases for batch execution of client calls """
+import asyncio
+import threading
+import time
+import unittest
+
+from circleci_api_python import (AdaptiveConcurrencyLimiter, AsyncCircleCI, CircleCIError,
+                                 time_budget)
+from circleci_api_python.batch import DEFAULT_CONCURRENCY
+from circleci_api_python.client import CircleCI
+from circleci_api_python.deadline import remaining_budget
+from circleci_api_python.transport import InMemoryResponse, Transport
+
+
+class PipelineTransport(Transport):
+    """
+    Transport answering pipeline lookups after a delay, failing the pipelines named "missing".
+    """
+
+    def __init__(self, delay: float = 0.02):
+        super().__init__()
+        self.delay = delay
+        self.urls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _respond(self, url):
+        with self.lock:
+            self.urls.append(url)
+        pipeline_id = url.rsplit("/", 1)[-1]
+        if pipeline_id == "missing":
+            return InMemoryResponse(404, b'{"message": "Not found"}', url=url)
+        return InMemoryResponse(200, f'{{"id": "{pipeline_id}"}}'.encode(), url=url)
+
+    def request(self, method, url, headers=None, payload=None, timeout=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return self._respond(url)
+
+
+class AsyncPipelineTransport(PipelineTransport):
+    """
+    Asynchronous variant of PipelineTransport.
+    """
+
+    async def request(self, method, url,  # pylint: disable=invalid-overridden-method
+                      headers=None, payload=None, timeout=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return self._respond(url)
+
+    async def close(self):  # pylint: disable=invalid-overridden-method
+        pass
+
+
+class TestClientMap(unittest.TestCase):
+    """
+    Test cases for CircleCI.map
+    """
+
+    def setUp(self):
+        """
+        Create a client with a delayed transport
+
+        Returns:
+            None
+        """
+        self.transport = PipelineTransport()
+        self.client = CircleCI(token="dummy_token", max_retries=0, transport=self.transport)
+
+    def test_results_and_errors_per_item(self):
+        """
+        Test that a failing item is reported without aborting the others
+
+        Returns:
+            None
+        """
+        results = list(self.client.map("get_pipeline_by_id", ["a", "missing", "b"]))
+
+        self.assertEqual(len(results), 3)
+        by_index = {result.index: result for result in results}
+        self.assertEqual(by_index[0].value.id, "a")
+        self.assertEqual(by_index[2].result().id, "b")
+        self.assertFalse(by_index[1].ok)
+        self.assertEqual(by_index[1].item, "missing")
+        self.assertIsInstance(by_index[1].error, CircleCIError)
+        with self.assertRaises(CircleCIError):
+            by_index[1].result()
+
+    def test_argument_forms(self):
+        """
+        Test that items may be tuples, dicts or single arguments
+
+        Returns:
+            None
+        """
+        items = [("a",), {"pipeline_id": "b"}, "c"]
+
+        values = sorted(result.value.id
+                        for result in self.client.map(self.client.get_pipeline_by_id, items))
+
+        self.assertEqual(values, ["a", "b", "c"])
+
+    def test_concurrency_bounded(self):
+        """
+        Test that no more than `concurrency` calls run at once
+
+        Returns:
+            None
+        """
+        results = list(self.client.map("get_pipeline_by_id",
+                                       (str(index) for index in range(12)), concurrency=3))
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(self.transport.peak, 3)
+
+    def test_closing_stops_scheduling(self):
+        """
+        Test that breaking out of the loop stops scheduling the remaining items
+
+        Returns:
+            None
+        """
+        consumed = []
+
+        def items():
+            for index in range(100):
+                consumed.append(index)
+                yield str(index)
+
+        for _ in self.client.map("get_pipeline_by_id", items(), concurrency=2):
+            break
+
+        self.assertLessEqual(len(consumed), 4)
+        self.assertLessEqual(len(self.transport.urls), 4)
+
+    def test_time_budget_applies_to_calls(self):
+        """
+        Test that calls run within the time budget of the caller
+
+        Returns:
+            None
+        """
+        with time_budget(30):
+            results = list(self.client.map(lambda _: remaining_budget(), [1, 2]))
+
+        for result in results:
+            self.assertLessEqual(result.value, 30)
+
+    def test_default_concurrency(self):
+        """
+        Test that the default concurrency follows the concurrency limiter
+
+        Returns:
+            None
+        """
+        self.assertEqual(self.client.batch().concurrency, DEFAULT_CONCURRENCY)
+        client = CircleCI(token="dummy_token", transport=self.transport,
+                          concurrency_limiter=AdaptiveConcurrencyLimiter(max_limit=5))
+        self.assertEqual(client.batch().concurrency, 5)
+
+
+class TestClientBatch(unittest.TestCase):
+    """
+    Test cases for CircleCI.batch
+    """
+
+    def test_futures(self):
+        """
+        Test that submitted calls return futures holding their outcome
+
+        Returns:
+            None
+        """
+        client = CircleCI(token="dummy_token", max_retries=0, transport=PipelineTransport())
+
+        with client.batch(concurrency=2) as batch:
+            found = batch.submit(client.get_pipeline_by_id, "a")
+            missing = batch.submit(client.get_pipeline_by_id, "missing")
+            completed = list(batch.as_completed())
+
+        self.assertEqual(len(completed), 2)
+        self.assertEqual(found.result().id, "a")
+        self.assertIsInstance(missing.exception(), CircleCIError)
+
+    def test_cancel_drops_pending_calls(self):
+        """
+        Test that cancelling drops the calls not started and refuses new ones
+
+        Returns:
+            None
+        """
+        transport = PipelineTransport(delay=0.05)
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        with client.batch(concurrency=1) as batch:
+            submitted = [batch.submit(client.get_pipeline_by_id, str(index))
+                         for index in range(5)]
+            self.assertGreaterEqual(batch.cancel(), 3)
+            with self.assertRaises(RuntimeError):
+                batch.submit(client.get_pipeline_by_id, "late")
+
+        self.assertTrue(submitted[-1].cancelled())
+        self.assertLessEqual(len(transport.urls), 2)
+
+
+class TestAsyncClientBatch(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for AsyncCircleCI.map and AsyncCircleCI.batch
+    """
+
+    async def test_map(self):
+        """
+        Test that outcomes are yielded per item within the concurrency bound
+
+        Returns:
+            None
+        """
+        transport = AsyncPipelineTransport()
+        async with AsyncCircleCI(token="dummy_token", max_retries=0,
+                                 transport=transport) as client:
+            results = [result async for result in client.map(
+                "get_pipeline_by_id", ["a", "missing", "b", "c"], concurrency=2)]
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(sorted(result.value.id for result in results if result.ok),
+                         ["a", "b", "c"])
+        self.assertEqual([result.item for result in results if not result.ok], ["missing"])
+        self.assertEqual(transport.peak, 2)
+
+    async def test_batch(self):
+        """
+        Test that submitted calls return tasks holding their outcome
+
+        Returns:
+            None
+        """
+        transport = AsyncPipelineTransport()
+        async with AsyncCircleCI(token="dummy_token", transport=transport) as client:
+            async with client.batch(concurrency=2) as batch:
+                tasks = [batch.submit(client.get_pipeline_by_id, str(index))
+                         for index in range(6)]
+
+        self.assertEqual([task.result().id for task in tasks], [str(i) for i in range(6)])
+        self.assertEqual(transport.peak, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+""" Test cases for the circuit breakers """
+import unittest
+from unittest.mock import patch
+
+from circleci_api_python import RateLimiter, time_budget
+from circleci_api_python.breaker import CircuitBreaker, CircuitBreakers, endpoint_family
+from circleci_api_python.client import CircleCI
+from circleci_api_python.exceptions import (CircleCIError, CircuitOpenError,
+                                            DeadlineExceededError)
+from circleci_api_python.transport import InMemoryTransport
+
+
+class TestEndpointFamily(unittest.TestCase):
+    """
+    Test cases for the endpoint_family function
+    """
+
+    def test_families(self):
+        """
+        Test the classification of the client endpoints
+
+        Returns:
+            None
+        """
+        cases = {
+            "/api/v2/pipeline/abc/config": "pipeline",
+            "/api/v2/project/gh/org/repo/pipeline?branch=main": "pipeline",
+            "/api/v2/project/gh/org/repo/pipeline/12": "pipeline",
+            "/api/v2/workflow/abc/job": "workflow",
+            "/api/v2/job/abc/cancel": "job",
+            "/api/v2/project/gh/org/repo/job/12": "job",
+            "/api/v2/project/gh/org/repo/12/artifacts": "job",
+            "/api/v2/project/gh/org/repo/12/tests": "job",
+            "/api/v2/context/abc/environment-variable": "context",
+            "/api/v2/webhook?scope-id=abc&scope-type=project": "webhook",
+            "/api/v2/project/gh/org/repo/checkout-key": "project",
+            "/api/v2/project/gh/org/repo": "project",
+            "/api/v1.1/projects": "project",
+            "/api/v2/org/abc/oidc-custom-claims?claims=audience": "oidc",
+            "/api/v2/org/abc/project/def/oidc-custom-claims": "oidc",
+            "/api/v2/me/collaborations": "user",
+        }
+        for endpoint, family in cases.items():
+            self.assertEqual(endpoint_family(endpoint), family, endpoint)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """
+    Test cases for the CircuitBreaker class
+    """
+
+    def test_opens_after_threshold(self):
+        """
+        Test that consecutive failures open the breaker
+
+        Returns:
+            None
+        """
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertGreater(breaker.retry_in, 59)
+
+    @patch('circleci_api_python.breaker.time.monotonic')
+    def test_half_open_probe(self, mock_monotonic):
+        """
+        Test that a single probe is let through after the recovery timeout
+
+        Args:
+            mock_monotonic (Mock): Mock object for the time.monotonic
+
+        Returns:
+            None
+        """
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 111.0
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @patch('circleci_api_python.breaker.time.monotonic')
+    def test_failed_probe_reopens(self, mock_monotonic):
+        """
+        Test that a failed probe opens the breaker again
+
+        Args:
+            mock_monotonic (Mock): Mock object for the time.monotonic
+
+        Returns:
+            None
+        """
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+        for _ in range(3):
+            breaker.record_failure()
+
+        mock_monotonic.return_value = 111.0
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    @patch('circleci_api_python.breaker.time.monotonic')
+    def test_released_probe(self, mock_monotonic):
+        """
+        Test that a released probe lets the next one through
+
+        Args:
+            mock_monotonic (Mock): Mock object for the time.monotonic
+
+        Returns:
+            None
+        """
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 111.0
+        self.assertTrue(breaker.allow())
+        breaker.release_probe()
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+
+class TestClientCircuitBreakers(unittest.TestCase):
+    """
+    Test cases for circuit breaking performed by the CircleCI client
+    """
+
+    def test_open_family_fails_fast(self):
+        """
+        Test that an open workflow breaker rejects workflow calls but not context calls
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/workflow/abc", {"message": "down"},
+                               status_code=500)
+        transport.add_response("GET", "/api/v2/context/abc", {"id": "abc"})
+        breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+        client = CircleCI(token="dummy_token", transport=transport, circuit_breakers=breakers)
+
+        for _ in range(2):
+            with self.assertRaises(CircleCIError):
+                client.get_workflow_by_id("abc")
+        with self.assertRaises(CircuitOpenError) as context:
+            client.get_workflow_by_id("abc")
+
+        self.assertEqual(context.exception.family, "workflow")
+        self.assertEqual(transport.calls, 2)
+        self.assertEqual(client.get_context("abc").id, "abc")
+        self.assertEqual(breakers.states(), {"workflow": "open", "context": "closed"})
+
+    def test_client_errors_keep_breaker_closed(self):
+        """
+        Test that 4xx responses do not count as failures
+
+        Returns:
+            None
+        """
+        breakers = CircuitBreakers(failure_threshold=1)
+        client = CircleCI(token="dummy_token", transport=InMemoryTransport(),
+                          circuit_breakers=breakers)
+
+        for _ in range(3):
+            with self.assertRaises(CircleCIError) as context:
+                client.get_pipeline_by_id("missing")
+            self.assertNotIsInstance(context.exception, CircuitOpenError)
+
+        self.assertEqual(breakers.states(), {"pipeline": "closed"})
+
+    def test_abandoned_probe_released(self):
+        """
+        Test that probes abandoned by the rate limiter or an unexpected error are given back
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/context/abc", {"id": "abc"})
+        breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=0)
+        limiter = RateLimiter()
+        client = CircleCI(token="dummy_token", transport=transport, circuit_breakers=breakers,
+                          rate_limiter=limiter)
+        breakers.get("context").record_failure()
+
+        with patch.object(limiter, 'reserve', return_value=5.0), time_budget(1):
+            with self.assertRaises(DeadlineExceededError):
+                client.get_context("abc")
+        with patch.object(transport, 'request', side_effect=ValueError("bad response")):
+            with self.assertRaises(ValueError):
+                client.get_context("abc")
+
+        self.assertEqual(client.get_context("abc").id, "abc")
+        self.assertEqual(breakers.states(), {"context": "closed"})
+
+
+if __name__ == '__main__':
+    unittest.main()
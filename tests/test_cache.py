@@ -0,0 +1,172 @@
+""" Test cases for the conditional GET cache """
+import unittest
+
+from circleci_api_python.cache import ConditionalCache
+from circleci_api_python.client import CircleCI
+from circleci_api_python.transport import InMemoryResponse, Transport
+
+
+class ETagTransport(Transport):
+    """
+    Transport answering 304 when the request carries the current ETag.
+    """
+
+    def __init__(self, body: bytes, etag: str = '"v1"'):
+        super().__init__()
+        self.body = body
+        self.etag = etag
+        self.sent_headers = []
+
+    def request(self, method, url, headers=None, payload=None, timeout=None):
+        self.sent_headers.append(dict(headers))
+        if headers.get('If-None-Match') == self.etag:
+            return InMemoryResponse(304, b"", {'ETag': self.etag}, url)
+        return InMemoryResponse(200, self.body, {'ETag': self.etag}, url)
+
+
+class TestConditionalCache(unittest.TestCase):
+    """
+    Test cases for the ConditionalCache class
+    """
+
+    def test_not_modified_replays_body(self):
+        """
+        Test that a 304 answer rebuilds the previous result from the cached body
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"id": "wf", "status": "running"}')
+        cache = ConditionalCache()
+        client = CircleCI(token="dummy_token", transport=transport, conditional_cache=cache)
+
+        first = client.get_workflow_by_id("wf")
+        second = client.get_workflow_by_id("wf")
+
+        self.assertNotIn('If-None-Match', transport.sent_headers[0])
+        self.assertEqual(transport.sent_headers[1]['If-None-Match'], '"v1"')
+        self.assertEqual(second.status, "running")
+        self.assertEqual(second.raw_data, first.raw_data)
+        self.assertEqual(second.metadata.status_code, 200)
+        self.assertEqual(cache.hits, 1)
+
+    def test_changed_resource_refreshes_entry(self):
+        """
+        Test that a new ETag replaces the cached body
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"status": "running"}')
+        client = CircleCI(token="dummy_token", transport=transport,
+                          conditional_cache=ConditionalCache())
+
+        client.get_pipeline_by_id("p")
+        transport.body, transport.etag = b'{"status": "success"}', '"v2"'
+        response = client.get_pipeline_by_id("p")
+
+        self.assertEqual(response.status, "success")
+        self.assertEqual(client.get_pipeline_by_id("p").status, "success")
+
+    def test_replayed_body_not_shared(self):
+        """
+        Test that changing the nested objects of a result leaves the cached body untouched
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"items": [{"id": "job", "status": "running"}]}')
+        client = CircleCI(token="dummy_token", transport=transport,
+                          conditional_cache=ConditionalCache())
+
+        client.get_workflow_jobs("wf").raw_data["items"][0]["status"] = "failed"
+        second = client.get_workflow_jobs("wf")
+        second.raw_data["items"][0]["status"] = "canceled"
+        third = client.get_workflow_jobs("wf")
+
+        self.assertEqual(third.raw_data["items"][0]["status"], "running")
+
+    def test_post_not_conditional(self):
+        """
+        Test that non-GET requests never carry validators
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"message": "Accepted."}')
+        client = CircleCI(token="dummy_token", transport=transport,
+                          conditional_cache=ConditionalCache())
+
+        client.cancel_workflow("wf")
+        client.cancel_workflow("wf")
+
+        self.assertNotIn('If-None-Match', transport.sent_headers[1])
+
+    def test_entries_keyed_by_token(self):
+        """
+        Test that clients with different tokens sharing a cache never share its entries
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"id": "wf", "status": "running"}')
+        cache = ConditionalCache()
+        first = CircleCI(token="first_token", transport=transport, conditional_cache=cache)
+        second = CircleCI(token="second_token", transport=transport, conditional_cache=cache)
+
+        first.get_workflow_by_id("wf")
+        second.get_workflow_by_id("wf")
+        first.get_workflow_by_id("wf")
+
+        self.assertNotIn('If-None-Match', transport.sent_headers[1])
+        self.assertEqual(transport.sent_headers[2]['If-None-Match'], '"v1"')
+        self.assertEqual(len(cache), 2)
+
+    def test_evicted_entry_fetched_again(self):
+        """
+        Test that a 304 for an entry evicted since its validators were sent is followed by an
+        unconditional request
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"id": "wf", "status": "running"}')
+        cache = ConditionalCache()
+        client = CircleCI(token="dummy_token", transport=transport, conditional_cache=cache)
+        client.get_workflow_by_id("wf")
+        request = transport.request
+
+        def evicting_request(method, url, headers=None, payload=None, timeout=None):
+            if 'If-None-Match' in headers:
+                cache.clear()
+            return request(method, url, headers, payload, timeout)
+
+        transport.request = evicting_request
+        response = client.get_workflow_by_id("wf")
+
+        self.assertEqual(response.status, "running")
+        self.assertEqual(response.metadata.status_code, 200)
+        self.assertNotIn('If-None-Match', transport.sent_headers[2])
+        self.assertEqual(cache.hits, 0)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used URL is evicted past max_entries
+
+        Returns:
+            None
+        """
+        transport = ETagTransport(b'{"name": "project"}')
+        cache = ConditionalCache(max_entries=2)
+        client = CircleCI(token="dummy_token", transport=transport, conditional_cache=cache)
+
+        for slug in ("gh/org/a", "gh/org/b", "gh/org/c"):
+            client.get_project(slug)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.conditional_headers(
+            "https://circleci.com/api/v2/project/gh/org/a"), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 """ Test cases for the CircleCI class """
+import logging
+import threading
 import unittest
 from unittest.mock import patch, Mock
 
 from circleci_api_python import CircleCIError
 from circleci_api_python.client import CircleCI
+from circleci_api_python.transport import InMemoryTransport
 
 
 # pylint: disable=protected-access
@@ -13,13 +16,13 @@ class TestCircleCIClient(unittest.TestCase):
     """
 
     # --------------------------------- GET REQUEST ---------------------------------
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_request_successful(self, mock_get):
         """
         Test a successful GET request
 
         Args:
-            mock_get (Mock): Mock object for the requests.get
+            mock_get (Mock): Mock object for the requests.Session.get
 
         Returns:
             None
@@ -35,13 +38,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"key": "value"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_request_not_found(self, mock_get):
         """
         Test a GET request that returns a 404
 
         Args:
-            mock_get (Mock): Mock object for the requests.get
+            mock_get (Mock): Mock object for the requests.Session.get
 
         Returns:
             None
@@ -57,13 +60,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json(), {"message": "Not Found"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_request_server_error(self, mock_get):
         """
         Test a GET request that returns a 500
 
         Args:
-            mock_get (Mock): Mock object for the requests.get
+            mock_get (Mock): Mock object for the requests.Session.get
 
         Returns:
             None
@@ -80,13 +83,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.json(), {"message": "Server Error"})
 
     # --------------------------------- POST REQUEST ---------------------------------
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_post_request_successful(self, mock_post):
         """
         Test a successful POST request
 
         Args:
-            mock_post (Mock): Mock object for the requests.post
+            mock_post (Mock): Mock object for the requests.Session.post
 
         Returns:
             None
@@ -102,13 +105,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json(), {"key": "value"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_post_request_no_payload(self, mock_post):
         """
         Test a POST request with no payload
 
         Args:
-            mock_post (Mock): Mock object for the requests.post
+            mock_post (Mock): Mock object for the requests.Session.post
 
         Returns:
             None
@@ -124,13 +127,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"key": "value"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_post_request_server_error(self, mock_post):
         """
         Test a POST request that returns a 500
 
         Args:
-            mock_post (Mock): Mock object for the requests.post
+            mock_post (Mock): Mock object for the requests.Session.post
 
         Returns:
             None
@@ -148,13 +151,13 @@ class TestCircleCIClient(unittest.TestCase):
 
     # --------------------------------- DELETE REQUEST ---------------------------------
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_request_successful(self, mock_delete):
         """
         Test a successful DELETE request
 
         Args:
-            mock_delete (Mock): Mock object for the requests.delete
+            mock_delete (Mock): Mock object for the requests.Session.delete
 
         Returns:
             None
@@ -168,13 +171,13 @@ class TestCircleCIClient(unittest.TestCase):
 
         self.assertEqual(response.status_code, 204)
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_request_not_found(self, mock_delete):
         """
         Test a DELETE request that returns a 404
 
         Args:
-            mock_delete (Mock): Mock object for the requests.delete
+            mock_delete (Mock): Mock object for the requests.Session.delete
 
         Returns:
             None
@@ -190,13 +193,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json(), {"message": "Not Found"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_delete_request_server_error(self, mock_delete):
         """
         Test a DELETE request that returns a 500
 
         Args:
-            mock_delete (Mock): Mock object for the requests.delete
+            mock_delete (Mock): Mock object for the requests.Session.delete
 
         Returns:
             None
@@ -214,13 +217,13 @@ class TestCircleCIClient(unittest.TestCase):
 
     # --------------------------------- PATCH REQUEST ---------------------------------
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_patch_request_successful(self, mock_patch):
         """
         Test a successful PATCH request
 
         Args:
-            mock_patch (Mock): Mock object for the requests.patch
+            mock_patch (Mock): Mock object for the requests.Session.patch
 
         Returns:
             None
@@ -236,13 +239,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"key": "value"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_patch_request_not_found(self, mock_patch):
         """
         Test a PATCH request that returns a 404
 
         Args:
-            mock_patch (Mock): Mock object for the requests.patch
+            mock_patch (Mock): Mock object for the requests.Session.patch
 
         Returns:
             None
@@ -258,13 +261,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json(), {"message": "Not Found"})
 
-    @patch('requests.patch')
+    @patch('requests.Session.patch')
     def test_patch_request_server_error(self, mock_patch):
         """
         Test a PATCH request that returns a 500
 
         Args:
-            mock_patch (Mock): Mock object for the requests.patch
+            mock_patch (Mock): Mock object for the requests.Session.patch
 
         Returns:
             None
@@ -282,13 +285,13 @@ class TestCircleCIClient(unittest.TestCase):
 
     # --------------------------------- PUT REQUEST ---------------------------------
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_put_request_successful(self, mock_put):
         """
         Test a successful PUT request
 
         Args:
-            mock_put (Mock): Mock object for the requests.put
+            mock_put (Mock): Mock object for the requests.Session.put
 
         Returns:
             None
@@ -304,13 +307,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"key": "value"})
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_put_request_not_found(self, mock_put):
         """
         Test a PUT request that returns a 404
 
         Args:
-            mock_put (Mock): Mock object for the requests.put
+            mock_put (Mock): Mock object for the requests.Session.put
 
         Returns:
             None
@@ -326,13 +329,13 @@ class TestCircleCIClient(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json(), {"message": "Not Found"})
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_put_request_server_error(self, mock_put):
         """
         Test a PUT request that returns a 500
 
         Args:
-            mock_put (Mock): Mock object for the requests.put
+            mock_put (Mock): Mock object for the requests.Session.put
 
         Returns:
             None
@@ -432,6 +435,158 @@ class TestCircleCIClient(unittest.TestCase):
         with self.assertRaises(CircleCIError):
             dummy_method(client)
 
+    # --------------------------------- SESSION ---------------------------------
+
+    def test_session_pool_configuration(self):
+        """
+        Test that the connection pool settings are applied to the session
+
+        Returns:
+            None
+        """
+        client = CircleCI(token="dummy_token", pool_connections=4, pool_maxsize=32)
+        adapter = client.transport.session.get_adapter(CircleCI.BASE_URL)
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(client.transport.session.headers['Connection'], 'keep-alive')
+
+    def test_session_keep_alive_disabled(self):
+        """
+        Test that disabling keep-alive closes connections after each request
+
+        Returns:
+            None
+        """
+        client = CircleCI(token="dummy_token", keep_alive=False)
+
+        self.assertEqual(client.transport.session.headers['Connection'], 'close')
+
+    @patch('requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close):
+        """
+        Test that leaving the context manager closes the session
+
+        Args:
+            mock_close (Mock): Mock object for the requests.Session.close
+
+        Returns:
+            None
+        """
+        with CircleCI(token="dummy_token") as client:
+            self.assertIsInstance(client, CircleCI)
+            mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_login_validation_deferred(self, mock_get):
+        """
+        Test that login validation is folded into the first request
+
+        Args:
+            mock_get (Mock): Mock object for the requests.Session.get
+
+        Returns:
+            None
+        """
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_get.return_value = mock_response
+
+        client = CircleCI(token="dummy_token", login_validation=True)
+        mock_get.assert_not_called()
+
+        with self.assertRaises(CircleCIError) as context:
+            client.list_contexts()
+        self.assertIn("Cannot login", context.exception.text)
+        mock_get.assert_called_once()
+
+    def test_login_validated_once(self):
+        """
+        Test that only the first response is checked for a rejected token
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/context", {"items": []})
+        transport.add_response("GET", "/api/v2/context/abc", {"message": "Unauthorized"},
+                               status_code=401)
+        client = CircleCI(token="dummy_token", transport=transport, login_validation=True)
+
+        client.list_contexts()
+        with self.assertRaises(CircleCIError) as context:
+            client.get_context("abc")
+
+        self.assertEqual(context.exception.text, "Failed to validate response.")
+        self.assertEqual(transport.calls, 2)
+
+    def test_current_user_information_cached(self):
+        """
+        Test that the current user is fetched once unless a refresh is requested
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/me", {"login": "user"})
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        first = client.get_current_user_information()
+        second = client.get_current_user_information()
+        client.get_current_user_information(refresh=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.login, "user")
+        self.assertEqual(transport.calls, 2)
+
+
+    # ------------------------------- THREAD SAFETY -------------------------------
+
+    def test_logging_option_leaves_package_logger(self):
+        """
+        Test that a client with logging disabled does not change the package logger
+
+        Returns:
+            None
+        """
+        package_logger = logging.getLogger("circleci_api_python")
+        level = package_logger.level
+
+        loud = CircleCI(token="dummy_token")
+        quiet = CircleCI(token="dummy_token", logging=False)
+
+        self.assertEqual(package_logger.level, level)
+        self.assertIs(loud.log, package_logger)
+        self.assertFalse(quiet.log.isEnabledFor(logging.ERROR))
+
+    def test_shared_client_across_threads(self):
+        """
+        Test that one client serves concurrent requests from many threads
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        for index in range(16):
+            transport.add_response("GET", f"/api/v2/pipeline/{index}", {"id": str(index)})
+        client = CircleCI(token="dummy_token", transport=transport)
+        results = {}
+
+        def fetch(index):
+            for _ in range(20):
+                results[index] = client.get_pipeline_by_id(str(index)).id
+
+        threads = [threading.Thread(target=fetch, args=(index,)) for index in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {index: str(index) for index in range(16)})
+        self.assertEqual(transport.calls, 320)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,138 @@
+""" Test cases for the pluggable JSON codecs """
+import unittest
+from unittest.mock import patch
+
+from circleci_api_python import JSONCodec
+from circleci_api_python.cache import ConditionalCache
+from circleci_api_python.client import CircleCI
+from circleci_api_python.codec import CODECS, default_codec, get_codec
+from circleci_api_python.transport import InMemoryResponse, RequestsTransport, Transport
+
+DOCUMENT = {"name": "ctx", "unicode": "café", "url": "https://x/y", "items": [1, 2.5, None, True]}
+
+
+class CountingCodec(JSONCodec):
+    """
+    Standard library codec counting its calls.
+    """
+
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def encode(self, data) -> bytes:
+        self.encoded += 1
+        return super().encode(data)
+
+    def decode(self, content):
+        self.decoded += 1
+        return super().decode(content)
+
+
+class EchoTransport(Transport):
+    """
+    Transport answering every request with the same body and an ETag.
+    """
+
+    def request(self, method, url, headers=None, payload=None, timeout=None):
+        if headers.get('If-None-Match') == '"v1"':
+            return InMemoryResponse(304, b"", {'ETag': '"v1"'}, url)
+        return InMemoryResponse(200, b'{"id": "abc"}', {'ETag': '"v1"'}, url)
+
+
+class TestCodecs(unittest.TestCase):
+    """
+    Test cases for the JSON codecs
+    """
+
+    def test_installed_codecs_round_trip(self):
+        """
+        Test that every installed codec encodes to compact UTF-8 JSON and decodes it back
+
+        Returns:
+            None
+        """
+        for name, (_, module) in CODECS.items():
+            if module is None:
+                continue
+            codec = get_codec(name)
+            encoded = codec.encode(DOCUMENT)
+            self.assertIsInstance(encoded, bytes, name)
+            self.assertIn("café".encode("utf-8"), encoded, name)
+            self.assertEqual(codec.decode(encoded), DOCUMENT, name)
+            self.assertEqual(codec.decode(encoded.decode("utf-8")), DOCUMENT, name)
+
+    def test_default_codec_is_fastest_installed(self):
+        """
+        Test that the first installed codec is selected, falling back to the standard library
+
+        Returns:
+            None
+        """
+        installed = [name for name, (_, module) in CODECS.items() if module is not None]
+        self.assertEqual(default_codec().name, installed[0])
+
+        missing = {name: (codec, None) for name, (codec, _) in CODECS.items() if name != "json"}
+        with patch.dict(CODECS, missing):
+            self.assertEqual(type(default_codec()), JSONCodec)
+
+    def test_unknown_or_missing_codec_rejected(self):
+        """
+        Test that unknown codecs and codecs whose library is missing are rejected
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+        with patch.dict(CODECS, {"ujson": (JSONCodec, None)}):
+            with self.assertRaises(ValueError):
+                get_codec("ujson")
+
+
+class TestClientCodec(unittest.TestCase):
+    """
+    Test cases for the JSON codec of the CircleCI client
+    """
+
+    def test_codec_decodes_responses(self):
+        """
+        Test that responses are decoded by the codec of the client, cached ones included
+
+        Returns:
+            None
+        """
+        codec = CountingCodec()
+        client = CircleCI(token="dummy_token", transport=EchoTransport(), json_codec=codec,
+                          conditional_cache=ConditionalCache())
+
+        self.assertEqual(client.get_pipeline_by_id("abc").id, "abc")
+        self.assertEqual(client.get_pipeline_by_id("abc").id, "abc")
+
+        self.assertEqual(codec.decoded, 1)
+        self.assertIs(client.transport.codec, codec)
+
+    @patch('requests.Session.post')
+    def test_codec_encodes_payloads(self, mock_post):
+        """
+        Test that payloads are encoded by the codec of the client
+
+        Args:
+            mock_post (Mock): Mock object for the requests.Session.post
+
+        Returns:
+            None
+        """
+        mock_post.return_value = InMemoryResponse(201, b'{"id": "p1"}')
+        codec = CountingCodec()
+        client = CircleCI(token="dummy_token", transport=RequestsTransport(), json_codec=codec)
+
+        client.trigger_pipeline("gh/org/repo", branch="main", parameters={"deploy": True})
+
+        self.assertEqual(codec.encoded, 1)
+        self.assertEqual(mock_post.call_args.kwargs["data"],
+                         b'{"branch":"main","parameters":{"deploy":true}}')
+
+
+if __name__ == '__main__':
+    unittest.main()
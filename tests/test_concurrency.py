@@ -0,0 +1,164 @@
+""" Test cases for the adaptive concurrency limiter """
+import asyncio
+import threading
+import unittest
+
+from fakes import AsyncFakeTransport, FakeTransport
+
+from circleci_api_python import AdaptiveConcurrencyLimiter, AsyncCircleCI, CircleCIError
+from circleci_api_python.client import CircleCI
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """
+    Test cases for the AdaptiveConcurrencyLimiter class
+    """
+
+    def test_additive_increase(self):
+        """
+        Test that a round of successes adds about one slot
+
+        Returns:
+            None
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_tolerance=None)
+        for _ in range(4):
+            self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+
+        for _ in range(4):
+            limiter.release(0.1)
+
+        self.assertGreater(limiter.limit, 4.8)
+        self.assertLess(limiter.limit, 5)
+
+    def test_multiplicative_decrease_once_per_round_trip(self):
+        """
+        Test that a burst of failures halves the limit once
+
+        Returns:
+            None
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, latency_tolerance=None)
+        for _ in range(8):
+            limiter.try_acquire()
+        for _ in range(8):
+            limiter.release(10, failed=True)
+
+        self.assertEqual(limiter.limit, 8)
+
+    def test_latency_increase_shrinks_limit(self):
+        """
+        Test that latency growing past the tolerance counts as congestion
+
+        Returns:
+            None
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=2)
+        for latency in (0.1, 0.1, 1, 1, 1):
+            limiter.try_acquire()
+            limiter.release(latency)
+
+        self.assertLess(limiter.limit, 10)
+
+    def test_limit_bounds(self):
+        """
+        Test that the limit stays within its bounds
+
+        Returns:
+            None
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=3,
+                                             latency_tolerance=None)
+        for _ in range(50):
+            limiter.try_acquire()
+            limiter.release(0.001)
+        self.assertEqual(limiter.limit, 3)
+
+        limiter.try_acquire()
+        limiter.release(1, failed=True)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_acquire_times_out(self):
+        """
+        Test that acquire gives up when no slot frees up
+
+        Returns:
+            None
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        self.assertTrue(limiter.acquire())
+
+        self.assertFalse(limiter.acquire(timeout=0.01))
+
+
+class TestClientConcurrencyLimiting(unittest.TestCase):
+    """
+    Test cases for concurrency limiting performed by the CircleCI client
+    """
+
+    def test_in_flight_requests_limited(self):
+        """
+        Test that a fan-out from many threads respects the limit
+
+        Returns:
+            None
+        """
+        transport = FakeTransport(delay=0.02)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        client = CircleCI(token="dummy_token", transport=transport,
+                          concurrency_limiter=limiter, coalesce_gets=False)
+
+        threads = [threading.Thread(target=client.get_pipeline_by_id, args=(str(index),))
+                   for index in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(transport.peak, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_throttling_shrinks_limit(self):
+        """
+        Test that 429 responses lower the limit
+
+        Returns:
+            None
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        client = CircleCI(token="dummy_token", max_retries=0,
+                          transport=FakeTransport(status_code=429),
+                          concurrency_limiter=limiter)
+
+        with self.assertRaises(CircleCIError):
+            client.get_pipeline_by_id("abc")
+
+        self.assertEqual(limiter.limit, 4)
+
+
+class TestAsyncClientConcurrencyLimiting(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for concurrency limiting performed by the AsyncCircleCI client
+    """
+
+    async def test_in_flight_requests_limited(self):
+        """
+        Test that gathered requests respect the limit
+
+        Returns:
+            None
+        """
+        transport = AsyncFakeTransport(delay=0.02)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        async with AsyncCircleCI(token="dummy_token", transport=transport,
+                                 concurrency_limiter=limiter) as client:
+            await asyncio.gather(*(client.get_workflow_by_id(str(index))
+                                   for index in range(10)))
+
+        self.assertEqual(transport.peak, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+""" Test cases for the time budgets of composite calls """
+import time
+import unittest
+
+from fakes import AsyncFakeTransport, FakeTransport
+
+from circleci_api_python import AsyncCircleCI, DeadlineExceededError, time_budget
+from circleci_api_python.client import CircleCI
+from circleci_api_python.deadline import budget_timeout, remaining_budget
+from circleci_api_python.exceptions import CircleCIError
+from circleci_api_python.retry import RetryPolicy
+
+ROUTES = {
+    "/api/v2/project/gh/org/repo/pipeline?branch=main": {"items": [{"id": "pipeline"}]},
+    "/api/v2/pipeline/pipeline/workflow": {"items": [{"id": "workflow"}]},
+    "/api/v2/workflow/workflow/job": {"items": [{"job_number": 7}]},
+    "/api/v2/project/gh/org/repo/7/artifacts": {"items": []},
+}
+
+
+def with_routes(transport: FakeTransport) -> FakeTransport:
+    """
+    Register the artifact lookup routes on a fake transport.
+
+    Args:
+        transport (FakeTransport): the transport
+
+    Returns:
+        FakeTransport: the transport
+    """
+    for endpoint, data in ROUTES.items():
+        transport.add_response("GET", endpoint, data)
+    return transport
+
+
+class TestTimeBudget(unittest.TestCase):
+    """
+    Test cases for the time_budget context manager
+    """
+
+    def test_nested_budget_never_extends(self):
+        """
+        Test that an inner budget is capped by the enclosing one
+
+        Returns:
+            None
+        """
+        self.assertIsNone(remaining_budget())
+        with time_budget(1):
+            with time_budget(60):
+                self.assertLessEqual(remaining_budget(), 1)
+            with time_budget(None):
+                self.assertLessEqual(remaining_budget(), 1)
+        self.assertIsNone(remaining_budget())
+
+    def test_budget_timeout(self):
+        """
+        Test that request timeouts are capped to the remaining budget
+
+        Returns:
+            None
+        """
+        self.assertEqual(budget_timeout((5, 15), None), (5, 15))
+        self.assertEqual(budget_timeout((5, 15), 8), (5, 8))
+        self.assertEqual(budget_timeout((5, None), 2), (2, 2))
+        self.assertEqual(budget_timeout(10, 3), 3)
+        self.assertEqual(budget_timeout(None, 4), 4)
+
+
+class TestClientDeadline(unittest.TestCase):
+    """
+    Test cases for deadlines applied by the CircleCI client
+    """
+
+    def test_composite_call_within_deadline(self):
+        """
+        Test that every sub-request gets a timeout capped by the remaining budget
+
+        Returns:
+            None
+        """
+        transport = with_routes(FakeTransport())
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        artifacts = client.get_last_build_artifacts_by_project_name("gh/org/repo", "main",
+                                                                    deadline=10)
+
+        self.assertEqual(artifacts.items, [])
+        self.assertEqual(len(transport.timeouts), 4)
+        for connect_timeout, read_timeout in transport.timeouts:
+            self.assertEqual(connect_timeout, 5)
+            self.assertLessEqual(read_timeout, 10)
+
+    def test_composite_call_fails_fast(self):
+        """
+        Test that no request is sent once the deadline has passed
+
+        Returns:
+            None
+        """
+        transport = with_routes(FakeTransport(delay=0.1))
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            client.get_last_build_artifacts_by_project_name("gh/org/repo", "main",
+                                                            deadline=0.15)
+
+        self.assertLess(time.monotonic() - started, 0.35)
+        self.assertEqual(len(transport.timeouts), 2)
+        self.assertLess(transport.timeouts[1][1], 0.1)
+
+    def test_retry_skipped_when_budget_too_small(self):
+        """
+        Test that a retry delay longer than the remaining budget ends the retries
+
+        Returns:
+            None
+        """
+        transport = FakeTransport(status_code=503, headers={'Retry-After': '5'})
+        client = CircleCI(token="dummy_token", transport=transport,
+                          retry_policy=RetryPolicy(max_retries=3))
+
+        with time_budget(1):
+            with self.assertRaises(CircleCIError) as context:
+                client.get_pipeline_by_id("abc")
+
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(len(transport.timeouts), 1)
+
+
+class TestAsyncClientDeadline(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for deadlines applied by the AsyncCircleCI client
+    """
+
+    async def test_composite_call_fails_fast(self):
+        """
+        Test that no request is sent once the deadline has passed
+
+        Returns:
+            None
+        """
+        transport = with_routes(AsyncFakeTransport(delay=0.1))
+        async with AsyncCircleCI(token="dummy_token", transport=transport) as client:
+            with self.assertRaises(DeadlineExceededError):
+                await client.get_last_build_artifacts_by_project_name("gh/org/repo", "main",
+                                                                      deadline=0.15)
+
+        self.assertEqual(len(transport.timeouts), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
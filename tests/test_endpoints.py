@@ -0,0 +1,201 @@
+""" Test cases for the declarative endpoint registry """
+import inspect
+import unittest
+from unittest.mock import patch
+
+from fakes import FakeTransport
+
+from circleci_api_python import AsyncCircleCI, CircleCIError, RetryPolicy
+from circleci_api_python.client import CircleCI
+from circleci_api_python.endpoints import ENDPOINTS, Endpoint, Route
+from circleci_api_python.transport import InMemoryResponse, Transport
+
+
+class RecordingTransport(Transport):
+    """
+    Transport recording the requests it is given.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def _record(self, method, url, payload):
+        self.requests.append((method, url[len(CircleCI.BASE_URL):], payload))
+        return InMemoryResponse(200, b'{"id": "abc"}', url=url)
+
+    def request(self, method, url, headers=None, payload=None, timeout=None):
+        return self._record(method, url, payload)
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    """
+    Asynchronous variant of RecordingTransport.
+    """
+
+    async def request(self, method, url,  # pylint: disable=invalid-overridden-method
+                      headers=None, payload=None, timeout=None):
+        return self._record(method, url, payload)
+
+    async def close(self):  # pylint: disable=invalid-overridden-method
+        pass
+
+
+class TestRoute(unittest.TestCase):
+    """
+    Test cases for the Route and Endpoint classes
+    """
+
+    def test_path_fields_encoded(self):
+        """
+        Test that field values are percent-encoded, keeping the slashes of path fields
+
+        Returns:
+            None
+        """
+        route = Route("/api/v2/project/{project_slug:path}/envvar/{name}")
+
+        self.assertEqual(route.fields, ("project_slug", "name"))
+        self.assertEqual(route.expand({"project_slug": "gh/org/my repo", "name": "A/B?"}),
+                         "/api/v2/project/gh/org/my%20repo/envvar/A%2FB%3F")
+
+    def test_query_encoded(self):
+        """
+        Test that empty query values are left out and the others encoded
+
+        Returns:
+            None
+        """
+        endpoint = Endpoint("GET", "/api/v2/pipeline",
+                            query={"org_slug": "org-slug", "page_token": "page-token",
+                                   "mine": "mine"})
+
+        self.assertEqual(endpoint.path({"org_slug": "gh/org", "page_token": None,
+                                        "mine": True}),
+                         "/api/v2/pipeline?org-slug=gh%2Forg&mine=true")
+        self.assertEqual(endpoint.path({"org_slug": None, "mine": False}), "/api/v2/pipeline")
+
+    def test_payload_shape(self):
+        """
+        Test that payload keys are renamed, nested and omitted as declared
+
+        Returns:
+            None
+        """
+        endpoint = Endpoint("POST", "/api/v2/context",
+                            payload={"name": "name", "owner_id": "owner.id",
+                                     "owner_type": "owner.type", "note": "note"},
+                            omit="none")
+
+        self.assertEqual(endpoint.body({"name": "ctx", "owner_id": "1",
+                                        "owner_type": "organization"}),
+                         {"name": "ctx", "owner": {"id": "1", "type": "organization"}})
+        self.assertIsNone(Endpoint("POST", "/api/v2/job/{job_id}/cancel").body({}))
+
+    def test_defaults_follow_method(self):
+        """
+        Test that GET endpoints are cacheable and idempotency follows the method by default
+
+        Returns:
+            None
+        """
+        self.assertTrue(ENDPOINTS["get_pipeline_by_id"].cacheable)
+        self.assertFalse(ENDPOINTS["trigger_pipeline"].cacheable)
+        self.assertIsNone(ENDPOINTS["trigger_pipeline"].idempotent)
+        self.assertTrue(ENDPOINTS["cancel_workflow"].idempotent)
+
+
+class TestGeneratedMethods(unittest.TestCase):
+    """
+    Test cases for the client methods generated from the registry
+    """
+
+    def test_every_endpoint_has_a_method(self):
+        """
+        Test that the client declares a method for every registered endpoint
+
+        Returns:
+            None
+        """
+        for name in ENDPOINTS:
+            method = getattr(CircleCI, name)
+            self.assertTrue(method.__doc__, name)
+            self.assertIn("self", inspect.signature(method).parameters)
+
+    def test_signature_kept(self):
+        """
+        Test that generated methods accept positional and keyword arguments and defaults
+
+        Returns:
+            None
+        """
+        transport = RecordingTransport()
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        client.create_context("ctx", owner_id="org")
+        client.get_all_pipelines_for_project("gh/org/repo", branch="feature/x")
+        with self.assertRaises(TypeError):
+            client.get_pipeline_by_id()  # pylint: disable=no-value-for-parameter
+
+        self.assertEqual(transport.requests, [
+            ("POST", "/api/v2/context",
+             {"name": "ctx", "owner": {"id": "org", "type": "organization"}}),
+            ("GET", "/api/v2/project/gh/org/repo/pipeline?branch=feature%2Fx", None),
+        ])
+
+    def test_endpoint_retry_policy(self):
+        """
+        Test that the retry policy declared by an endpoint replaces the client policy
+
+        Returns:
+            None
+        """
+        transport = FakeTransport(status_code=503)
+        client = CircleCI(token="dummy_token", transport=transport,
+                          retry_policy=RetryPolicy(max_retries=3, retry_delay=0.001))
+
+        with patch.object(ENDPOINTS["get_pipeline_by_id"], "retry",
+                          RetryPolicy(max_retries=1, retry_delay=0.001)):
+            with self.assertRaises(CircleCIError):
+                client.get_pipeline_by_id("abc")
+
+        self.assertEqual(transport.calls, 2)
+
+    def test_undeclared_argument_rejected(self):
+        """
+        Test that a method not declaring the arguments of its endpoint fails at definition
+
+        Returns:
+            None
+        """
+        def get_pipeline_by_id(self, identifier):  # pylint: disable=unused-argument
+            """ Get a pipeline. """
+
+        with self.assertRaises(TypeError):
+            CircleCI.api_endpoint(get_pipeline_by_id)
+
+
+class TestAsyncGeneratedMethods(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the AsyncCircleCI methods generated from the registry
+    """
+
+    async def test_generated_coroutine(self):
+        """
+        Test that generated methods are awaitable on the async client
+
+        Returns:
+            None
+        """
+        transport = AsyncRecordingTransport()
+        async with AsyncCircleCI(token="dummy_token", transport=transport) as client:
+            response = await client.delete_org_level_claims("org", "audience,ttl")
+
+        self.assertEqual(response.id, "abc")
+        self.assertEqual(transport.requests, [
+            ("DELETE", "/api/v2/org/org/oidc-custom-claims?claims=audience,ttl", None),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+""" Test cases for the fork safety of the client """
+import multiprocessing
+import os
+import unittest
+
+from circleci_api_python.breaker import CircuitBreakers
+from circleci_api_python.client import CircleCI
+from circleci_api_python.ratelimit import RateLimiter
+from circleci_api_python.transport import HttpxTransport, InMemoryTransport
+
+
+def run_in_child(func):
+    """
+    Run a function in a forked child process.
+
+    Args:
+        func (Callable): function returning a picklable result
+
+    Returns:
+        the result of the function in the child
+    """
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    child = context.Process(target=lambda: queue.put(func()))
+    child.start()
+    result = queue.get(timeout=10)
+    child.join()
+    return result
+
+
+@unittest.skipUnless(hasattr(os, "register_at_fork"), "requires fork")
+class TestForkSafety(unittest.TestCase):
+    """
+    Test cases for the reset of a client in a forked child
+    """
+
+    def test_locks_held_at_fork_released_in_child(self):
+        """
+        Test that locks held by the parent while forking are usable in the child
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/me", {"login": "user"})
+        limiter = RateLimiter(rate=100)
+        breakers = CircuitBreakers()
+        breakers.get("user")
+        client = CircleCI(token="dummy_token", transport=transport,
+                          rate_limiter=limiter, circuit_breakers=breakers)
+
+        locks = [client._lock, limiter._lock,  # pylint: disable=protected-access
+                 breakers.get("user")._lock]  # pylint: disable=protected-access
+        for lock in locks:
+            lock.acquire()
+        try:
+            login = run_in_child(lambda: client.get_current_user_information().login)
+        finally:
+            for lock in locks:
+                lock.release()
+
+        self.assertEqual(login, "user")
+
+    def test_connection_pools_rebuilt_in_child(self):
+        """
+        Test that the child does not reuse the connections pooled by the parent
+
+        Returns:
+            None
+        """
+        client = CircleCI(token="dummy_token")
+        adapter = client.transport.session.get_adapter(CircleCI.BASE_URL)
+        adapter.poolmanager.connection_from_url(CircleCI.BASE_URL)
+
+        child_pools = run_in_child(lambda: len(adapter.poolmanager.pools))
+
+        self.assertEqual(child_pools, 0)
+        self.assertEqual(len(adapter.poolmanager.pools), 1)
+
+    def test_httpx_client_replaced_in_child(self):
+        """
+        Test that the child gets its own httpx client
+
+        Returns:
+            None
+        """
+        transport = HttpxTransport()
+        parent_client = transport.client
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        replaced = run_in_child(lambda: client.transport.client is not parent_client)
+        client.close()
+
+        self.assertTrue(replaced)
+        self.assertIs(transport.client, parent_client)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+""" Test cases for hedged GET requests """
+import threading
+import time
+import unittest
+
+from fakes import AsyncFakeTransport, FakeTransport
+
+from circleci_api_python import AsyncCircleCI, RateLimiter
+from circleci_api_python.client import CircleCI
+from circleci_api_python.deadline import time_budget
+from circleci_api_python.hedging import HedgePolicy
+
+
+class TestHedgePolicy(unittest.TestCase):
+    """
+    Test cases for the HedgePolicy class
+    """
+
+    def test_delay_uses_percentile(self):
+        """
+        Test that the hedge delay follows the observed percentile once warmed up
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(percentile=90, initial_delay=2, min_samples=10)
+        self.assertEqual(policy.delay(), 2)
+
+        for latency in range(1, 101):
+            policy.observe(latency / 100)
+
+        self.assertAlmostEqual(policy.delay(), 0.91)
+
+    def test_budget_limits_hedges(self):
+        """
+        Test that hedges are limited to the budget ratio of requests
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(budget_ratio=0.1)
+        hedges = 0
+        for _ in range(100):
+            policy.start()
+            hedges += policy.try_hedge()
+
+        self.assertEqual(hedges, 10)
+
+
+class TestClientHedging(unittest.TestCase):
+    """
+    Test cases for hedging performed by the CircleCI client
+    """
+
+    def test_slow_get_is_hedged(self):
+        """
+        Test that the hedge answers first when the primary request is slow
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(initial_delay=0.05, budget_ratio=1)
+        client = CircleCI(token="dummy_token", transport=FakeTransport(first_delay=0.5),
+                          hedge_policy=policy)
+
+        started = time.monotonic()
+        response = client.get_pipeline_by_id("abc")
+        elapsed = time.monotonic() - started
+        client.close()
+
+        self.assertEqual(response.call, 1)
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(policy.hedges, 1)
+
+    def test_no_budget_no_hedge(self):
+        """
+        Test that the primary request is awaited when the hedge budget is spent
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(initial_delay=0.01, budget_ratio=0)
+        client = CircleCI(token="dummy_token", transport=FakeTransport(first_delay=0.1),
+                          hedge_policy=policy)
+
+        response = client.get_workflow_by_id("abc")
+        client.close()
+
+        self.assertEqual(response.call, 0)
+        self.assertEqual(policy.hedges, 0)
+
+    def test_hedged_gets_not_capped(self):
+        """
+        Test that concurrent hedged GET requests are not queued behind each other
+
+        Returns:
+            None
+        """
+        transport = FakeTransport(delay=0.1)
+        client = CircleCI(token="dummy_token", transport=transport, coalesce_gets=False,
+                          hedge_policy=HedgePolicy(initial_delay=1, budget_ratio=0))
+        callers = [threading.Thread(target=client.get_pipeline_by_id, args=(str(number),))
+                   for number in range(64)]
+
+        started = time.monotonic()
+        for thread in callers:
+            thread.start()
+        for thread in callers:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(transport.calls, 64)
+        self.assertEqual(transport.peak, 64)
+        self.assertLess(elapsed, 0.18)
+
+    def test_hedge_admitted_by_rate_limiter(self):
+        """
+        Test that no hedge is sent when its rate limiter token outlasts the time budget
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(initial_delay=0.05, budget_ratio=1)
+        transport = FakeTransport(first_delay=0.2)
+        client = CircleCI(token="dummy_token", transport=transport, hedge_policy=policy,
+                          rate_limiter=RateLimiter(rate=1.0, burst=1))
+
+        with time_budget(0.5):
+            response = client.get_pipeline_by_id("abc")
+
+        self.assertEqual(response.call, 0)
+        self.assertEqual(transport.calls, 1)
+
+    def test_post_never_hedged(self):
+        """
+        Test that non-idempotent requests are sent once
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(initial_delay=0.01, budget_ratio=1)
+        transport = FakeTransport(first_delay=0.1)
+        client = CircleCI(token="dummy_token", transport=transport, hedge_policy=policy)
+
+        response = client.cancel_workflow("abc")
+
+        self.assertEqual(response.call, 0)
+        self.assertEqual(policy.requests, 0)
+
+
+class TestAsyncClientHedging(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for hedging performed by the AsyncCircleCI client
+    """
+
+    async def test_slow_get_is_hedged(self):
+        """
+        Test that the hedge answers first and the slow copy is cancelled
+
+        Returns:
+            None
+        """
+        policy = HedgePolicy(initial_delay=0.05, budget_ratio=1)
+        async with AsyncCircleCI(token="dummy_token", transport=AsyncFakeTransport(first_delay=0.5),
+                                 hedge_policy=policy) as client:
+            started = time.monotonic()
+            response = await client.get_job_by_number("gh/org/repo", 1)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(response.call, 1)
+        self.assertLess(elapsed, 0.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+""" Test cases for adaptive per-endpoint timeouts """
+import unittest
+from unittest.mock import patch
+
+from fakes import AsyncFakeTransport, FakeTransport
+
+from circleci_api_python import AdaptiveTimeouts, AsyncCircleCI, RetryPolicy, time_budget
+from circleci_api_python.client import CircleCI
+from circleci_api_python.latency import LatencyHistogram
+
+CONTEXT = "GET /api/v2/context/{context_id}"
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """
+    Test cases for the LatencyHistogram class
+    """
+
+    def test_percentile_within_resolution(self):
+        """
+        Test that percentiles are overestimated by at most the bucket resolution
+
+        Returns:
+            None
+        """
+        histogram = LatencyHistogram(resolution=1.1)
+        self.assertIsNone(histogram.percentile(99))
+
+        for latency in range(1, 101):
+            histogram.observe(latency / 100)
+
+        self.assertGreaterEqual(histogram.percentile(50), 0.5)
+        self.assertLessEqual(histogram.percentile(50), 0.5 * 1.1)
+        self.assertGreaterEqual(histogram.percentile(99), 0.99)
+        self.assertLessEqual(histogram.percentile(99), 0.99 * 1.1)
+
+    def test_old_samples_decay(self):
+        """
+        Test that the histogram follows latencies once older samples are decayed
+
+        Returns:
+            None
+        """
+        histogram = LatencyHistogram(max_samples=100)
+        for _ in range(100):
+            histogram.observe(0.01)
+        for _ in range(200):
+            histogram.observe(2.0)
+
+        self.assertLessEqual(histogram.count, 100)
+        self.assertGreaterEqual(histogram.percentile(50), 2.0)
+
+
+class TestAdaptiveTimeouts(unittest.TestCase):
+    """
+    Test cases for the AdaptiveTimeouts class
+    """
+
+    def test_read_timeout_bounded(self):
+        """
+        Test that the read timeout is the scaled percentile, bounded by floor and ceiling
+
+        Returns:
+            None
+        """
+        timeouts = AdaptiveTimeouts(factor=2, floor=0.5, ceiling=30, min_samples=10)
+        for _ in range(10):
+            timeouts.observe("fast", 0.01)
+            timeouts.observe("slow", 60)
+            timeouts.observe("medium", 4)
+        timeouts.observe("new", 1)
+
+        self.assertEqual(timeouts.read_timeout("fast"), 0.5)
+        self.assertEqual(timeouts.read_timeout("slow"), 30)
+        self.assertAlmostEqual(timeouts.read_timeout("medium"), 8, delta=0.8)
+        self.assertIsNone(timeouts.read_timeout("new"))
+        self.assertIsNone(timeouts.read_timeout(None))
+
+    def test_only_read_timeout_replaced(self):
+        """
+        Test that the connect timeout is kept and that nothing adapts with adapt=False
+
+        Returns:
+            None
+        """
+        timeouts = AdaptiveTimeouts(floor=0.5, min_samples=1)
+        timeouts.observe("fast", 0.01)
+
+        self.assertEqual(timeouts.timeout("fast", (5, 15)), (5, 0.5))
+        self.assertEqual(timeouts.timeout("fast", 15), 0.5)
+        self.assertEqual(timeouts.timeout("other", (5, 15)), (5, 15))
+
+        timeouts.adapt = False
+        self.assertEqual(timeouts.timeout("fast", (5, 15)), (5, 15))
+        self.assertEqual(timeouts.stats()["fast"]["count"], 1)
+
+
+class TestClientAdaptiveTimeouts(unittest.TestCase):
+    """
+    Test cases for the adaptive timeouts of the CircleCI client
+    """
+
+    def test_timeouts_adapt_per_endpoint(self):
+        """
+        Test that the read timeout of a fast endpoint adapts without affecting the others
+
+        Returns:
+            None
+        """
+        transport = FakeTransport()
+        timeouts = AdaptiveTimeouts(floor=0.5, min_samples=3)
+        client = CircleCI(token="dummy_token", transport=transport, adaptive_timeouts=timeouts)
+
+        for _ in range(4):
+            client.get_context("context_id")
+        client.get_pipeline_config_by_id("pipeline_id")
+
+        self.assertEqual(transport.timeouts, [(5, 15)] * 3 + [(5, 0.5), (5, 15)])
+        self.assertEqual(timeouts.stats()[CONTEXT]["count"], 4)
+
+    @patch('circleci_api_python.client.time.sleep')
+    def test_timeout_rises_after_slowdown(self, mock_sleep):  # pylint: disable=unused-argument
+        """
+        Test that requests timing out are counted so that the timeout of an endpoint rises
+        once it slows down
+
+        Args:
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        transport = FakeTransport()
+        timeouts = AdaptiveTimeouts(floor=0.5, min_samples=3)
+        client = CircleCI(token="dummy_token", transport=transport, adaptive_timeouts=timeouts,
+                          retry_policy=RetryPolicy(max_retries=5))
+        for _ in range(3):
+            client.get_context("context_id")
+
+        transport.latency = 2.0
+        client.get_context("context_id")
+
+        reads = [timeout[1] for timeout in transport.timeouts[3:]]
+        self.assertEqual(reads[0], 0.5)
+        self.assertEqual(reads, sorted(reads))
+        self.assertGreaterEqual(reads[-1], 2.0)
+
+    def test_budget_still_caps_timeout(self):
+        """
+        Test that the time budget of a call caps the adapted timeout
+
+        Returns:
+            None
+        """
+        transport = FakeTransport()
+        timeouts = AdaptiveTimeouts(floor=5, min_samples=1)
+        timeouts.observe(CONTEXT, 0.01)
+        client = CircleCI(token="dummy_token", transport=transport, adaptive_timeouts=timeouts)
+
+        with time_budget(1):
+            client.get_context("context_id")
+
+        self.assertLessEqual(transport.timeouts[0][1], 1)
+
+    def test_static_timeout_by_default(self):
+        """
+        Test that the configured timeout is used when no adaptive timeouts are set
+
+        Returns:
+            None
+        """
+        transport = FakeTransport()
+        client = CircleCI(token="dummy_token", transport=transport, timeout=(2, 3))
+
+        client.get_context("context_id")
+
+        self.assertEqual(transport.timeouts, [(2, 3)])
+
+
+class TestAsyncClientAdaptiveTimeouts(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the adaptive timeouts of the AsyncCircleCI client
+    """
+
+    async def test_timeouts_adapt(self):
+        """
+        Test that the async client records latencies and adapts the read timeout
+
+        Returns:
+            None
+        """
+        transport = AsyncFakeTransport()
+        timeouts = AdaptiveTimeouts(floor=0.5, min_samples=1)
+        async with AsyncCircleCI(token="dummy_token", transport=transport,
+                                 adaptive_timeouts=timeouts) as client:
+            await client.get_context("context_id")
+            await client.get_context("context_id")
+
+        self.assertEqual(transport.timeouts, [(5, 15), (5, 0.5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+""" Test cases for the client-side rate limiter """
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+from circleci_api_python.client import CircleCI
+from circleci_api_python.ratelimit import (RateLimiter, SharedRateLimiter,
+                                           parse_rate_limit_headers)
+from circleci_api_python.transport import InMemoryTransport
+
+
+def make_response(status_code: int, headers: dict) -> Mock:
+    """
+    Build a mocked response.
+
+    Args:
+        status_code (int): HTTP status code
+        headers (dict): response headers
+
+    Returns:
+        Mock: the mocked response
+    """
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers
+    return response
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Test cases for the RateLimiter class
+    """
+
+    def test_burst_then_spacing(self):
+        """
+        Test that requests beyond the burst are spaced at the configured rate
+
+        Returns:
+            None
+        """
+        limiter = RateLimiter(rate=10, burst=2)
+
+        waits = [limiter.reserve() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.1, places=2)
+        self.assertAlmostEqual(waits[3], 0.2, places=2)
+
+    def test_parse_rate_limit_headers(self):
+        """
+        Test parsing both header spellings and timestamp resets
+
+        Returns:
+            None
+        """
+        self.assertEqual(parse_rate_limit_headers({'X-RateLimit-Limit': '100',
+                                                   'X-RateLimit-Remaining': '40',
+                                                   'X-RateLimit-Reset': '20'}),
+                         (100.0, 40.0, 20.0))
+        self.assertEqual(parse_rate_limit_headers({'RateLimit-Remaining': 'n/a'}),
+                         (None, None, None))
+
+    def test_rate_follows_remaining_quota(self):
+        """
+        Test that the rate spreads the remaining quota over the reset window
+
+        Returns:
+            None
+        """
+        limiter = RateLimiter(rate=50)
+        limiter.update(make_response(200, {'X-RateLimit-Remaining': '30',
+                                           'X-RateLimit-Reset': '10'}))
+
+        self.assertEqual(limiter.rate, 3)
+
+    def test_too_many_requests_pauses(self):
+        """
+        Test that a 429 halves the rate and pauses for Retry-After
+
+        Returns:
+            None
+        """
+        limiter = RateLimiter(rate=10, burst=5)
+        limiter.update(make_response(429, {'Retry-After': '2'}))
+
+        self.assertEqual(limiter.rate, 5)
+        self.assertGreater(limiter.reserve(), 1.9)
+
+    def test_exhausted_quota_pauses(self):
+        """
+        Test that a zero remaining quota pauses until the reset
+
+        Returns:
+            None
+        """
+        limiter = RateLimiter(rate=10, burst=5)
+        limiter.update(make_response(200, {'X-RateLimit-Remaining': '0',
+                                           'X-RateLimit-Reset': '3'}))
+
+        self.assertGreater(limiter.reserve(), 2.9)
+
+
+def reserve_in_child(limiter: SharedRateLimiter, queue) -> None:
+    """
+    Reserve one token from a forked child process.
+
+    Args:
+        limiter (SharedRateLimiter): limiter inherited from the parent
+        queue (multiprocessing.Queue): queue receiving the wait
+    """
+    queue.put(limiter.reserve())
+
+
+@unittest.skipIf(sys.platform == "win32", "SharedRateLimiter requires fcntl")
+class TestSharedRateLimiter(unittest.TestCase):
+    """
+    Test cases for the SharedRateLimiter class
+    """
+
+    def setUp(self):
+        """
+        Create a temporary state file path
+
+        Returns:
+            None
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "circleci-rate-limit")
+
+    def test_bucket_shared_between_instances(self):
+        """
+        Test that two limiters on the same file draw from one bucket
+
+        Returns:
+            None
+        """
+        first = SharedRateLimiter(self.path, rate=10, burst=2)
+        second = SharedRateLimiter(self.path, rate=10, burst=2)
+
+        self.assertEqual(first.reserve(), 0.0)
+        self.assertEqual(second.reserve(), 0.0)
+        self.assertAlmostEqual(first.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(second.reserve(), 0.2, places=2)
+        first.close()
+        second.close()
+
+    def test_pause_shared_between_instances(self):
+        """
+        Test that a 429 seen by one process pauses the others
+
+        Returns:
+            None
+        """
+        first = SharedRateLimiter(self.path, rate=10, burst=5)
+        second = SharedRateLimiter(self.path, rate=10, burst=5)
+
+        first.update(make_response(429, {'Retry-After': '3'}))
+
+        self.assertGreater(second.reserve(), 2.9)
+        self.assertEqual(second.rate, 5)
+        first.close()
+        second.close()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_bucket_shared_with_forked_children(self):
+        """
+        Test that forked children reopen the state file and share the bucket
+
+        Returns:
+            None
+        """
+        limiter = SharedRateLimiter(self.path, rate=1, burst=1)
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        children = [context.Process(target=reserve_in_child, args=(limiter, queue))
+                    for _ in range(3)]
+        for child in children:
+            child.start()
+        for child in children:
+            child.join()
+
+        waits = sorted(queue.get() for _ in children)
+        self.assertEqual(waits[0], 0.0)
+        self.assertAlmostEqual(waits[1], 1.0, places=1)
+        self.assertAlmostEqual(waits[2], 2.0, places=1)
+        limiter.close()
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    """
+    Test cases for rate limiting performed by the CircleCI client
+    """
+
+    @patch('circleci_api_python.client.time.sleep')
+    def test_client_waits_for_tokens(self, mock_sleep):
+        """
+        Test that the client sleeps for the reserved wait before each request
+
+        Args:
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/me", {"login": "user"})
+        client = CircleCI(token="dummy_token", transport=transport,
+                          rate_limiter=RateLimiter(rate=10, burst=1))
+
+        client.get_current_user_information()
+        client.get_current_user_information(refresh=True)
+
+        mock_sleep.assert_called_once()
+        self.assertGreater(mock_sleep.call_args.args[0], 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
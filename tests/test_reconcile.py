@@ -0,0 +1,281 @@
+""" Test cases for the reconciling retry of pipeline triggers """
+import asyncio
+import json
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from circleci_api_python import AsyncCircleCI, CircleCIError, RetryPolicy
+from circleci_api_python.client import CircleCI
+from circleci_api_python.reconcile import find_triggered_pipeline, parse_timestamp
+from circleci_api_python.transport import InMemoryResponse, Transport
+
+
+def pipeline(pipeline_id: str, branch: str = "main", age: float = 0, **extra) -> dict:
+    """
+    Build a pipeline as listed by the API.
+
+    Args:
+        pipeline_id (str): pipeline id
+        branch (str): branch of the pipeline
+        age (float): seconds since the pipeline was created
+        **extra: additional fields
+
+    Returns:
+        dict: the pipeline
+    """
+    created_at = datetime.now(timezone.utc) - timedelta(seconds=age)
+    return {"id": pipeline_id, "created_at": created_at.isoformat().replace("+00:00", "Z"),
+            "vcs": {"branch": branch}, **extra}
+
+
+class TriggerTransport(Transport):
+    """
+    Transport answering triggers from a script and listing the pipelines of the user.
+
+    A "lost" trigger raises a timeout after creating its pipeline, a "timeout" one raises
+    before creating it. A "concurrent" one raises a timeout after another trigger of the user
+    created a pipeline on the "dev" branch. Triggers naming no branch or tag run on the
+    default branch, "main".
+    """
+
+    errors = (TimeoutError,)
+
+    def __init__(self, script: list, pipelines: list or None = None):
+        super().__init__()
+        self.script = list(script)
+        self.pipelines = list(pipelines or [])
+        self.triggers = 0
+        self.projects = 0
+        self.listings = 0
+
+    def _respond(self, method, url, payload):
+        if method == "GET" and url.endswith("/pipeline/mine"):
+            self.listings += 1
+            return InMemoryResponse(200, json.dumps({"items": self.pipelines}).encode(), url=url)
+        if method == "GET":
+            self.projects += 1
+            return InMemoryResponse(200, b'{"vcs_info": {"default_branch": "main"}}', url=url)
+        self.triggers += 1
+        outcome = self.script.pop(0)
+        branch = payload.get("branch", "main")
+        if outcome in ("lost", "timeout", "concurrent"):
+            if outcome == "lost":
+                self.pipelines.insert(0, pipeline(f"p{self.triggers}", branch))
+            if outcome == "concurrent":
+                self.pipelines.insert(0, pipeline(f"dev{self.triggers}", "dev"))
+            raise TimeoutError("read timed out")
+        if outcome == 201:
+            self.pipelines.insert(0, pipeline(f"p{self.triggers}", branch))
+            return InMemoryResponse(201, f'{{"id": "p{self.triggers}"}}'.encode(), url=url)
+        return InMemoryResponse(outcome, b'{"message": "error"}', url=url)
+
+    def request(self, method, url, headers=None, payload=None, timeout=None):
+        return self._respond(method, url, payload)
+
+
+class AsyncTriggerTransport(TriggerTransport):
+    """
+    Asynchronous variant of TriggerTransport.
+    """
+
+    async def request(self, method, url,  # pylint: disable=invalid-overridden-method
+                      headers=None, payload=None, timeout=None):
+        await asyncio.sleep(0)
+        return self._respond(method, url, payload)
+
+    async def close(self):  # pylint: disable=invalid-overridden-method
+        pass
+
+
+POLICY = RetryPolicy(max_retries=2, retry_delay=0.001)
+
+
+class TestMatching(unittest.TestCase):
+    """
+    Test cases for matching listed pipelines with a trigger
+    """
+
+    def test_parse_timestamp(self):
+        """
+        Test that API timestamps are parsed and garbage is ignored
+
+        Returns:
+            None
+        """
+        self.assertEqual(parse_timestamp("1970-01-01T00:01:00.000Z"), 60)
+        self.assertIsNone(parse_timestamp("yesterday"))
+        self.assertIsNone(parse_timestamp(None))
+
+    def test_matching(self):
+        """
+        Test that branch, tag, parameters and creation time are compared
+
+        Returns:
+            None
+        """
+        since = time.time() - 60
+        pipelines = [
+            pipeline("other-branch", branch="dev"),
+            pipeline("other-parameters", trigger_parameters={"deploy": False}),
+            pipeline("match", trigger_parameters={"deploy": True}),
+            pipeline("too-old", age=120),
+        ]
+        payload = {"branch": "main", "parameters": {"deploy": True}}
+
+        self.assertEqual(find_triggered_pipeline(pipelines, payload, since)["id"], "match")
+        self.assertIsNone(find_triggered_pipeline(pipelines, {"tag": "v1"}, since))
+        self.assertIsNone(find_triggered_pipeline(pipelines, {}, since))
+
+
+class TestReconcilingTrigger(unittest.TestCase):
+    """
+    Test cases for trigger_pipeline(reconcile=True)
+    """
+
+    def test_lost_trigger_not_resent(self):
+        """
+        Test that a timed-out trigger that created its pipeline is not sent again
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport(["lost"])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        result = client.trigger_pipeline("gh/org/repo", branch="main", reconcile=True)
+
+        self.assertEqual(result.id, "p1")
+        self.assertEqual(transport.triggers, 1)
+        self.assertEqual(len(transport.pipelines), 1)
+
+    def test_trigger_resent_when_not_created(self):
+        """
+        Test that a trigger is sent again when no matching pipeline exists
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport(["timeout", 502, 201],
+                                     pipelines=[pipeline("old", age=600),
+                                                pipeline("dev", branch="dev")])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        result = client.trigger_pipeline("gh/org/repo", branch="main", reconcile=True)
+
+        self.assertEqual(result.id, "p3")
+        self.assertEqual(transport.triggers, 3)
+        self.assertEqual(transport.listings, 2)
+
+    def test_earlier_pipelines_not_matched(self):
+        """
+        Test that a pipeline of the user created before the trigger is not taken for it
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport(["timeout", 201], pipelines=[pipeline("earlier", age=60)])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        result = client.trigger_pipeline("gh/org/repo", branch="main", reconcile=True)
+
+        self.assertEqual(result.id, "p2")
+        self.assertEqual(transport.triggers, 2)
+
+    def test_default_branch_matched(self):
+        """
+        Test that a trigger naming no branch only matches pipelines on the default branch
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport(["concurrent", "lost"])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        result = client.trigger_pipeline("gh/org/repo", reconcile=True)
+
+        self.assertEqual(result.id, "p2")
+        self.assertEqual(transport.triggers, 2)
+
+    def test_retries_exhausted(self):
+        """
+        Test that the last error is raised once the retries are exhausted
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport(["timeout", "timeout", "timeout"])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        with self.assertRaises(TimeoutError):
+            client.trigger_pipeline("gh/org/repo", branch="main", reconcile=True)
+        self.assertEqual(transport.triggers, 3)
+
+    def test_client_errors_not_retried(self):
+        """
+        Test that a rejected trigger is neither reconciled nor sent again
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport([400])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        with self.assertRaises(CircleCIError):
+            client.trigger_pipeline("gh/org/repo", branch="main", reconcile=True)
+        self.assertEqual((transport.triggers, transport.listings), (1, 0))
+
+    def test_settled_trigger_reads_nothing(self):
+        """
+        Test that a successful trigger is sent without reading the project or the pipelines
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport([201])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        result = client.trigger_pipeline("gh/org/repo", reconcile=True)
+
+        self.assertEqual(result.id, "p1")
+        self.assertEqual((transport.triggers, transport.projects, transport.listings), (1, 0, 0))
+
+    def test_not_reconciled_by_default(self):
+        """
+        Test that a failed trigger is not sent again by default
+
+        Returns:
+            None
+        """
+        transport = TriggerTransport(["timeout"])
+        client = CircleCI(token="dummy_token", transport=transport, retry_policy=POLICY)
+
+        with self.assertRaises(TimeoutError):
+            client.trigger_pipeline("gh/org/repo", branch="main")
+        self.assertEqual((transport.triggers, transport.listings), (1, 0))
+
+
+class TestAsyncReconcilingTrigger(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for AsyncCircleCI.trigger_pipeline(reconcile=True)
+    """
+
+    async def test_lost_trigger_not_resent(self):
+        """
+        Test that a timed-out trigger that created its pipeline is not sent again
+
+        Returns:
+            None
+        """
+        transport = AsyncTriggerTransport(["timeout", "lost"])
+        async with AsyncCircleCI(token="dummy_token", transport=transport,
+                                 retry_policy=POLICY) as client:
+            result = await client.trigger_pipeline("gh/org/repo", branch="main",
+                                                   reconcile=True)
+
+        self.assertEqual(result.id, "p2")
+        self.assertEqual(transport.triggers, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+""" Test cases for the retry policy """
+import unittest
+from unittest.mock import patch, Mock
+
+import requests
+
+from circleci_api_python import CircleCIError
+from circleci_api_python.client import CircleCI
+from circleci_api_python.retry import RetryPolicy, parse_retry_after
+
+
+def make_response(status_code: int, headers: dict or None = None) -> Mock:
+    """
+    Build a mocked response.
+
+    Args:
+        status_code (int): HTTP status code
+        headers (dict): response headers
+
+    Returns:
+        Mock: the mocked response
+    """
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"key": "value"}
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """
+    Test cases for the RetryPolicy class
+    """
+
+    def test_parse_retry_after_seconds(self):
+        """
+        Test parsing a Retry-After header given in seconds
+
+        Returns:
+            None
+        """
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_parse_retry_after_http_date(self):
+        """
+        Test parsing a Retry-After header given as an HTTP date in the past
+
+        Returns:
+            None
+        """
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_backoff_is_bounded(self):
+        """
+        Test that full jitter stays within the exponential bound and the maximum delay
+
+        Returns:
+            None
+        """
+        policy = RetryPolicy(retry_delay=1, max_delay=5)
+        for attempt in range(10):
+            self.assertLessEqual(policy.backoff(attempt), min(5, 2 ** attempt))
+
+    def test_non_idempotent_method_is_not_retried(self):
+        """
+        Test that POST requests are not retried by default
+
+        Returns:
+            None
+        """
+        policy = RetryPolicy()
+        self.assertIsNone(policy.next_delay("POST", 0, 0, response=make_response(503)))
+        self.assertIsNotNone(policy.next_delay("GET", 0, 0, response=make_response(503)))
+
+    def test_retry_after_is_honoured(self):
+        """
+        Test that the Retry-After header overrides the backoff
+
+        Returns:
+            None
+        """
+        policy = RetryPolicy()
+        response = make_response(429, {"Retry-After": "12"})
+        self.assertEqual(policy.next_delay("GET", 0, 0, response=response), 12)
+
+    def test_long_retry_after_clamped(self):
+        """
+        Test that a Retry-After longer than the maximum delay is shortened to it
+
+        Returns:
+            None
+        """
+        policy = RetryPolicy(max_delay=30)
+        response = make_response(429, {"Retry-After": "3600"})
+        self.assertEqual(policy.next_delay("GET", 0, 0, response=response), 30)
+
+    def test_long_retry_after_not_retried(self):
+        """
+        Test that a Retry-After longer than the maximum delay ends the retries when clamping is
+        turned off
+
+        Returns:
+            None
+        """
+        policy = RetryPolicy(max_delay=30, clamp_retry_after=False)
+        self.assertIsNone(policy.next_delay("GET", 0, 0,
+                                            response=make_response(429, {"Retry-After": "3600"})))
+        self.assertEqual(policy.next_delay("GET", 0, 0,
+                                           response=make_response(429, {"Retry-After": "12"})), 12)
+
+    def test_total_timeout_budget(self):
+        """
+        Test that retries stop once the total time budget would be exceeded
+
+        Returns:
+            None
+        """
+        policy = RetryPolicy(total_timeout=10)
+        response = make_response(429, {"Retry-After": "5"})
+        self.assertEqual(policy.next_delay("GET", 0, 4, response=response), 5)
+        self.assertIsNone(policy.next_delay("GET", 1, 6, response=response))
+
+    def test_endpoint_override(self):
+        """
+        Test that the longest matching endpoint prefix selects the override, and the policy
+        declared by the endpoint applies otherwise
+
+        Returns:
+            None
+        """
+        workflow_policy = RetryPolicy(max_retries=0)
+        approve_policy = RetryPolicy(max_retries=1)
+        policy = RetryPolicy(overrides={"/api/v2/workflow": workflow_policy,
+                                        "/api/v2/workflow/abc/approve": approve_policy})
+
+        self.assertIs(policy.for_endpoint("/api/v2/workflow/abc"), workflow_policy)
+        self.assertIs(policy.for_endpoint("/api/v2/workflow/abc/approve/1"), approve_policy)
+        self.assertIs(policy.for_endpoint("/api/v2/pipeline?page-token=x"), policy)
+        self.assertIs(policy.for_endpoint("/api/v2/pipeline", workflow_policy), workflow_policy)
+        self.assertIs(policy.for_endpoint("/api/v2/workflow/abc/approve/1", workflow_policy),
+                      approve_policy)
+
+
+class TestClientRetries(unittest.TestCase):
+    """
+    Test cases for retries performed by the CircleCI client
+    """
+
+    @patch('circleci_api_python.client.time.sleep')
+    @patch('requests.Session.get')
+    def test_get_retried_until_success(self, mock_get, mock_sleep):
+        """
+        Test that a GET request is retried after a 502 response
+
+        Args:
+            mock_get (Mock): Mock object for the requests.Session.get
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        mock_get.side_effect = [make_response(502), make_response(200)]
+
+        client = CircleCI(token="dummy_token")
+        response = client.get_pipeline_by_id("pipeline_id")
+
+        self.assertEqual(response.metadata.status_code, 200)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @patch('circleci_api_python.client.time.sleep')
+    @patch('requests.Session.get')
+    def test_get_gives_up_after_max_retries(self, mock_get, mock_sleep):
+        """
+        Test that a GET request fails once max_retries is exhausted
+
+        Args:
+            mock_get (Mock): Mock object for the requests.Session.get
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        mock_get.return_value = make_response(429, {"Retry-After": "1"})
+
+        client = CircleCI(token="dummy_token", max_retries=2)
+        with self.assertRaises(CircleCIError):
+            client.get_pipeline_by_id("pipeline_id")
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('circleci_api_python.client.time.sleep')
+    @patch('requests.Session.get')
+    def test_connection_error_retried(self, mock_get, mock_sleep):
+        """
+        Test that a connection error on a GET request is retried
+
+        Args:
+            mock_get (Mock): Mock object for the requests.Session.get
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        mock_get.side_effect = [requests.ConnectionError("reset"), make_response(200)]
+
+        client = CircleCI(token="dummy_token")
+        response = client.get_pipeline_by_id("pipeline_id")
+
+        self.assertEqual(response.metadata.status_code, 200)
+        mock_sleep.assert_called_once()
+
+    @patch('circleci_api_python.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_post_not_retried(self, mock_post, mock_sleep):
+        """
+        Test that a POST request is not retried by default
+
+        Args:
+            mock_post (Mock): Mock object for the requests.Session.post
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        mock_post.return_value = make_response(503)
+
+        client = CircleCI(token="dummy_token")
+        with self.assertRaises(CircleCIError):
+            client.rerun_workflow("workflow_id")
+
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('circleci_api_python.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_idempotent_post_retried(self, mock_post, mock_sleep):
+        """
+        Test that a POST endpoint declared idempotent is retried
+
+        Args:
+            mock_post (Mock): Mock object for the requests.Session.post
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        mock_post.side_effect = [make_response(503), make_response(202)]
+
+        client = CircleCI(token="dummy_token")
+        client.cancel_workflow("workflow_id")
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
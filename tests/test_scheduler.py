@@ -0,0 +1,197 @@
+""" Test cases for priority scheduling of requests """
+import asyncio
+import threading
+import time
+import unittest
+
+from fakes import AsyncFakeTransport, FakeTransport
+
+from circleci_api_python import (AsyncCircleCI, DeadlineExceededError, PriorityScheduler,
+                                 RateLimiter)
+from circleci_api_python.client import CircleCI
+from circleci_api_python.deadline import time_budget
+
+
+class TestPriorityScheduler(unittest.TestCase):
+    """
+    Test cases for the PriorityScheduler class
+    """
+
+    def test_reserved_capacity(self):
+        """
+        Test that lower classes cannot use the slots reserved for higher ones
+
+        Returns:
+            None
+        """
+        scheduler = PriorityScheduler(capacity=4, reserved={"high": 1, "normal": 1})
+
+        self.assertTrue(scheduler.acquire("low", timeout=0))
+        self.assertTrue(scheduler.acquire("low", timeout=0))
+        self.assertFalse(scheduler.acquire("low", timeout=0))
+        self.assertTrue(scheduler.acquire("normal", timeout=0))
+        self.assertFalse(scheduler.acquire("normal", timeout=0))
+        self.assertTrue(scheduler.acquire("high", timeout=0))
+        self.assertFalse(scheduler.acquire("high", timeout=0))
+        self.assertEqual(scheduler.in_flight, {"high": 1, "normal": 1, "low": 2})
+
+    def test_higher_class_served_first(self):
+        """
+        Test that a freed slot goes to the waiting request of the highest class
+
+        Returns:
+            None
+        """
+        scheduler = PriorityScheduler(capacity=1, reserved={})
+        scheduler.acquire("low")
+        served = []
+
+        def wait(priority):
+            scheduler.acquire(priority)
+            served.append(priority)
+            scheduler.release(priority)
+
+        waiting = [threading.Thread(target=wait, args=("low",))]
+        waiting[0].start()
+        time.sleep(0.05)
+        waiting.append(threading.Thread(target=wait, args=("high",)))
+        waiting[1].start()
+        time.sleep(0.05)
+
+        scheduler.release("low")
+        for thread in waiting:
+            thread.join()
+
+        self.assertEqual(served, ["high", "low"])
+
+    def test_invalid_configuration(self):
+        """
+        Test that unknown classes and exhausted capacity are rejected
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ValueError):
+            PriorityScheduler(reserved={"urgent": 1})
+        with self.assertRaises(ValueError):
+            PriorityScheduler(capacity=2, reserved={"high": 2})
+        with self.assertRaises(ValueError):
+            with CircleCI.priority("urgent"):
+                pass
+
+
+class TestClientScheduling(unittest.TestCase):
+    """
+    Test cases for priority scheduling performed by the CircleCI client
+    """
+
+    def test_interactive_call_skips_crawl(self):
+        """
+        Test that a high priority call is sent while a background crawl is queued
+
+        Returns:
+            None
+        """
+        transport = FakeTransport(delay=0.05)
+        client = CircleCI(token="dummy_token", transport=transport, coalesce_gets=False,
+                          scheduler=PriorityScheduler(capacity=3, reserved={"high": 1}))
+
+        def crawl(page):
+            with client.priority("low"):
+                client.get_all_pipelines_for_project("gh/org/repo", page_token=str(page))
+
+        crawlers = [threading.Thread(target=crawl, args=(page,)) for page in range(8)]
+        for thread in crawlers:
+            thread.start()
+        time.sleep(0.01)
+        started = time.monotonic()
+        with client.priority("high"):
+            client.cancel_workflow("abc")
+        elapsed = time.monotonic() - started
+        for thread in crawlers:
+            thread.join()
+
+        self.assertLess(elapsed, 0.09)
+        self.assertEqual(transport.priorities.count("low"), 8)
+        self.assertLess(transport.priorities.index("high"), 4)
+
+    def test_interactive_call_skips_rate_limited_crawl(self):
+        """
+        Test that a high priority call does not queue for tokens behind a background crawl
+
+        Returns:
+            None
+        """
+        transport = FakeTransport()
+        client = CircleCI(token="dummy_token", transport=transport, coalesce_gets=False,
+                          scheduler=PriorityScheduler(capacity=3, reserved={"high": 1}),
+                          rate_limiter=RateLimiter(rate=20.0, burst=1))
+
+        def crawl(page):
+            with client.priority("low"):
+                client.get_all_pipelines_for_project("gh/org/repo", page_token=str(page))
+
+        crawlers = [threading.Thread(target=crawl, args=(page,)) for page in range(8)]
+        for thread in crawlers:
+            thread.start()
+        time.sleep(0.01)
+        started = time.monotonic()
+        with client.priority("high"):
+            client.cancel_workflow("abc")
+        elapsed = time.monotonic() - started
+        for thread in crawlers:
+            thread.join()
+
+        self.assertLess(elapsed, 0.2)
+        self.assertLess(transport.priorities.index("high"), 4)
+
+    def test_wait_bounded_by_budget(self):
+        """
+        Test that waiting for a slot gives up when the time budget is spent
+
+        Returns:
+            None
+        """
+        scheduler = PriorityScheduler(capacity=1, reserved={})
+        scheduler.acquire("normal")
+        client = CircleCI(token="dummy_token", transport=FakeTransport(delay=0.05),
+                          scheduler=scheduler)
+
+        with time_budget(0.05):
+            with self.assertRaises(DeadlineExceededError):
+                client.get_pipeline_by_id("abc")
+
+
+class TestAsyncClientScheduling(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for priority scheduling performed by the AsyncCircleCI client
+    """
+
+    async def test_interactive_call_skips_crawl(self):
+        """
+        Test that a high priority task is sent before queued low priority tasks
+
+        Returns:
+            None
+        """
+        transport = AsyncFakeTransport(delay=0.05)
+        async with AsyncCircleCI(token="dummy_token", transport=transport,
+                                 scheduler=PriorityScheduler(capacity=2,
+                                                             reserved={"high": 1})) as client:
+            async def crawl(page):
+                with client.priority("low"):
+                    await client.get_all_pipelines_for_project("gh/org/repo",
+                                                               page_token=str(page))
+
+            async def interactive():
+                await asyncio.sleep(0.01)
+                with client.priority("high"):
+                    await client.cancel_workflow("abc")
+
+            await asyncio.gather(*(crawl(page) for page in range(4)), interactive())
+
+        self.assertEqual(transport.priorities.index("high"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,278 @@
+""" Test cases for the coalescing of identical in-flight requests """
+import asyncio
+import threading
+import time
+import unittest
+
+from fakes import FakeTransport
+
+from circleci_api_python import AsyncCircleCI
+from circleci_api_python.client import CircleCI
+from circleci_api_python.deadline import time_budget
+from circleci_api_python.exceptions import CircleCIError
+from circleci_api_python.singleflight import AsyncSingleFlight, SingleFlight
+from circleci_api_python.transport import InMemoryResponse, Transport
+
+
+class SlowTransport(Transport):
+    """
+    Transport answering every request after a delay, counting the requests sent.
+    """
+
+    def __init__(self, status_code: int = 200, delay: float = 0.1):
+        super().__init__()
+        self.status_code = status_code
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers=None, payload=None, timeout=None):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return InMemoryResponse(self.status_code, b'{"id": "abc"}', url=url)
+
+
+class AsyncSlowTransport(SlowTransport):
+    """
+    Asynchronous variant of SlowTransport.
+    """
+
+    async def request(self, method, url,  # pylint: disable=invalid-overridden-method
+                      headers=None, payload=None, timeout=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return InMemoryResponse(self.status_code, b'{"id": "abc"}', url=url)
+
+    async def close(self):  # pylint: disable=invalid-overridden-method
+        pass
+
+
+def run_concurrently(func, count: int) -> list:
+    """
+    Call a function from several threads at once.
+
+    Args:
+        func (Callable): function to call
+        count (int): number of threads
+
+    Returns:
+        list: the results or raised exceptions of the calls
+    """
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def call(index):
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as error:
+            results[index] = error
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Test cases for the SingleFlight class
+    """
+
+    def test_sequential_calls_not_shared(self):
+        """
+        Test that calls which do not overlap each run
+
+        Returns:
+            None
+        """
+        flight = SingleFlight()
+
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+        self.assertEqual(flight.do("key", lambda: 2), 2)
+        self.assertEqual(flight.shared, 0)
+
+    def test_concurrent_calls_shared(self):
+        """
+        Test that overlapping calls of one key run once
+
+        Returns:
+            None
+        """
+        flight = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        results = run_concurrently(lambda: flight.do("key", work), 5)
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.shared, 4)
+
+
+class TestClientSingleFlight(unittest.TestCase):
+    """
+    Test cases for GET coalescing performed by the CircleCI client
+    """
+
+    def test_identical_gets_coalesced(self):
+        """
+        Test that concurrent identical GETs send one request
+
+        Returns:
+            None
+        """
+        transport = SlowTransport()
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        results = run_concurrently(lambda: client.get_pipeline_by_id("abc"), 8)
+
+        self.assertEqual(transport.calls, 1)
+        self.assertEqual([result.id for result in results], ["abc"] * 8)
+        self.assertEqual(len({id(result) for result in results}), 8)
+
+    def test_errors_shared(self):
+        """
+        Test that every coalesced caller receives the error
+
+        Returns:
+            None
+        """
+        transport = SlowTransport(status_code=404)
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        results = run_concurrently(lambda: client.get_project("gh/org/repo"), 4)
+
+        self.assertEqual(transport.calls, 1)
+        for result in results:
+            self.assertIsInstance(result, CircleCIError)
+            self.assertEqual(result.status_code, 404)
+
+    def test_budget_not_shared(self):
+        """
+        Test that a call without a time budget does not join a call under one
+
+        Returns:
+            None
+        """
+        transport = FakeTransport(delay=0.1, latency=0.1)
+        client = CircleCI(token="dummy_token", transport=transport)
+        results = []
+
+        def budgeted():
+            with time_budget(0.05):
+                try:
+                    client.get_pipeline_by_id("abc")
+                except Exception as error:
+                    results.append(error)
+
+        leader = threading.Thread(target=budgeted)
+        leader.start()
+        time.sleep(0.01)
+        response = client.get_pipeline_by_id("abc")
+        leader.join()
+
+        self.assertEqual(response.id, "abc")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(transport.calls, 2)
+
+    def test_priorities_not_shared(self):
+        """
+        Test that identical GETs of different priorities are sent separately
+
+        Returns:
+            None
+        """
+        transport = SlowTransport(delay=0.05)
+        client = CircleCI(token="dummy_token", transport=transport)
+        priorities = iter(["high", "low"])
+
+        def call():
+            with client.priority(next(priorities)):
+                return client.get_pipeline_by_id("abc")
+
+        run_concurrently(call, 2)
+
+        self.assertEqual(transport.calls, 2)
+
+    def test_coalescing_disabled(self):
+        """
+        Test that coalesce_gets=False sends every request
+
+        Returns:
+            None
+        """
+        transport = SlowTransport(delay=0.05)
+        client = CircleCI(token="dummy_token", transport=transport, coalesce_gets=False)
+
+        run_concurrently(lambda: client.get_pipeline_by_id("abc"), 3)
+
+        self.assertEqual(transport.calls, 3)
+
+    def test_posts_not_coalesced(self):
+        """
+        Test that concurrent POSTs are each sent
+
+        Returns:
+            None
+        """
+        transport = SlowTransport(delay=0.05)
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        run_concurrently(lambda: client.cancel_workflow("abc"), 3)
+
+        self.assertEqual(transport.calls, 3)
+
+
+class TestAsyncClientSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for GET coalescing performed by the AsyncCircleCI client
+    """
+
+    async def test_identical_gets_coalesced(self):
+        """
+        Test that concurrent identical GETs send one request
+
+        Returns:
+            None
+        """
+        transport = AsyncSlowTransport()
+        async with AsyncCircleCI(token="dummy_token", transport=transport) as client:
+            results = await asyncio.gather(*(client.get_workflow_by_id("abc")
+                                             for _ in range(5)))
+
+        self.assertEqual(transport.calls, 1)
+        self.assertEqual([result.id for result in results], ["abc"] * 5)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """
+        Test that cancelling the first caller leaves the shared request running
+
+        Returns:
+            None
+        """
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, "result")
+        self.assertEqual(flight.shared, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,260 @@
+""" Test cases for streamed list responses """
+import json
+import unittest
+from unittest.mock import patch, Mock
+
+from circleci_api_python import (AdaptiveConcurrencyLimiter, AsyncCircleCI, CircleCIError,
+                                 DeadlineExceededError, PriorityScheduler, RetryPolicy,
+                                 time_budget)
+from circleci_api_python.client import CircleCI
+from circleci_api_python.streaming import ItemParser
+from circleci_api_python.transport import (AsyncInMemoryTransport, InMemoryTransport,
+                                           RequestsTransport)
+
+PROJECTS = [{"reponame": f"repo-{index}", "vcs_url": "https://github.com/org/é"}
+            for index in range(50)]
+TESTS = "/api/v2/project/gh/org/repo/7/tests"
+
+
+def parse(body: bytes, size: int, parser: ItemParser or None = None) -> list:
+    """
+    Parse a body fed in chunks of a given size.
+
+    Args:
+        body (bytes): the response body
+        size (int): the chunk size
+        parser (ItemParser): the parser to use
+
+    Returns:
+        list: the parsed items
+    """
+    parser = parser or ItemParser()
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start:start + size]))
+    return items + parser.close()
+
+
+class TestItemParser(unittest.TestCase):
+    """
+    Test cases for the ItemParser class
+    """
+
+    def test_list_parsed_in_any_chunks(self):
+        """
+        Test that list items are parsed whatever the chunk boundaries, split characters included
+
+        Returns:
+            None
+        """
+        body = json.dumps(PROJECTS, ensure_ascii=False).encode()
+        for size in (1, 7, 64, len(body)):
+            self.assertEqual(parse(body, size), PROJECTS)
+        self.assertEqual(parse(b" [1, 23 ,456, -7.5e1] ", 1), [1, 23, 456, -75.0])
+        self.assertEqual(parse(b"[]", 1), [])
+
+    def test_object_items_and_fields(self):
+        """
+        Test that the items member is streamed and the other members collected
+
+        Returns:
+            None
+        """
+        body = json.dumps({"total": 2, "items": [{"a": [1, {"b": 2}]}, "x"],
+                           "next_page_token": "token"}).encode()
+        parser = ItemParser()
+
+        self.assertEqual(parse(body, 3, parser), [{"a": [1, {"b": 2}]}, "x"])
+        self.assertEqual(parser.fields, {"total": 2, "next_page_token": "token"})
+        self.assertEqual(parse(b'{"items": [], "other": {}}', 2), [])
+
+    def test_items_returned_early(self):
+        """
+        Test that complete items are returned before the rest of the body is received
+
+        Returns:
+            None
+        """
+        parser = ItemParser()
+
+        self.assertEqual(parser.feed(b'{"items": [{"id": 1}, {"id": 2}, {"id"'), [{"id": 1},
+                                                                                 {"id": 2}])
+        self.assertEqual(parser.feed(b': 3}]}') + parser.close(), [{"id": 3}])
+
+    def test_invalid_bodies_rejected(self):
+        """
+        Test that truncated and malformed bodies raise a decoding error
+
+        Returns:
+            None
+        """
+        for body in (b'[{"id": 1}, {"id"', b'"text"', b'[1 2]', b'{"items": [1]} []',
+                     b'[1,]', b'{"items" [1]}'):
+            with self.assertRaises(json.JSONDecodeError, msg=body):
+                parse(body, 4)
+
+
+class TestClientStreaming(unittest.TestCase):
+    """
+    Test cases for the streaming mode of the CircleCI client
+    """
+
+    def test_projects_streamed(self):
+        """
+        Test that projects are yielded one at a time with the response metadata
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v1.1/projects", PROJECTS)
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        projects = client.get_user_projects(stream=True)
+
+        self.assertEqual(transport.calls, 0)
+        projects = list(projects)
+        self.assertEqual([project.reponame for project in projects],
+                         [project["reponame"] for project in PROJECTS])
+        self.assertEqual(projects[0].metadata.status_code, 200)
+        self.assertEqual(projects[0].raw_data["reponame"], "repo-0")
+
+    def test_job_metadata_streamed(self):
+        """
+        Test that the test results of a job are streamed from the items member
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", TESTS, {"items": [{"name": "a"}, {"name": "b"}],
+                                              "next_page_token": None})
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        names = [test.name for test in client.get_job_metadata("gh/org/repo", 7, stream=True)]
+
+        self.assertEqual(names, ["a", "b"])
+
+    def test_error_status_raised(self):
+        """
+        Test that an unsuccessful streamed response raises a CircleCIError
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        with self.assertRaises(CircleCIError) as context:
+            list(client.get_job_metadata("gh/org/repo", 7, stream=True))
+        self.assertEqual(context.exception.status_code, 404)
+
+    @patch('circleci_api_python.client.time.sleep')
+    def test_stream_retried_before_response(self, mock_sleep):
+        """
+        Test that a retryable status is retried before the body is streamed
+
+        Args:
+            mock_sleep (Mock): Mock object for the time.sleep
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v1.1/projects", status_code=503)
+        client = CircleCI(token="dummy_token", transport=transport,
+                          retry_policy=RetryPolicy(max_retries=1))
+
+        with self.assertRaises(CircleCIError):
+            list(client.get_user_projects(stream=True))
+
+        self.assertEqual(transport.calls, 2)
+        mock_sleep.assert_called_once()
+
+    def test_stream_scheduled_and_limited(self):
+        """
+        Test that streamed requests wait for the scheduler and the concurrency limiter
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v1.1/projects", PROJECTS)
+        scheduler = PriorityScheduler(capacity=1, reserved={})
+        limiter = AdaptiveConcurrencyLimiter()
+        client = CircleCI(token="dummy_token", transport=transport, scheduler=scheduler,
+                          concurrency_limiter=limiter)
+
+        with patch.object(limiter, 'release', wraps=limiter.release) as release:
+            self.assertEqual(len(list(client.get_user_projects(stream=True))), 50)
+        release.assert_called_once()
+
+        self.assertTrue(scheduler.acquire("normal"))
+        with self.assertRaises(DeadlineExceededError), time_budget(0.05):
+            list(client.get_user_projects(stream=True))
+        self.assertEqual(transport.calls, 1)
+
+    def test_stream_only_declared_on_streamable_endpoints(self):
+        """
+        Test that declaring `stream` on an endpoint that cannot stream fails at definition
+
+        Returns:
+            None
+        """
+        def get_context(self, context_id, *, stream=False):  # pylint: disable=unused-argument
+            """ Get a context. """
+
+        with self.assertRaises(TypeError):
+            CircleCI.api_endpoint(get_context)
+
+    @patch('requests.Session.get')
+    def test_requests_transport_streams_body(self, mock_get):
+        """
+        Test that the requests transport reads the body in chunks and closes the response
+
+        Args:
+            mock_get (Mock): Mock object for the requests.Session.get
+
+        Returns:
+            None
+        """
+        response = Mock(status_code=200, headers={}, url="https://circleci.com/api/v1.1/projects")
+        response.iter_content.return_value = iter([b'[{"reponame": "a"}, {"repo',
+                                                   b'name": "b"}]'])
+        response.raw.tell.return_value = 20
+        mock_get.return_value = response
+        transport = RequestsTransport()
+        client = CircleCI(token="dummy_token", transport=transport)
+
+        names = [project.reponame for project in client.get_user_projects(stream=True)]
+
+        self.assertEqual(names, ["a", "b"])
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        response.close.assert_called_once()
+        self.assertEqual((transport.stats.responses, transport.stats.wire_bytes,
+                          transport.stats.decoded_bytes), (1, 20, 38))
+
+
+class TestAsyncClientStreaming(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the streaming mode of the AsyncCircleCI client
+    """
+
+    async def test_projects_streamed(self):
+        """
+        Test that projects are yielded by an async iterator
+
+        Returns:
+            None
+        """
+        transport = AsyncInMemoryTransport()
+        transport.add_response("GET", "/api/v1.1/projects", PROJECTS)
+        async with AsyncCircleCI(token="dummy_token", transport=transport) as client:
+            names = [project.reponame
+                     async for project in client.get_user_projects(stream=True)]
+
+        self.assertEqual(names, [project["reponame"] for project in PROJECTS])
+
+
+if __name__ == '__main__':
+    unittest.main()
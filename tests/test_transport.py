@@ -0,0 +1,336 @@
+""" Test cases for the client transports """
+import gzip
+import io
+import json
+import threading
+import unittest
+from unittest.mock import patch, AsyncMock, Mock
+
+import httpx
+import requests
+from urllib3 import HTTPResponse
+
+from circleci_api_python import AsyncCircleCI, CircleCIError
+from circleci_api_python.client import CircleCI
+from circleci_api_python.codec import JSONCodec
+from circleci_api_python.transport import (STREAM_CHUNK_SIZE, AsyncInMemoryTransport,
+                                           HttpxTransport, InMemoryTransport, RequestsTransport,
+                                           Transport)
+
+
+class TestTransport(unittest.TestCase):
+    """
+    Test cases for the Transport base class
+    """
+
+    def test_request_required(self):
+        """
+        Test that a transport without a request method cannot be created
+
+        Returns:
+            None
+        """
+        class IncompleteTransport(Transport):  # pylint: disable=abstract-method
+            """ Transport missing its request method. """
+
+        with self.assertRaises(TypeError):
+            IncompleteTransport()  # pylint: disable=abstract-class-instantiated
+
+
+class TestInMemoryTransport(unittest.TestCase):
+    """
+    Test cases for the InMemoryTransport class
+    """
+
+    def test_canned_response_served(self):
+        """
+        Test that a registered response is converted by the client
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v2/pipeline/abc", {"id": "abc", "number": 3})
+
+        client = CircleCI(token="dummy_token", transport=transport)
+        response = client.get_pipeline_by_id("abc")
+
+        self.assertEqual(response.number, 3)
+        self.assertEqual(response.metadata.url, "https://circleci.com/api/v2/pipeline/abc")
+        self.assertEqual(transport.calls, 1)
+
+    def test_list_response_served(self):
+        """
+        Test that a registered list response is wrapped by the client
+
+        Returns:
+            None
+        """
+        transport = InMemoryTransport()
+        transport.add_response("GET", "/api/v1.1/projects", [{"reponame": "repo"}])
+
+        client = CircleCI(token="dummy_token", transport=transport)
+        response = client.get_user_projects()
+
+        self.assertEqual(response.response[0].reponame, "repo")
+
+    def test_unknown_route_not_found(self):
+        """
+        Test that an unregistered route returns a 404
+
+        Returns:
+            None
+        """
+        client = CircleCI(token="dummy_token", transport=InMemoryTransport())
+
+        with self.assertRaises(CircleCIError) as context:
+            client.get_project("gh/org/repo")
+        self.assertEqual(context.exception.status_code, 404)
+
+    def test_close_delegated_to_transport(self):
+        """
+        Test that closing the client closes its transport
+
+        Returns:
+            None
+        """
+        transport = Mock()
+        with CircleCI(token="dummy_token", transport=transport):
+            pass
+
+        transport.close.assert_called_once()
+
+
+class TestRequestsTransport(unittest.TestCase):
+    """
+    Test cases for the RequestsTransport class
+    """
+
+    @patch('requests.Session.post')
+    def test_payload_sent_as_json(self, mock_post):
+        """
+        Test that payloads are encoded by the codec of the transport and sent through the session
+
+        Args:
+            mock_post (Mock): Mock object for the requests.Session.post
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport()
+        transport.codec = JSONCodec()
+        transport.request("POST", "https://circleci.com/api/v2/context",
+                          headers={"Circle-Token": "dummy_token"},
+                          payload={"name": "ctx"},
+                          timeout=(1, 2))
+
+        mock_post.assert_called_once_with("https://circleci.com/api/v2/context",
+                                          headers={"Circle-Token": "dummy_token",
+                                                   "Content-Type": "application/json"},
+                                          data=b'{"name":"ctx"}',
+                                          timeout=(1, 2))
+
+    def test_compression_advertised(self):
+        """
+        Test that the session advertises the encodings urllib3 can decode
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport()
+
+        self.assertIn('gzip', transport.session.headers['Accept-Encoding'])
+
+    @patch('requests.Session.get')
+    def test_compressed_bytes_counted(self, mock_get):
+        """
+        Test that wire and decoded body sizes are recorded for a gzip response
+
+        Args:
+            mock_get (Mock): Mock object for the requests.Session.get
+
+        Returns:
+            None
+        """
+        body = json.dumps({"items": [{"name": "project"}] * 200}).encode()
+        compressed = gzip.compress(body)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = "https://circleci.com/api/v1.1/projects"
+        response.raw = HTTPResponse(body=io.BytesIO(compressed),
+                                    headers={'Content-Encoding': 'gzip'},
+                                    preload_content=False,
+                                    decode_content=True)
+        mock_get.return_value = response
+
+        client = CircleCI(token="dummy_token")
+        result = client.get_user_projects()
+
+        self.assertEqual(len(result.items), 200)
+        self.assertEqual(result.metadata.wire_bytes, len(compressed))
+        self.assertEqual(result.metadata.decoded_bytes, len(body))
+        self.assertEqual(client.transport.stats.saved_bytes, len(body) - len(compressed))
+
+
+    @patch('requests.Session.close')
+    def test_per_thread_sessions(self, mock_close):
+        """
+        Test that every thread gets and keeps its own session, all closed together
+
+        Args:
+            mock_close (Mock): Mock object for the requests.Session.close
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport(per_thread_sessions=True)
+        sessions = []
+
+        def use_session():
+            sessions.append(transport.session)
+            sessions.append(transport.session)
+
+        threads = [threading.Thread(target=use_session) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        transport.close()
+
+        self.assertEqual(len(sessions), 6)
+        self.assertEqual(len({id(session) for session in sessions}), 3)
+        self.assertEqual(mock_close.call_count, 3)
+
+    def test_shared_session_by_default(self):
+        """
+        Test that all threads share one session by default
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport()
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(transport.session))
+        thread.start()
+        thread.join()
+
+        self.assertIs(sessions[0], transport.session)
+
+
+class TestHttpxTransport(unittest.TestCase):
+    """
+    Test cases for the HttpxTransport class
+    """
+
+    def test_http2_option_selects_httpx_transport(self):
+        """
+        Test that the http2 flag makes the client use an HTTP/2 capable transport
+
+        Returns:
+            None
+        """
+        client = CircleCI(token="dummy_token", http2=True)
+
+        self.assertIsInstance(client.transport, HttpxTransport)
+        client.close()
+
+    def test_requests_run_by_one_thread(self):
+        """
+        Test that the requests of concurrent threads are all sent from the thread of the
+        transport, which alone touches the HTTP/2 connection state
+
+        Returns:
+            None
+        """
+        senders = set()
+
+        def handler(request):
+            senders.add(threading.current_thread().name)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        transport = HttpxTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        callers = [threading.Thread(target=transport.request,
+                                    args=("GET", f"https://circleci.com/api/v2/job/{number}"))
+                   for number in range(8)]
+        for thread in callers:
+            thread.start()
+        for thread in callers:
+            thread.join()
+        response = transport.request("GET", "https://circleci.com/api/v2/me")
+        transport.close()
+
+        self.assertEqual(response.json(), {"path": "/api/v2/me"})
+        self.assertEqual(senders, {"circleci-httpx"})
+        self.assertEqual(transport.stats.responses, 9)
+
+    def test_streamed_body(self):
+        """
+        Test that a streamed body is read through the thread of the transport, and that the
+        transport can be closed twice
+
+        Returns:
+            None
+        """
+        body = b"x" * (STREAM_CHUNK_SIZE + 1)
+        transport = HttpxTransport(client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))))
+
+        with transport.stream("GET", "https://circleci.com/api/v2/me") as response:
+            chunks = list(response.chunks)
+        transport.close()
+        transport.close()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(chunks), body)
+        self.assertEqual(len(chunks), 2)
+
+    @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+    def test_timeout_converted(self, mock_request):
+        """
+        Test that the (connect, read) timeout tuple is passed on to httpx
+
+        Args:
+            mock_request (AsyncMock): Mock object for the httpx.AsyncClient.request
+
+        Returns:
+            None
+        """
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.url = "https://circleci.com/api/v2/workflow/abc/job"
+        mock_response.json.return_value = {"items": []}
+        mock_request.return_value = mock_response
+
+        client = CircleCI(token="dummy_token", timeout=(2, 9), http2=True)
+        response = client.get_workflow_jobs("abc")
+
+        self.assertEqual(response.items, [])
+        timeout = mock_request.call_args.kwargs["timeout"]
+        self.assertEqual((timeout.connect, timeout.read), (2, 9))
+        client.close()
+
+
+class TestAsyncInMemoryTransport(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the AsyncInMemoryTransport class
+    """
+
+    async def test_canned_response_served(self):
+        """
+        Test that a registered response is converted by the async client
+
+        Returns:
+            None
+        """
+        transport = AsyncInMemoryTransport()
+        transport.add_response("GET", "/api/v2/me", {"login": "user"})
+
+        async with AsyncCircleCI(token="dummy_token", transport=transport) as client:
+            response = await client.get_current_user_information()
+
+        self.assertEqual(response.login, "user")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,309 @@
+""" Test cases for connection pre-warming """
+import asyncio
+import socket
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from circleci_api_python import AsyncCircleCI
+from circleci_api_python.client import CircleCI
+from circleci_api_python.transport import (HttpxAsyncTransport, HttpxTransport,
+                                           RequestsTransport)
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive handler counting the connections accepted by the server.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """ Answer with an empty JSON object. """
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """ Answer without a body after a short delay. """
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class CountingServer(ThreadingHTTPServer):
+    """
+    Local HTTP server counting accepted connections.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), CountingHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        """ The base URL of the server. """
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def wait_for_connections(self, count: int, timeout: float = 2.0) -> int:
+        """
+        Wait until the server accepted a number of connections.
+
+        Args:
+            count (int): expected number of connections
+            timeout (float): maximum number of seconds to wait
+
+        Returns:
+            int: the number of connections accepted
+        """
+        deadline = time.monotonic() + timeout
+        while self.connections < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.connections
+
+
+def unused_port_url() -> str:
+    """
+    Find a local URL nothing listens on.
+
+    Returns:
+        str: the URL
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+class WarmupTestCase(unittest.TestCase):
+    """
+    Base test case running a local server.
+    """
+
+    def setUp(self):
+        """
+        Start the local server
+
+        Returns:
+            None
+        """
+        self.server = CountingServer()
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+
+class TestRequestsTransportWarmup(WarmupTestCase):
+    """
+    Test cases for RequestsTransport.warmup
+    """
+
+    def test_warm_connections_reused(self):
+        """
+        Test that pre-connected connections are used by later requests
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport()
+
+        opened = transport.warmup(self.server.url, 3)
+        self.assertEqual(opened, 3)
+        self.assertEqual(self.server.wait_for_connections(3), 3)
+
+        for _ in range(3):
+            transport.request("GET", self.server.url + "/api/v2/me")
+        transport.close()
+
+        self.assertEqual(self.server.connections, 3)
+
+    def test_capped_at_pool_size(self):
+        """
+        Test that no more connections are opened than the pool keeps
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport(pool_maxsize=2)
+
+        self.assertEqual(transport.warmup(self.server.url, 5), 2)
+        transport.close()
+
+        self.assertEqual(self.server.connections, 2)
+
+    def test_per_thread_sessions_not_warmed(self):
+        """
+        Test that nothing is opened for per-thread sessions, which only the warming thread
+        would use
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport(per_thread_sessions=True)
+
+        self.assertEqual(transport.warmup(self.server.url, 2), 0)
+        self.assertEqual(self.server.connections, 0)
+
+    def test_unreachable_host(self):
+        """
+        Test that failed connections are reported and not raised
+
+        Returns:
+            None
+        """
+        transport = RequestsTransport()
+
+        self.assertEqual(transport.warmup(unused_port_url(), 2), 0)
+
+
+class TestHttpxTransportWarmup(WarmupTestCase):
+    """
+    Test cases for HttpxTransport.warmup and HttpxAsyncTransport.warmup
+    """
+
+    def test_capped_at_pool_size(self):
+        """
+        Test that no more connections are opened than the pool keeps
+
+        Returns:
+            None
+        """
+        transport = HttpxTransport(pool_maxsize=2, http2=False)
+
+        self.assertEqual(transport.warmup(self.server.url, 5), 2)
+        transport.close()
+
+        self.assertEqual(self.server.connections, 2)
+
+    @patch('circleci_api_python.transport.WARMUP_TIMEOUT', 0.01)
+    def test_slow_host_not_waited_for(self):
+        """
+        Test that warmup requests give up after the warmup timeout
+
+        Returns:
+            None
+        """
+        transport = HttpxTransport(http2=False)
+
+        self.assertEqual(transport.warmup(self.server.url, 2), 0)
+        transport.close()
+
+    def test_unreachable_host(self):
+        """
+        Test that failed connections are reported and not raised
+
+        Returns:
+            None
+        """
+        transport = HttpxTransport(http2=False)
+
+        self.assertEqual(transport.warmup(unused_port_url(), 2), 0)
+        transport.close()
+
+    def test_async_capped_at_pool_size(self):
+        """
+        Test that the async transport opens no more connections than the pool keeps
+
+        Returns:
+            None
+        """
+        async def main():
+            transport = HttpxAsyncTransport(pool_maxsize=2)
+            opened = await transport.warmup(self.server.url, 5)
+            await transport.close()
+            return opened
+
+        self.assertEqual(asyncio.run(main()), 2)
+        self.assertEqual(self.server.connections, 2)
+
+    @patch('circleci_api_python.transport.WARMUP_TIMEOUT', 0.01)
+    def test_async_slow_host_not_waited_for(self):
+        """
+        Test that the warmup requests of the async transport give up after the warmup timeout
+
+        Returns:
+            None
+        """
+        async def main():
+            transport = HttpxAsyncTransport()
+            opened = await transport.warmup(self.server.url, 2)
+            await transport.close()
+            return opened
+
+        self.assertEqual(asyncio.run(main()), 0)
+
+
+class TestClientWarmup(WarmupTestCase):
+    """
+    Test cases for the warmup option of the clients
+    """
+
+    def test_first_request_on_warm_connection(self):
+        """
+        Test that the first request does not open a new connection
+
+        Returns:
+            None
+        """
+        client_class = type("LocalCircleCI", (CircleCI,), {"BASE_URL": self.server.url})
+        client = client_class(token="dummy_token", warmup=2)
+
+        self.assertTrue(client.wait_for_warmup(5))
+        self.assertEqual(self.server.wait_for_connections(2), 2)
+        client.get_pipeline_by_id("abc")
+        client.close()
+
+        self.assertEqual(self.server.connections, 2)
+
+    def test_no_warmup_by_default(self):
+        """
+        Test that no connection is opened at construction by default
+
+        Returns:
+            None
+        """
+        client_class = type("LocalCircleCI", (CircleCI,), {"BASE_URL": self.server.url})
+        client = client_class(token="dummy_token")
+
+        self.assertTrue(client.wait_for_warmup(0))
+        self.assertEqual(self.server.connections, 0)
+
+    def test_async_warmup(self):
+        """
+        Test that the async client warms up its pool in a background task
+
+        Returns:
+            None
+        """
+        client_class = type("LocalAsyncCircleCI", (AsyncCircleCI,),
+                            {"BASE_URL": self.server.url})
+
+        async def main():
+            transport = HttpxAsyncTransport()
+            async with client_class(token="dummy_token", transport=transport,
+                                    warmup=2) as client:
+                self.assertTrue(await client.wait_for_warmup(5))
+
+        asyncio.run(main())
+        self.assertEqual(self.server.wait_for_connections(2), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()